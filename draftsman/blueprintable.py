@@ -7,6 +7,7 @@ Alias module. Imports :py:class:`.Blueprint`, :py:class:`.BlueprintBook`,
 """
 
 from draftsman.error import IncorrectBlueprintTypeError
+from draftsman import data, validators
 from draftsman.utils import reissue_warnings, string_to_JSON, decode_version
 
 from draftsman.classes.blueprintable import Blueprintable
@@ -17,6 +18,12 @@ from draftsman.classes.blueprint_book import BlueprintBook
 from draftsman.classes.group import Group
 from draftsman.signatures import IDParameter, NumberParameter
 
+from collections import OrderedDict
+import copy
+import hashlib
+import threading
+from typing import NamedTuple, Optional
+import warnings
 
 __all__ = [
     "Blueprint",
@@ -28,9 +35,206 @@ __all__ = [
     "NumberParameter",
     "get_blueprintable_from_string",
     "get_blueprintable_from_JSON",
+    "StringCache",
+    "enable_string_cache",
+    "disable_string_cache",
+    "get_string_cache",
 ]
 
 
+class StringCacheInfo(NamedTuple):
+    """
+    Statistics of a :py:class:`.StringCache`, as returned by
+    :py:meth:`.StringCache.info`.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class StringCache:
+    """
+    A bounded LRU cache which maps blueprint strings to the Blueprintable
+    objects they decode to. Entries are keyed by a hash of the input string, so
+    the (potentially very large) strings themselves are not retained.
+
+    The first time a string is loaded, the resulting object is kept as a
+    pristine template; subsequent loads of the same string skip decoding and
+    structuring entirely and instead return a deep copy of that template, which
+    is several times faster. Any warnings issued while structuring the original
+    are re-issued each time the string is loaded.
+
+    Because the result of loading a string depends on the current validation
+    mode and data profile, templates are stored separately for each mode and
+    profile. Templates are not updated if the environment changes however, so
+    :py:meth:`clear` should be called after modifying Draftsman's data (for
+    example, with :py:func:`draftsman.data.entities.add_entity`).
+
+    Usually used indirectly via :py:func:`enable_string_cache`, which makes
+    :py:func:`get_blueprintable_from_string` and
+    :py:meth:`.Blueprintable.from_string` use a global instance.
+
+    .. WARNING::
+
+        The entries and statistics of a cache can safely be shared between
+        threads, and every call to :py:meth:`load` returns its own object.
+        However, the warnings of each load are collected with
+        :py:class:`warnings.catch_warnings`, which (like everywhere else in
+        Draftsman) modifies the process-wide warning state and is not
+        thread-safe. Loading strings from several threads at once can lose
+        warnings or issue them to the wrong caller, and a template structured
+        while another thread issues warnings can keep them, re-issuing them on
+        every later load of that string. If the warnings of each string matter,
+        only load strings from a single thread.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        :param maxsize: The maximum number of templates to keep. When full, the
+            least recently used entry is evicted.
+        """
+        if maxsize < 1:
+            raise ValueError("'maxsize' must be a positive integer")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[Blueprintable, list]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @reissue_warnings
+    def load(
+        self,
+        string: str,
+        blueprintable_type: Optional[type[Blueprintable]] = None,
+    ) -> Blueprintable:
+        """
+        Creates a new Blueprintable from a blueprint string, reusing the cached
+        template of this string if it has been loaded before.
+
+        :param string: The Factorio blueprint string to load.
+        :param blueprintable_type: The type of Blueprintable to create, which
+            must match the type of the string. If omitted, the type is deduced
+            from the string in the same manner as
+            :py:func:`get_blueprintable_from_string`.
+
+        :returns: A new Blueprintable object, which is never shared with any
+            other caller.
+
+        :exception MalformedBlueprintStringError: If the input string is not
+            decodable to a JSON object. Failures are never cached.
+        :exception IncorrectBlueprintTypeError: If the input string is of a
+            different type than ``blueprintable_type``.
+        """
+        key = (
+            hashlib.blake2b(string.encode("utf-8"), digest_size=20).digest(),
+            blueprintable_type,
+            validators.get_mode().value,
+            data.get_profile(),
+        )
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if entry is None:
+            # Structure outside the lock so other threads are not blocked
+            with warnings.catch_warnings(record=True) as warning_list:
+                if blueprintable_type is None:
+                    template = get_blueprintable_from_JSON(string_to_JSON(string))
+                else:
+                    template = blueprintable_type.from_JSON(string_to_JSON(string))
+            entry = (
+                template,
+                [(warning.message, warning.category) for warning in warning_list],
+            )
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+
+        template, warning_list = entry
+        for message, category in warning_list:
+            warnings.warn(message, category, stacklevel=2)
+
+        return copy.deepcopy(template)
+
+    def info(self) -> StringCacheInfo:
+        """
+        Gets the current hit, miss, and eviction counts of this cache, as well
+        as its current and maximum size.
+        """
+        with self._lock:
+            return StringCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache and resets its statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_string_cache: Optional[StringCache] = None
+
+
+def enable_string_cache(maxsize: int = 128) -> StringCache:
+    """
+    Enables caching loaded blueprint strings for all subsequent calls to
+    :py:func:`get_blueprintable_from_string` and
+    :py:meth:`.Blueprintable.from_string`. Useful when the same strings are
+    loaded repeatedly, as only the first load of each pays for decoding and
+    structuring it.
+
+    Calling this function again replaces the existing cache with a new, empty
+    one.
+
+    :param maxsize: The maximum number of strings to keep.
+
+    :returns: The newly created :py:class:`.StringCache`, which can be used to
+        inspect its statistics.
+    """
+    global _string_cache
+    _string_cache = StringCache(maxsize=maxsize)
+    return _string_cache
+
+
+def disable_string_cache() -> None:
+    """
+    Disables and discards the cache created by :py:func:`enable_string_cache`.
+    """
+    global _string_cache
+    _string_cache = None
+
+
+def get_string_cache() -> Optional[StringCache]:
+    """
+    Gets the currently active :py:class:`.StringCache`, or ``None`` if string
+    caching is disabled.
+    """
+    return _string_cache
+
+
 @reissue_warnings
 def get_blueprintable_from_string(blueprintable_string: str) -> Blueprintable:
     """
@@ -54,6 +258,9 @@ def get_blueprintable_from_string(blueprintable_string: str) -> Blueprintable:
         ``"deconstruction_planner"``, ``"upgrade_planner"``, nor
         ``"blueprint_book"``, and thus it's type cannot be deduced.
     """
+    if _string_cache is not None:
+        return _string_cache.load(blueprintable_string)
+
     blueprintable_JSON = string_to_JSON(blueprintable_string)
     return get_blueprintable_from_JSON(blueprintable_JSON)
 
@@ -30,6 +30,7 @@ from draftsman.entity import get_entity_class
 from draftsman.utils import (
     AABB,
     aabb_to_dimensions,
+    canonicalize_JSON,
     extend_aabb,
     flatten_entities,
     flatten_tiles,
@@ -221,6 +222,7 @@ class Blueprint(Transformable, Collection, Blueprintable):
         version: Optional[tuple[int, ...]] = None,
         exclude_none: bool = True,
         exclude_defaults: bool = True,
+        canonical: bool = False,
     ) -> dict:
         result = super().to_dict(
             version=version,
@@ -363,6 +365,9 @@ class Blueprint(Transformable, Collection, Blueprintable):
         if len(result["blueprint"]["wires"]) == 0:
             del result["blueprint"]["wires"]
 
+        if canonical:
+            result = canonicalize_JSON(result)
+
         return result
 
     # =========================================================================
@@ -13,14 +13,24 @@ from draftsman.classes.blueprint import Blueprint
 from draftsman.classes.blueprintable import Blueprintable
 from draftsman.classes.deconstruction_planner import DeconstructionPlanner
 from draftsman.classes.upgrade_planner import UpgradePlanner
+from draftsman.constants import CompressionLevel
 from draftsman.serialization import draftsman_converters
 from draftsman.signatures import uint16
+from draftsman.utils import (
+    canonicalize_JSON,
+    deflate_chunk,
+    deflated_chunks_to_string,
+    dict_merge,
+)
 from draftsman.validators import instance_of
 
 import attrs
 import cattrs
 from collections.abc import MutableSequence
-from typing import Any, Iterable, Literal, Sequence, overload
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import json
+from typing import Any, Iterable, Literal, Optional, Sequence, overload
 
 
 class BlueprintableList(MutableSequence):
@@ -97,17 +107,21 @@ draftsman_converters.register_structure_hook(
 )
 
 
+def _unstructure_blueprintable(elem: Blueprintable, i: int) -> dict:
+    # d = converter.unstructure(elem)
+    d = elem.to_dict()  # TODO: this is a problem because we lose the
+    # information stored in converter; plus, what arguments would you
+    # call `to_dict()` with here?
+    if "index" not in d:
+        d["index"] = i
+    return d
+
+
 def blueprintable_list_unstructure_factory(_: type, converter: cattrs.Converter):
     def unstructure_hook(inst):
         res = [None] * len(inst)
         for i, elem in enumerate(inst):
-            # d = converter.unstructure(elem)
-            d = elem.to_dict()  # TODO: this is a problem because we lose the
-            # information stored in converter; plus, what arguments would you
-            # call `to_dict()` with here?
-            if "index" not in d:
-                d["index"] = i
-            res[i] = d
+            res[i] = _unstructure_blueprintable(elem, i)
 
         return res
 
@@ -197,6 +211,100 @@ class BlueprintBook(Blueprintable):
     def _blueprints_default(self):
         return BlueprintableList()
 
+    # =========================================================================
+    # Utility functions
+    # =========================================================================
+
+    def to_string(
+        self,
+        version: Optional[tuple[int]] = None,
+        compression_level: int = CompressionLevel.BEST,
+        canonical: bool = False,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> str:
+        """
+        Returns this object as an encoded Factorio blueprint string.
+
+        If ``parallel`` is ``True``, each child blueprintable is serialized and
+        compressed in a separate worker thread, and the compressed segments are
+        stitched back together into a single zlib stream. The resulting string
+        decodes to exactly the same JSON as the sequential method, though the
+        string itself may be slightly larger since each child is compressed
+        independently of its neighbours.
+
+        :param version: Which Factorio version format this object should be
+            exported with. Defaults to the version of the current environment.
+        :param compression_level: The zlib compression level to use, from ``0``
+            to ``9``. See :py:class:`.CompressionLevel` for common presets.
+        :param canonical: Whether or not to sort the contents of the output
+            into a canonical order. See :py:func:`.canonicalize_JSON` for more
+            information.
+        :param parallel: Whether or not to serialize and compress each child
+            blueprintable in a thread pool.
+        :param max_workers: The maximum number of threads to use when
+            ``parallel`` is ``True``. Defaults to the default of
+            :py:class:`concurrent.futures.ThreadPoolExecutor`.
+
+        :returns: The zlib-compressed, base-64 encoded string.
+        """
+        if not parallel:
+            return super().to_string(
+                version=version,
+                compression_level=compression_level,
+                canonical=canonical,
+            )
+
+        # Export everything except the child blueprintables, leaving a marker
+        # where they would otherwise go so we can split the output around it
+        head = copy.copy(self)
+        object.__setattr__(head, "blueprints", BlueprintableList())
+        object.__setattr__(head, "extra_keys", None)
+        head_dict = head.to_dict(version=version)
+        marker = "\x00blueprints\x00"
+        if len(self.blueprints) > 0:
+            head_dict[self.root_item]["blueprints"] = marker
+        if self.extra_keys:
+            dict_merge(head_dict, self.extra_keys)
+        if canonical:
+            head_dict = canonicalize_JSON(head_dict, sort_keys=False)
+
+        head_json = json.dumps(head_dict, separators=(",", ":"), sort_keys=canonical)
+        prefix, _, suffix = head_json.partition(json.dumps(marker))
+        if len(self.blueprints) > 0:
+            prefix += "["
+            suffix = "]" + suffix
+
+        def encode_child(i: int, blueprintable: Blueprintable):
+            child_dict = _unstructure_blueprintable(blueprintable, i)
+            if canonical:
+                child_dict = canonicalize_JSON(child_dict, sort_keys=False)
+            chunk = json.dumps(
+                child_dict, separators=(",", ":"), sort_keys=canonical
+            ).encode("utf-8")
+            if i > 0:
+                chunk = b"," + chunk
+            return chunk, deflate_chunk(chunk, compression_level)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            children = list(
+                executor.map(
+                    encode_child,
+                    range(len(self.blueprints)),
+                    self.blueprints,
+                )
+            )
+
+        chunks = [prefix.encode("utf-8")]
+        deflated_chunks = [deflate_chunk(chunks[0], compression_level)]
+        for chunk, deflated_chunk in children:
+            chunks.append(chunk)
+            deflated_chunks.append(deflated_chunk)
+        chunks.append(suffix.encode("utf-8"))
+        deflated_chunks.append(deflate_chunk(chunks[-1], compression_level, final=True))
+
+        return deflated_chunks_to_string(chunks, deflated_chunks, compression_level)
+
 
 draftsman_converters.add_hook_fns(
     BlueprintBook,
@@ -2,6 +2,7 @@
 
 from draftsman import DEFAULT_FACTORIO_VERSION
 from draftsman.classes.exportable import Exportable
+from draftsman.constants import CompressionLevel
 from draftsman.error import IncorrectBlueprintTypeError
 from draftsman.signatures import (
     Color,
@@ -13,6 +14,7 @@ from draftsman.signatures import (
 # from draftsman.data.signals import signal_dict
 from draftsman.serialization import draftsman_converters
 from draftsman.utils import (
+    canonicalize_JSON,
     encode_version,
     decode_version,
     JSON_to_string,
@@ -40,6 +42,8 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
     :py:class:`.UpgradePlanner`, and :py:class:`.BlueprintBook`.
     """
 
+    _export_cacheable = False
+
     @classmethod
     @reissue_warnings
     def from_string(
@@ -60,7 +64,28 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
             different type than the base class, such as trying to load the
             string of an upgrade planner into a ``Blueprint`` object.
         """
-        json_dict = string_to_JSON(string)
+        from draftsman.blueprintable import get_string_cache  # FIXME: cursed
+
+        string_cache = get_string_cache()
+        if string_cache is not None:
+            return string_cache.load(string, cls)
+
+        return cls.from_JSON(string_to_JSON(string))
+
+    @classmethod
+    @reissue_warnings
+    def from_JSON(cls, json_dict: dict):
+        """
+        Creates a :py:class:`.Blueprintable` with the contents of the decoded
+        blueprint string ``json_dict``. Unlike :py:meth:`.from_dict`, the
+        version of the data is read from ``json_dict`` itself.
+
+        :param json_dict: The decoded blueprint string to interpret. This
+            dictionary is consumed in the process, and should not be reused.
+
+        :exception IncorrectBlueprintTypeError: If the input dict is of a
+            different type than the base class.
+        """
         # Ensure that the blueprint string actually matches the type of the
         # selected class
         root_item = cls.root_item.fget(cls)
@@ -385,12 +410,53 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
 
     # =========================================================================
 
+    def to_dict(
+        self,
+        version: Optional[tuple[int, ...]] = None,
+        exclude_none: bool = True,
+        exclude_defaults: bool = True,
+        canonical: bool = False,
+    ) -> dict:
+        """
+        Export this object to a JSON dictionary. See
+        :py:meth:`.Exportable.to_dict` for a description of the common
+        arguments.
+
+        :param canonical: Whether or not to sort the contents of the output
+            into a canonical order, such that identical designs always export
+            identically regardless of the order their contents were added in.
+            See :py:func:`.canonicalize_JSON` for more information.
+        """
+        result = super().to_dict(
+            version=version,
+            exclude_none=exclude_none,
+            exclude_defaults=exclude_defaults,
+        )
+        if canonical:
+            result = canonicalize_JSON(result)
+        return result
+
     def to_string(
-        self, version: Optional[tuple[int]] = None
+        self,
+        version: Optional[tuple[int]] = None,
+        compression_level: int = CompressionLevel.BEST,
+        canonical: bool = False,
     ) -> str:  # pragma: no coverage
         """
         Returns this object as an encoded Factorio blueprint string.
 
+        :param version: Which Factorio version format this object should be
+            exported with. Defaults to the version of the current environment.
+        :param compression_level: The zlib compression level to use, from ``0``
+            to ``9``. Lower levels are significantly faster on large
+            blueprintables at the cost of a slightly larger string. See
+            :py:class:`.CompressionLevel` for common presets.
+        :param canonical: Whether or not to sort the contents of the output
+            into a canonical order. Canonical strings are usually smaller and
+            are stable across re-exports, making them better suited for storing
+            in version control. See :py:func:`.canonicalize_JSON` for more
+            information.
+
         :returns: The zlib-compressed, base-64 encoded string.
 
         :example:
@@ -411,7 +477,12 @@ class Blueprintable(Exportable, metaclass=ABCMeta):
         """
         if version is None:
             version = mods.versions.get("base", DEFAULT_FACTORIO_VERSION)
-        return JSON_to_string(self.to_dict(version=version))
+        result = self.to_dict(version=version)
+        if canonical:
+            result = canonicalize_JSON(result, sort_keys=False)
+        return JSON_to_string(
+            result, compression_level=compression_level, sort_keys=canonical
+        )
 
     def __str__(self) -> str:  # pragma: no coverage
         return "<{}>{}".format(
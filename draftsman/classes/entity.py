@@ -11,6 +11,7 @@ from draftsman.constants import (
     InventoryType,
     ValidationMode,
 )
+from draftsman import data
 from draftsman.data import entities
 from draftsman.serialization import draftsman_converters
 from draftsman.signatures import (
@@ -97,6 +98,102 @@ class _TileVector(Vector):
 # draftsman_converters.register_unstructure_hook(_TileVector, lambda v: v.to_dict())
 
 
+@attrs.frozen
+class EntityPrototypeInfo:
+    """
+    Values derived from the prototype of an entity which are the same for every
+    instance with that name. Computed once per name by
+    :py:func:`get_prototype_info` and shared by every :py:class:`.Entity` with
+    that name, so that their properties don't have to repeatedly look them up
+    from ``entities.raw``.
+    """
+
+    name: str
+    prototype: dict
+    type: Optional[str]
+    static_collision_set: Optional[CollisionSet]
+    collision_mask: Optional[set[str]]
+    static_tile_width: int
+    static_tile_height: int
+    flags: Optional[set[str]]
+    surface_conditions: Optional[dict]
+    # The `entities.raw` entry this was computed from, for detecting changes
+    _source: Optional[dict] = attrs.field(repr=False, eq=False)
+
+    @classmethod
+    def from_name(cls, name: str) -> "EntityPrototypeInfo":
+        source = entities.raw.get(name, None)
+        prototype = {} if source is None else source
+        static_collision_set = entities.collision_sets.get(name, None)
+
+        # For simplicity later (and due to the fact we don't need any extra
+        # keys) the collision mask is only the collision layers, hence the
+        # version specific malarkey
+        if mods.versions.get("base", DEFAULT_FACTORIO_VERSION) < (2, 0):
+            collision_mask = prototype.get("collision_mask", None)
+        else:
+            collision_mask = prototype.get("collision_mask", {}).get("layers", None)
+
+        if "tile_width" in prototype and "tile_height" in prototype:
+            dimensions = (prototype["tile_width"], prototype["tile_height"])
+        else:
+            dimensions = aabb_to_dimensions(
+                static_collision_set.get_bounding_box()
+                if static_collision_set
+                else None
+            )
+
+        return cls(
+            name=name,
+            prototype=prototype,
+            type=prototype.get("type", None),
+            static_collision_set=static_collision_set,
+            collision_mask=collision_mask,
+            static_tile_width=prototype.get("tile_width", dimensions[0]),
+            static_tile_height=prototype.get("tile_height", dimensions[1]),
+            flags=prototype.get("flags", None),
+            surface_conditions=(
+                None if source is None else prototype.get("surface_conditions", {})
+            ),
+            source=source,
+        )
+
+
+_prototype_infos: dict[str, EntityPrototypeInfo] = {}
+
+
+def get_prototype_info(name: str) -> EntityPrototypeInfo:
+    """
+    Gets the :py:class:`.EntityPrototypeInfo` for an entity name, computing it
+    if it doesn't exist or if the entity's entry in ``entities.raw`` has been
+    replaced (such as with :py:func:`~draftsman.data.entities.add_entity`)
+    since it was computed.
+
+    :param name: The name of the entity.
+    """
+    try:
+        info = _prototype_infos[name]
+        if info._source is entities.raw.get(name, None):
+            return info
+    except KeyError:
+        pass
+    info = _prototype_infos[name] = EntityPrototypeInfo.from_name(name)
+    return info
+
+
+def clear_prototype_info() -> None:
+    """
+    Clears all of the cached :py:class:`.EntityPrototypeInfo` objects. Only
+    needs to be called if the data an entity's properties derive from is
+    modified in place, such as when changing the ``"flags"`` of an existing
+    entry in ``entities.raw``.
+    """
+    _prototype_infos.clear()
+
+
+data.on_profile_change(clear_prototype_info)
+
+
 @attrs.define
 class Entity(EntityLike, Exportable):
     """
@@ -191,7 +288,7 @@ class Entity(EntityLike, Exportable):
         entity. If this entity's name does not correspond to an entry under the
         current environment, an empty dict is returned instead.
         """
-        return entities.raw.get(self.name, {})
+        return get_prototype_info(self.name).prototype
 
     # =========================================================================
 
@@ -206,7 +303,7 @@ class Entity(EntityLike, Exportable):
         :py:meth:`.Collection.find_entities_filtered`. Returns ``None`` if
         this entity's name is not recognized when created without validation.
         """
-        return self.prototype.get("type", None)
+        return get_prototype_info(self.name).type
 
     # =========================================================================
 
@@ -239,7 +336,7 @@ class Entity(EntityLike, Exportable):
         you want the collision shape of this entity that does change when
         rotated, use :py:attr:`.collision_set` instead.
         """
-        return entities.collision_sets.get(self.name, None)
+        return get_prototype_info(self.name).static_collision_set
 
     # =========================================================================
 
@@ -265,13 +362,7 @@ class Entity(EntityLike, Exportable):
         # We guarantee that the "collision_mask" key will exist during
         # `draftsman-update`, and that it will have it's proper default based
         # on it's type
-        # For simplicity later (and due to the fact we don't need any extra keys)
-        # the set we return is only the collision layers, hence the version
-        # specific malarkey
-        if mods.versions.get("base", DEFAULT_FACTORIO_VERSION) < (2, 0):
-            return self.prototype.get("collision_mask", None)
-        else:
-            return self.prototype.get("collision_mask", {}).get("layers", None)
+        return get_prototype_info(self.name).collision_mask
 
     # =========================================================================
 
@@ -281,14 +372,7 @@ class Entity(EntityLike, Exportable):
         The width of the entity irrespective of it's current orientation.
         Equivalent to the :py:attr:`.tile_width` when the entity is facing north.
         """
-        if "tile_width" in self.prototype:
-            return self.prototype["tile_width"]
-        else:
-            return aabb_to_dimensions(
-                self.static_collision_set.get_bounding_box()
-                if self.static_collision_set
-                else None
-            )[0]
+        return get_prototype_info(self.name).static_tile_width
 
     # =========================================================================
 
@@ -298,18 +382,11 @@ class Entity(EntityLike, Exportable):
         The height of the entity irrespective of it's current orientation.
         Equivalent to the :py:attr:`.tile_width` when the entity is facing north.
         """
-        if "tile_height" in self.prototype:
-            return self.prototype["tile_height"]
-        else:
-            return aabb_to_dimensions(
-                self.static_collision_set.get_bounding_box()
-                if self.static_collision_set
-                else None
-            )[1]
+        return get_prototype_info(self.name).static_tile_height
 
     # =========================================================================
 
-    @property  # Cache?
+    @property
     def tile_width(self) -> int:
         """
         The width of the entity in tiles, taking into account it's current
@@ -320,7 +397,7 @@ class Entity(EntityLike, Exportable):
 
     # =========================================================================
 
-    @property  # Cache?
+    @property
     def tile_height(self) -> int:
         """
         The height of the entity in tiles, taking into account it's current
@@ -351,7 +428,7 @@ class Entity(EntityLike, Exportable):
 
             `<https://wiki.factorio.com/Types/EntityPrototypeFlags>`_
         """
-        return self.prototype.get("flags", None)
+        return get_prototype_info(self.name).flags
 
     # =========================================================================
 
@@ -379,9 +456,7 @@ class Entity(EntityLike, Exportable):
         returned. If this entity is unrecognized by Draftsman, ``None`` is
         returned.
         """
-        return entities.raw.get(self.name, {"surface_conditions": None}).get(
-            "surface_conditions", {}
-        )
+        return get_prototype_info(self.name).surface_conditions
 
     # =========================================================================
     # Attributes
@@ -929,6 +1004,11 @@ class Entity(EntityLike, Exportable):
         res.update(super().to_dict(version, exclude_none, exclude_defaults))
         return res
 
+    def _export_cache_token(self) -> tuple[float, float]:
+        # Exported position depends on the position of any parent groups
+        position = self.global_position
+        return (position.x, position.y)
+
     # =========================================================================
 
     def mergable_with(self, other: "Entity") -> bool:
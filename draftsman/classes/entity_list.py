@@ -32,6 +32,8 @@ class EntityList(Exportable, MutableSequence):
     :py:class:`.Collection` classes.
     """
 
+    _export_cacheable = False
+
     @reissue_warnings
     def __init__(
         self,
@@ -1,12 +1,17 @@
 # exportable.py
 from draftsman import DEFAULT_FACTORIO_VERSION
+from draftsman.classes.vector import Vector
 from draftsman.constants import ValidationMode
-from draftsman.error import DataFormatError
+from draftsman.error import (
+    DataFormatError,
+    DataNotLoadedError,
+    MalformedSnapshotError,
+)
 from draftsman.serialization import (
     draftsman_converters,
     make_unstructure_function_from_schema,
 )
-from draftsman.utils import dict_merge, reissue_warnings
+from draftsman.utils import dict_merge, dump_snapshot, load_snapshot, reissue_warnings
 from draftsman.validators import conditional
 from draftsman.warning import UnknownKeywordWarning
 
@@ -17,12 +22,184 @@ import cattrs
 from cattrs.gen._shared import find_structure_handler
 
 import copy
-from typing import Any, List, Optional
+from enum import Enum
+import operator
+from typing import IO, Any, Callable, List, Optional
 from typing_extensions import Self
 import warnings
+import weakref
 import pprint  # TODO: find something better
 
 
+_export_caching = False
+
+
+def get_export_caching() -> bool:
+    """
+    Gets whether or not :py:class:`.Exportable` objects currently cache the
+    output of their :py:meth:`~.Exportable.to_dict` methods.
+    """
+    global _export_caching
+    return _export_caching
+
+
+def set_export_caching(enabled: bool):
+    """
+    Enables or disables caching the serialized form of each
+    :py:class:`.Exportable` object. When enabled, every object remembers the
+    last dictionary it exported for each ``(version, exclude_none,
+    exclude_defaults)`` configuration, and subsequent exports of an unchanged
+    object return a copy of that dictionary instead of re-serializing it.
+
+    Whether an object is unchanged is checked by walking every object reachable
+    from its attributes, which costs about as much as serializing a simple
+    entity to the current format. Caching is therefore most useful when
+    serializing is expensive, such as when repeatedly exporting a large
+    blueprint to the Factorio 1.0 format after small edits.
+
+    Can either be set for all subsequent statements:
+
+    .. example::
+
+        from draftsman.classes.exportable import set_export_caching
+
+        set_export_caching(True)
+
+    Or only for a specific block of code:
+
+    .. example::
+
+        with set_export_caching(True):
+            blueprint.to_string()
+
+    .. NOTE::
+
+        Changes are detected through lists, tuples, sets, dicts, vectors, and
+        the attributes of nested objects, so both setting an attribute and
+        modifying one in place (such as with :py:meth:`.Entity.set_item_request`)
+        discard the cached dictionary. Objects which store their contents in
+        ``__slots__`` without being ``attrs`` classes cannot be walked; if you
+        modify one in place, call :py:meth:`.Exportable.mark_dirty` on the
+        object which holds it afterwards.
+    """
+    global _export_caching
+    original_value = _export_caching
+    _export_caching = bool(enabled)
+
+    class ExportCachingContext:
+        def __enter__(self):
+            pass
+
+        def __exit__(self, typ, value, traceback):
+            global _export_caching
+            _export_caching = original_value
+
+    return ExportCachingContext()
+
+
+def _copy_json(value: Any) -> Any:
+    """
+    Fast deepcopy of a JSON-like structure. Leaves everything that isn't a
+    ``dict`` or ``list`` untouched.
+    """
+    if type(value) is dict:
+        return {k: _copy_json(v) for k, v in value.items()}
+    elif type(value) is list:
+        return [_copy_json(v) for v in value]
+    else:
+        return value
+
+
+_END = object()
+"""
+Marks the end of the contents of a container in a collected state.
+"""
+
+_leaf_types = {type(None), bool, int, float, str}
+"""
+Types which never contain other objects. Extended with every type which
+:py:func:`_collect_state` finds it cannot walk.
+"""
+
+_state_getters: dict[type, Optional[Callable[[Any], tuple]]] = {}
+
+
+def _get_state_getter(cls: type) -> Optional[Callable[[Any], tuple]]:
+    """
+    Gets a function which returns a tuple of every attribute of an instance of
+    the attrs class ``cls`` which can affect its exported form, or ``None`` if
+    ``cls`` is not an attrs class.
+    """
+    try:
+        return _state_getters[cls]
+    except KeyError:
+        getter = None
+        if attrs.has(cls):
+            names = [
+                field.name
+                for field in attrs.fields(cls)
+                if not field.metadata.get("omit", False)
+            ]
+            if len(names) > 1:
+                getter = operator.attrgetter(*names)
+            else:
+
+                def getter(inst) -> tuple:
+                    return tuple(getattr(inst, name) for name in names)
+
+        _state_getters[cls] = getter
+        return getter
+
+
+def _collect_state(value: Any, state: list) -> None:
+    """
+    Appends ``value`` to ``state``, followed by every object reachable from it
+    through containers, :py:class:`.Vector` objects, and the attributes of
+    other objects. Collecting the state of an object which has not been
+    modified since (in place or otherwise) produces the same objects in the
+    same order.
+    """
+    state.append(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    elif isinstance(value, dict):
+        state.extend(value)
+        items = value.values()
+    elif isinstance(value, Vector):
+        items = value._data
+    else:
+        getter = _get_state_getter(type(value))
+        if getter is not None:
+            items = getter(value)
+        elif hasattr(value, "__dict__") and not isinstance(
+            value, (type, Enum, weakref.ref)
+        ):
+            items = (value.__dict__,)
+        else:
+            _leaf_types.add(type(value))
+            return
+
+    if _leaf_types.issuperset(map(type, items)):
+        state.extend(items)
+    else:
+        for item in items:
+            if type(item) in _leaf_types:
+                state.append(item)
+            else:
+                _collect_state(item, state)
+    state.append(_END)
+
+
+def _unchanged(old_state: list, new_state: list) -> bool:
+    """
+    Whether or not every object in ``new_state`` is the same object as the
+    corresponding one in ``old_state``.
+    """
+    return len(old_state) == len(new_state) and all(
+        map(operator.is_, old_state, new_state)
+    )
+
+
 class ValidationResult:
     """
     Helper object used to contain errors and warnings issued from
@@ -90,6 +267,11 @@ class Exportable:
     # def __new__(cls, *args, **kwargs):
     #     return super().__new__(cls)
 
+    # Whether or not instances of this class can cache their exported dict when
+    # export caching is enabled. Containers (whose output depends on objects
+    # that can change without them knowing) should set this to `False`
+    _export_cacheable = True
+
     # @property
     # def is_valid(self) -> bool: # TODO
     #     """
@@ -317,6 +499,81 @@ class Exportable:
         converter = version_info.get_converter(exclude_none, exclude_defaults)
         return converter.unstructure(self)
 
+    def dump(self, fp: IO[bytes]) -> None:
+        """
+        Saves this object to the binary file ``fp`` as a native Draftsman
+        snapshot. Snapshots preserve this object exactly as it currently exists,
+        including Associations, groups, and spatial data, and can be loaded
+        again with :py:meth:`.load` much faster than a blueprint string can be
+        imported, as no conversion or validation is performed.
+
+        Snapshots can only be loaded by the same version of Draftsman that
+        created them. See :py:func:`draftsman.utils.dump_snapshot` for more
+        information.
+
+        :example:
+
+        .. code-block:: python
+
+            with open("design.snapshot", "wb") as fp:
+                blueprint.dump(fp)
+
+            with open("design.snapshot", "rb") as fp:
+                blueprint = Blueprint.load(fp)
+
+        :param fp: A file-like object opened in binary mode to write to.
+        """
+        dump_snapshot(self, fp)
+
+    @classmethod
+    def load(cls, fp: IO[bytes]) -> Self:
+        """
+        Loads an object of this type from a snapshot created with
+        :py:meth:`.dump`.
+
+        .. WARNING::
+
+            Snapshots are pickle data, and loading one can execute arbitrary
+            code. Never load snapshots from untrusted sources.
+
+        :param fp: A file-like object opened in binary mode to read from.
+
+        :exception MalformedSnapshotError: If the data is not a valid snapshot,
+            was created by a different version of Draftsman, or contains an
+            object which is not an instance of this class.
+        """
+        obj = load_snapshot(fp)
+        if not isinstance(obj, cls):
+            raise MalformedSnapshotError(
+                "Expected a snapshot of '{}', found '{}'".format(
+                    cls.__name__, type(obj).__name__
+                )
+            )
+        return obj
+
+    # =========================================================================
+
+    def mark_dirty(self) -> None:
+        """
+        Notifies this object that it has been modified, discarding any state
+        which was derived from its previous contents, such as the cached output
+        of :py:meth:`.to_dict`.
+
+        Changes to this object's attributes (and the objects inside of them)
+        are detected automatically, so this only needs to be called manually
+        after modifying an object which export caching cannot walk. See
+        :py:func:`.set_export_caching` for more information.
+        """
+        self.__dict__.pop("_export_cache", None)
+
+    def _export_cache_token(self) -> Any:
+        """
+        Any state outside of this object's own attributes which affects its
+        exported form. If this value differs from the one recorded when the
+        export was cached, the cached value is ignored.
+        """
+        return None
+
     # =========================================================================
 
     def __deepcopy__(self, memo: Optional[dict[int, Any]] = {}):
@@ -372,61 +629,76 @@ def make_exportable_structure_factory_func(
         version_data = draftsman_converters.get_version(version_tuple)
         structure_dict = version_data.get_structure_dict(cls, converter)
 
+        # Resolve the structure dict into a flat "plan" once, up front, so that
+        # the hook itself only has to pop each location and call its handler.
+        # Each step is a tuple of (key, path, attr_name, attr_type, handler,
+        # is_custom); ``key`` is set when the source location is a single key
+        # (the common case) so we can pop it directly, otherwise ``path`` is
+        # the full nested location to traverse.
+        plan = []
+        for source_loc, dest_loc in structure_dict.items():
+            # Entries without a source location can never be populated
+            if source_loc is None:
+                continue
+
+            key = source_loc[0] if len(source_loc) == 1 else None
+            path = None if key is not None else source_loc
+
+            # If the destination is None, that's us telling the structure
+            # function to ignore that particular entry
+            if dest_loc is None:
+                plan.append((key, path, None, None, None, False))
+                continue
+
+            if isinstance(dest_loc, dict):
+                custom_handler = dest_loc.get("handler", None)
+                attr = dest_loc["attr"]
+                attr_name = dest_loc["name"]
+                attr_type = dest_loc["type"]
+            elif isinstance(dest_loc, tuple):
+                attr = dest_loc[0]
+                custom_handler = dest_loc[1]
+                attr_name = attr.alias if attr.alias != attr.name else attr.name
+                attr_type = attr.type
+            else:
+                attr = getattr(class_attrs, dest_loc)
+                custom_handler = None
+                attr_name = attr.alias if attr.alias != attr.name else attr.name
+                attr_type = attr.type
+
+            # Grab the appropriate structure handler
+            if custom_handler is not None:
+                handler = custom_handler
+            else:
+                handler = find_structure_handler(attr, attr_type, converter)
+
+            plan.append(
+                (key, path, attr_name, attr_type, handler, bool(custom_handler))
+            )
+
         def structure_hook(input_dict: dict, _: type):
             inst = cls.__new__(cls)
 
-            # print(input_dict)
-
             init_args = {}
-            for source_loc, dest_loc in structure_dict.items():
-                # If the destination is None, that's us telling the structure
-                # function to ignore that particular entry
-                if dest_loc is None:
-                    try_pop_location(input_dict, source_loc)
-                    continue
-
-                # print(source_loc, dest_loc)
-
-                if isinstance(dest_loc, dict):
-                    custom_handler = dest_loc.get("handler", None)
-                    attr = dest_loc["attr"]
-                    attr_name = dest_loc["name"]
-                    attr_type = dest_loc["type"]
-                elif isinstance(dest_loc, tuple):
-                    attr = dest_loc[0]
-                    custom_handler = dest_loc[1]
-                    attr_name = attr.alias if attr.alias != attr.name else attr.name
-                    attr_type = attr.type
+            for key, path, attr_name, attr_type, handler, is_custom in plan:
+                if key is not None:
+                    value = input_dict.pop(key, None)
                 else:
-                    attr = getattr(class_attrs, dest_loc)
-                    custom_handler = None
-                    attr_name = attr.alias if attr.alias != attr.name else attr.name
-                    attr_type = attr.type
-
-                # print(attr)
-                # print(attr_name)
-                # print(attr_type)
-                # print(custom_handler)
-
-                value = try_pop_location(input_dict, source_loc)
-                # No value means nothing to do
-                if value is None:
+                    value = try_pop_location(input_dict, path)
+
+                # No value (or an ignored location) means nothing to do
+                if value is None or attr_name is None:
                     continue
 
-                # Grab the appropriate structure handler
-                handler = (
-                    custom_handler
-                    if custom_handler is not None
-                    else find_structure_handler(attr, attr_type, converter)
-                )
-                # print(handler)
                 try:
-                    if custom_handler:
+                    if is_custom:
                         init_args[attr_name] = handler(
                             value, attr_type, inst, init_args
                         )
                     else:
                         init_args[attr_name] = handler(value, attr_type)
+                except DataNotLoadedError:
+                    raise
                 except Exception as e:
                     raise DataFormatError(e)
 
@@ -456,13 +728,39 @@ def make_exportable_unstructure_factory_func(
             version=version_tuple,
         )
 
+        cache_key = (version_tuple, exclude_none, exclude_defaults)
+        # A cached export is only reused while every object reachable from the
+        # instance's attributes is the same object it was when the export was
+        # cached, which catches both reassigned and modified attributes
+
         def unstructure_hook(inst):
+            if _export_caching and inst._export_cacheable:
+                cache = inst.__dict__.get("_export_cache", None)
+                token = inst._export_cache_token()
+                values = []
+                _collect_state(inst, values)
+                if cache is None:
+                    cache = inst.__dict__["_export_cache"] = {}
+                else:
+                    entry = cache.get(cache_key, None)
+                    if (
+                        entry is not None
+                        and entry[0] == token
+                        and _unchanged(entry[1], values)
+                    ):
+                        return _copy_json(entry[2])
+            else:
+                cache = None
+
             # TODO: should be wrapped in a try block with a better error message
             res = parent_hook(inst)
             # We want to preserve round-trip consistency, even with keys we
             # don't use/recognize
             if inst.extra_keys:
                 dict_merge(res, inst.extra_keys)
+
+            if cache is not None:
+                cache[cache_key] = (token, values, _copy_json(res))
             return res
 
         return unstructure_hook
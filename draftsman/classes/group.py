@@ -280,6 +280,9 @@ class Group(
         for entity in self.entities:
             area = extend_aabb(area, entity.get_world_bounding_box())
 
+        for group in self.groups:
+            area = extend_aabb(area, group.get_world_bounding_box())
+
         return area
 
     def get_dimensions(self) -> tuple[int, int]:
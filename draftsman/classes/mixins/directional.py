@@ -9,6 +9,7 @@ from draftsman.constants import (
     EIGHT_WAY_DIRECTIONS,
     SIXTEEN_WAY_DIRECTIONS,
 )
+from draftsman import data
 from draftsman.data import entities
 from draftsman.serialization import draftsman_converters
 from draftsman.validators import conditional, instance_of, try_convert
@@ -30,6 +31,83 @@ if TYPE_CHECKING:  # pragma: no coverage
 # `Entity.get_world_collision_set()`.
 _rotated_collision_sets: dict[str, list[CollisionSet]] = {}
 
+# The names in `_rotated_collision_sets` which were derived from the current
+# data, as opposed to hardcoded by a prototype module
+_derived_collision_sets: set[str] = set()
+
+
+@data.on_profile_change
+def _clear_derived_collision_sets() -> None:
+    for name in _derived_collision_sets:
+        _rotated_collision_sets.pop(name, None)
+    _derived_collision_sets.clear()
+
+
+def rotate_collision_set(
+    static_collision_set: Optional[CollisionSet],
+    valid_directions: set[Direction],
+    rotated: bool,
+) -> dict[Direction, Optional[CollisionSet]]:
+    """
+    Gets the collision set of an entity for every direction it can face.
+
+    :param static_collision_set: The collision set of the entity facing north.
+    :param valid_directions: The directions the entity can face.
+    :param rotated: Whether or not the collision set actually changes with
+        direction.
+    """
+    result = {}
+    for dir in valid_directions:
+        if rotated and static_collision_set is not None:
+            rotated_collision_set = static_collision_set.rotate(dir)
+        else:
+            rotated_collision_set = static_collision_set
+
+        result[dir] = rotated_collision_set
+    return result
+
+
+def get_default_rotated_collision_sets(
+    prototype: dict, static_collision_set: Optional[CollisionSet]
+) -> dict[Direction, Optional[CollisionSet]]:
+    """
+    Gets the rotated collision sets of a directional entity from its prototype,
+    following the default rules of :py:class:`.DirectionalMixin`. Used by
+    ``draftsman update`` to precompute them ahead of time; see
+    :py:data:`draftsman.data.entities.rotated_collision_sets`.
+
+    :param prototype: The ``data.raw`` entry of the entity.
+    :param static_collision_set: The collision set of the entity facing north.
+    """
+    flags = prototype.get("flags", None)
+    if flags is None:
+        # Unknown flags; assume the entity could occupy any valid direction
+        rotatable = True
+        valid_directions = SIXTEEN_WAY_DIRECTIONS
+    elif "not-rotatable" in flags:
+        rotatable = False
+        valid_directions = {Direction.NORTH}
+    elif "building-direction-8-way" in flags:
+        rotatable = True
+        valid_directions = EIGHT_WAY_DIRECTIONS
+    elif "building-direction-16-way" in flags:  # pragma: no coverage
+        rotatable = True
+        valid_directions = SIXTEEN_WAY_DIRECTIONS
+    else:
+        rotatable = True
+        valid_directions = FOUR_WAY_DIRECTIONS
+
+    dimensions = aabb_to_dimensions(
+        static_collision_set.get_bounding_box() if static_collision_set else None
+    )
+    tile_width = prototype.get("tile_width", dimensions[0])
+    tile_height = prototype.get("tile_height", dimensions[1])
+    square = tile_width == tile_height
+
+    return rotate_collision_set(
+        static_collision_set, valid_directions, rotatable and not square
+    )
+
 
 @attrs.define(slots=False)
 class DirectionalMixin(Exportable):
@@ -58,9 +136,16 @@ class DirectionalMixin(Exportable):
         try:
             _rotated_collision_sets[name]
         except KeyError:
-            # We encapsulate it in a function, since certain collision sets are
-            # hardcoded by the game and we need to account for that
-            _rotated_collision_sets[name] = self._specify_collision_sets()
+            # Use the collision sets precomputed by `draftsman update` if this
+            # class follows the default rules
+            precomputed = entities.rotated_collision_sets.get(name, None)
+            if precomputed is not None and _uses_default_rotation(type(self)):
+                _rotated_collision_sets[name] = precomputed
+            else:
+                # We encapsulate it in a function, since certain collision sets
+                # are hardcoded by the game and we need to account for that
+                _rotated_collision_sets[name] = self._specify_collision_sets()
+            _derived_collision_sets.add(name)
 
         # The default position function uses `tile_width`/`tile_height`, which
         # use `collision_set`, which for rotatable entities is derived from the
@@ -133,13 +218,14 @@ class DirectionalMixin(Exportable):
 
     # =========================================================================
 
-    @property  # Cache?
+    @property
     def tile_width(self) -> int:
-        if "tile_width" in self.prototype and "tile_height" in self.prototype:
+        prototype = self.prototype
+        if "tile_width" in prototype and "tile_height" in prototype:
             if self.direction in {Direction.EAST, Direction.WEST}:  # TODO: more generic
-                return self.prototype["tile_height"]
+                return prototype["tile_height"]
             else:
-                return self.prototype["tile_width"]
+                return prototype["tile_width"]
         else:
             return aabb_to_dimensions(
                 self.collision_set.get_bounding_box() if self.collision_set else None
@@ -147,13 +233,14 @@ class DirectionalMixin(Exportable):
 
     # =========================================================================
 
-    @property  # Cache?
+    @property
     def tile_height(self) -> int:
-        if "tile_width" in self.prototype and "tile_height" in self.prototype:
+        prototype = self.prototype
+        if "tile_width" in prototype and "tile_height" in prototype:
             if self.direction in {Direction.EAST, Direction.WEST}:  # TODO: more generic
-                return self.prototype["tile_width"]
+                return prototype["tile_width"]
             else:
-                return self.prototype["tile_height"]
+                return prototype["tile_height"]
         else:
             return aabb_to_dimensions(
                 self.collision_set.get_bounding_box() if self.collision_set else None
@@ -228,15 +315,31 @@ class DirectionalMixin(Exportable):
         Isolated into it's own function for certain entities whose collision
         boxes are hardcoded.
         """
-        result = {}
-        static_collision_set = entities.collision_sets.get(self.name, None)
-        for dir in self.valid_directions:
-            if self.collision_set_rotated and static_collision_set is not None:
-                rotated_collision_set = static_collision_set.rotate(dir)
-            else:
-                rotated_collision_set = static_collision_set
+        return rotate_collision_set(
+            entities.collision_sets.get(self.name, None),
+            self.valid_directions,
+            self.collision_set_rotated,
+        )
+
+
+# Whether or not each class derives its collision sets with the default rules,
+# and can therefore use the precomputed ones
+_default_rotation: dict[type, bool] = {}
 
-            result[dir] = rotated_collision_set
+
+def _uses_default_rotation(cls: type) -> bool:
+    try:
+        return _default_rotation[cls]
+    except KeyError:
+        result = _default_rotation[cls] = all(
+            getattr(cls, name) is getattr(DirectionalMixin, name)
+            for name in (
+                "_specify_collision_sets",
+                "valid_directions",
+                "collision_set_rotated",
+                "rotatable",
+            )
+        )
         return result
 
 
@@ -16,6 +16,7 @@ from draftsman.signatures import (
 )
 from draftsman.warning import EquipmentGridWarning
 
+from draftsman import data
 from draftsman.data import equipment as equipment_data, qualities
 
 import attrs
@@ -59,12 +60,10 @@ class EquipmentGrid:
         return equipment_data.grids[self.id].get("locked", False)
 
 
-# Only store one equipment grid per ID/quality and reuse across every entity
-_equipment_grids = {
-    (grid, quality): EquipmentGrid(grid, quality)
-    for quality in qualities.raw
-    for grid in equipment_data.grids
-}
+# Only store one equipment grid per ID/quality and reuse across every entity;
+# populated as each combination is first requested
+_equipment_grids: dict[tuple[str, str], EquipmentGrid] = {}
+data.on_profile_change(_equipment_grids.clear)
 
 
 @attrs.define(slots=False)
@@ -84,7 +83,14 @@ class EquipmentGridMixin(Exportable):  # (ItemRequestMixin)
         grid_id = self.prototype.get("equipment_grid", None)
         if grid_id is None:
             return None
-        return _equipment_grids.get((grid_id, self.quality), None)
+        key = (grid_id, self.quality)
+        try:
+            return _equipment_grids[key]
+        except KeyError:
+            if grid_id not in equipment_data.grids or self.quality not in qualities.raw:
+                return None
+            grid = _equipment_grids[key] = EquipmentGrid(grid_id, self.quality)
+            return grid
 
     # =========================================================================
 
@@ -161,7 +161,7 @@ draftsman_converters.get_version((1, 0)).add_hook_fns(
     RecipeMixin,
     lambda fields: {
         "recipe": fields.recipe.name,
-        "recipe_quality": fields.recipe_quality,
+        "recipe_quality": fields.recipe_quality.name,
     },
     lambda fields, converter: {
         "recipe": fields.recipe.name,
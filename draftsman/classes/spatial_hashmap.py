@@ -185,6 +185,7 @@ class SpatialHashMap(SpatialDataStructure):
     ) -> list[SpatialLike]:
         cell_coords = self._cell_coords_from_radius(radius, point)
         items = []
+        seen = set()
         for cell_coord in cell_coords:
             if cell_coord in self.map:
                 for item in self.map[cell_coord]:
@@ -193,10 +194,10 @@ class SpatialHashMap(SpatialDataStructure):
                         if limit is not None and len(items) >= limit:
                             break
                         # Make sure we dont add the same item multiple times if
-                        # it is spread across multiple cells
-                        try:
-                            items.index(item)
-                        except ValueError:
+                        # it is spread across multiple cells (by identity, as
+                        # items in different groups can compare equal)
+                        if id(item) not in seen:
+                            seen.add(id(item))
                             items.append(item)
 
         return items
@@ -218,6 +219,7 @@ class SpatialHashMap(SpatialDataStructure):
     def get_in_aabb(self, aabb: AABB, limit: Optional[int] = None) -> list[SpatialLike]:
         cell_coords = self._cell_coords_from_aabb(aabb)
         items = []
+        seen = set()
         for cell_coord in cell_coords:
             if cell_coord in self.map:
                 for item in self.map[cell_coord]:
@@ -225,10 +227,10 @@ class SpatialHashMap(SpatialDataStructure):
                         if limit is not None and len(items) >= limit:
                             break
                         # Make sure we dont add the same item multiple times if
-                        # it is spread across multiple cells
-                        try:
-                            items.index(item)
-                        except ValueError:
+                        # it is spread across multiple cells (by identity, as
+                        # items in different groups can compare equal)
+                        if id(item) not in seen:
+                            seen.add(id(item))
                             items.append(item)
 
         return items
@@ -133,6 +133,11 @@ class Tile(SpatialLike, Exportable):
             and self.global_position == other.global_position
         )
 
+    def _export_cache_token(self) -> tuple[int, int]:
+        # Exported position depends on the position of any parent groups
+        position = self.global_position
+        return (position.x, position.y)
+
     def merge(self, other: "Tile"):
         """
         Merges this tile with another one. Due to the simplicity of tiles, this
@@ -168,6 +168,8 @@ class TileList(Exportable, MutableSequence):
     A list which exclusively contains Factorio tiles.
     """
 
+    _export_cacheable = False
+
     # FIXME: I would like to annotate this, but cattrs cannot find the location of `Collection`
     _parent = attrs.field(
         default=None,
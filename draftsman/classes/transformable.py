@@ -113,7 +113,7 @@ class Transformable:
 
             # Alter the direction
             if entity.rotatable:
-                entity.direction += angle
+                entity.direction = (entity.direction + angle) % 16
             # Alter (both) the position(s)
             entity.position = (
                 pos.x * matrix[0] + pos.y * matrix[2],
@@ -0,0 +1,168 @@
+-- encode.lua
+
+-- Serializes a Lua value into a single JSON string, so that large tables (like
+-- `data.raw`) can be passed to Python in one call and parsed in one pass,
+-- instead of crossing the Lua/Python boundary once for every key and value.
+--
+-- The output mirrors `convert_table_to_dict()` on the Python side:
+-- * Tables whose keys are all integers are encoded as arrays, with their values
+--   in `pairs()` order; empty tables are encoded as empty arrays.
+-- * Integral numbers are encoded as integers, and all other numbers with enough
+--   precision to round-trip exactly.
+-- * In any other table, number and boolean keys are encoded as strings starting
+--   with "\u0000" followed by "n" or "b" and the key's value, so that they can
+--   be restored on the Python side. Keys of any other type are omitted.
+-- * Functions, userdata and threads are encoded as `null`.
+--
+-- Returns the encoded string, and whether or not any keys had to be tagged.
+
+local concat = table.concat
+local floor = math.floor
+local format = string.format
+local gsub = string.gsub
+local huge = math.huge
+local pairs = pairs
+local tostring = tostring
+local type = type
+
+local MAX_INTEGER = 2^63
+
+local buffer, size, tagged
+
+local escapes = { ['"'] = '\\"', ['\\'] = '\\\\' }
+local function escape(char)
+    return escapes[char] or format("\\u%04x", char:byte())
+end
+
+-- Keys and many values (like types, flags, and filenames) are repeated
+-- throughout `data.raw`, so each encoded string and number is cached
+local strings, numbers
+
+local function encode_string(s)
+    local encoded = strings[s]
+    if encoded == nil then
+        encoded = '"' .. gsub(s, '[%c"\\]', escape) .. '"'
+        strings[s] = encoded
+    end
+    return encoded
+end
+
+local function is_integer(n)
+    return n == floor(n) and n >= -MAX_INTEGER and n < MAX_INTEGER
+end
+
+local function encode_number(n)
+    if n ~= n then
+        return "NaN"
+    end
+    local encoded = numbers[n]
+    if encoded == nil then
+        if is_integer(n) then
+            encoded = format("%d", n)
+        elseif n == huge then
+            encoded = "Infinity"
+        elseif n == -huge then
+            encoded = "-Infinity"
+        else
+            encoded = format("%.17g", n)
+        end
+        numbers[n] = encoded
+    end
+    return encoded
+end
+
+-- Encodes a key along with its trailing colon
+local keys
+
+local function encode_key(key)
+    local encoded = keys[key]
+    if encoded == nil then
+        local key_type = type(key)
+        if key_type == "string" then
+            encoded = encode_string(key) .. ":"
+        elseif key_type == "number" then
+            encoded = encode_string("\0n" .. encode_number(key)) .. ":"
+        elseif key_type == "boolean" then
+            encoded = encode_string("\0b" .. tostring(key)) .. ":"
+        else
+            return nil
+        end
+        keys[key] = encoded
+    end
+    if type(key) ~= "string" then
+        tagged = true
+    end
+    return encoded
+end
+
+local encode_table
+
+local function encode_value(value)
+    local value_type = type(value)
+    if value_type == "table" then
+        encode_table(value)
+        return
+    end
+    local encoded
+    if value_type == "string" then
+        encoded = strings[value] or encode_string(value)
+    elseif value_type == "number" then
+        encoded = numbers[value] or encode_number(value)
+    elseif value_type == "boolean" then
+        encoded = value and "true" or "false"
+    else
+        encoded = "null"
+    end
+    size = size + 1
+    buffer[size] = encoded
+end
+
+function encode_table(t)
+    local is_array = true
+    for key in pairs(t) do
+        if type(key) ~= "number" or not is_integer(key) then
+            is_array = false
+            break
+        end
+    end
+
+    local separator = is_array and "[" or "{"
+    if is_array then
+        for _, value in pairs(t) do
+            size = size + 1
+            buffer[size] = separator
+            separator = ","
+            encode_value(value)
+        end
+    else
+        for key, value in pairs(t) do
+            local encoded_key = keys[key] or encode_key(key)
+            if encoded_key then
+                size = size + 1
+                buffer[size] = separator
+                separator = ","
+                size = size + 1
+                buffer[size] = encoded_key
+                encode_value(value)
+            end
+        end
+    end
+    -- Empty tables never replaced their opening bracket
+    size = size + 1
+    if separator == "[" then
+        buffer[size] = "[]"
+    elseif separator == "{" then
+        buffer[size] = "{}"
+    else
+        buffer[size] = is_array and "]" or "}"
+    end
+end
+
+return function(value)
+    buffer, size, tagged = {}, 0, false
+    strings, numbers, keys = {}, {}, {}
+    encode_value(value)
+    local result = concat(buffer, "", 1, size)
+    buffer, strings, numbers, keys = nil, nil, nil, nil
+    return result, tagged
+end
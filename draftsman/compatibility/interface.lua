@@ -264,6 +264,20 @@ function require(module_name)
     return result
 end
 
+-- Compiles a chunk of Lua source code. If Python registered a `ChunkCache`
+-- with `py_compile_chunk`, then a file which has already been compiled by a
+-- previous load (possibly in a different Lua instance) is loaded from its
+-- bytecode instead.
+local function load_chunk(contents, chunk_name)
+    if py_compile_chunk then
+        local bytecode = py_compile_chunk(contents, chunk_name)
+        if bytecode then
+            return load(bytecode, chunk_name, "b")
+        end
+    end
+    return load(contents, chunk_name)
+end
+
 -- Treat the current mod as an archive and look for files inside of it, 
 -- returning the file contents if found.
 local archive_searcher = function(module_name)
@@ -277,7 +291,7 @@ local archive_searcher = function(module_name)
         else
             source_name = norm_module_name
         end
-        return assert(load(contents, source_name .. ".lua"))
+        return assert(load_chunk(contents, source_name .. ".lua"))
     else
         return err
     end
@@ -318,7 +332,7 @@ local folder_searcher = function(module_name)
             end
 
             -- Compile and return the module
-            result = assert(load(file.read(), source_name .. ".lua"))
+            result = assert(load_chunk(file.read(), source_name .. ".lua"))
 
             file.close() -- make sure we close the file handle
             return result
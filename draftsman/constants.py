@@ -1029,6 +1029,36 @@ class ValidationMode(Enum):
         return NotImplemented
 
 
+@document_enum
+class CompressionLevel(IntEnum):
+    """
+    Common zlib compression level presets for exporting blueprint strings with
+    :py:meth:`.Blueprintable.to_string`. Any integer in the range ``[0, 9]`` is
+    also accepted.
+    """
+
+    NONE = 0
+    """
+    No compression at all. Only useful for debugging, as Factorio will still
+    accept the resulting (very large) string.
+    """
+    FAST = 1
+    """
+    The fastest compression preset. Best suited for very large blueprints or
+    books where export time matters more than the size of the string.
+    """
+    DEFAULT = 6
+    """
+    zlib's default compression level. Usually produces a string that is within
+    a few percent of ``BEST``, at a fraction of the cost.
+    """
+    BEST = 9
+    """
+    The smallest possible output, at the cost of the slowest export time. Used
+    by default in order to match the strings that Factorio itself produces.
+    """
+
+
 @document_enum
 class WireConnectorID(IntEnum):
     """
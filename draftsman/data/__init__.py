@@ -1 +1,685 @@
 # __init__.py
+
+"""
+Pickled Factorio data, extracted by ``draftsman update``.
+
+Most of the data modules in this package do not load their pickle files when
+they're imported; instead, each module-level value starts out as a
+:py:class:`LazyProxy` which loads the file the first time it is actually used.
+Once loaded, the proxies in the data module are swapped out for the real
+objects, so ``entities.raw`` is a plain ``dict`` from then on. Proxies which
+were imported by value (``from draftsman.data.entities import raw``) keep
+forwarding to the loaded object, so both styles of access behave identically.
+
+Processes which only need some of the data can declare which categories they
+use with :py:func:`configure` (or the ``DRAFTSMAN_DATA_LOAD`` environment
+variable), in which case accessing any other category raises a
+:py:class:`.DataNotLoadedError` instead of loading it.
+
+Multiple sets of data can be installed side by side as named profiles with
+``draftsman update --data-profile``, and switched between at runtime with
+:py:func:`set_profile` or :py:func:`use_profile`. Each profile's data is loaded
+once and kept, so switching back and forth does not read anything from disk.
+"""
+
+from draftsman.error import DataNotLoadedError
+
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from importlib.resources import files
+import mmap
+import os
+import pathlib
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
+import weakref
+
+
+_UNRESOLVED = object()
+
+# The names of all data modules which are loaded with `LazyData`
+categories = (
+    "entities",
+    "equipment",
+    "fluids",
+    "instruments",
+    "items",
+    "modules",
+    "planets",
+    "qualities",
+    "recipes",
+    "signals",
+    "tiles",
+)
+
+# The categories which are permitted to load, or `None` if all of them are
+_enabled_categories: Optional[frozenset[str]] = None
+
+# The name of the active data profile, or `None` for the installed data
+_profile: Optional[str] = None
+
+
+def configure(load: Optional[Iterable[str]] = None) -> None:
+    """
+    Sets which categories of data this process is permitted to load. Accessing
+    the data of any other category raises a :py:class:`.DataNotLoadedError`
+    instead of loading its pickle file, which keeps the memory footprint of
+    processes which only need a small amount of data to a minimum. Categories
+    which have already been loaded remain accessible.
+
+    Validation checks which need a category that isn't permitted to load (such
+    as checking the recipe of an assembling machine against ``recipes``, or the
+    name of a tile against ``tiles``) are skipped. Anything else which needs
+    that category still raises :py:class:`.DataNotLoadedError`, including
+    decoding a blueprint string: ``entities`` is needed to create any entity,
+    and ``signals`` to resolve signals given only by name.
+
+    The categories to load can also be specified before Draftsman is imported
+    with the ``DRAFTSMAN_DATA_LOAD`` environment variable, as a comma-separated
+    list of names.
+
+    .. doctest::
+
+        >>> from draftsman import data
+        >>> data.configure(load={"entities", "signals"})
+        >>> data.configure()  # Load everything again
+
+    :param load: The names of the data modules to permit loading, which must
+        each be one of :py:data:`categories`. ``None`` permits all of them.
+
+    :raises ValueError: If any of the names in ``load`` are not a category.
+    """
+    global _enabled_categories
+    if load is None:
+        _enabled_categories = None
+        return
+
+    load = frozenset(load)
+    unknown = load.difference(categories)
+    if unknown:
+        raise ValueError(
+            "Unknown data categories {}; must be any of {}".format(
+                sorted(unknown), categories
+            )
+        )
+    _enabled_categories = load
+
+
+def _configure_from_environment() -> None:
+    value = os.environ.get("DRAFTSMAN_DATA_LOAD", "").strip()
+    if value:
+        configure(load=(name.strip() for name in value.split(",") if name.strip()))
+
+
+class LazyData:
+    """
+    Loads a pickle file from this package on demand, and populates all of the
+    :py:class:`LazyProxy` objects created from it.
+
+    :param module_name: The name of the data module that owns the proxies, so
+        that they can be replaced with their real values once loaded.
+    :param filename: The name of the pickle file inside of ``draftsman.data``.
+    :param default: The data to use instead if the pickle file does not exist.
+    :param indexed: The location of the mapping inside the loaded data which
+        ``draftsman update --indexed`` may have written to a separate
+        :py:class:`IndexedStore` file, if any.
+    """
+
+    def __init__(
+        self,
+        module_name: str,
+        filename: str,
+        default: Any,
+        indexed: Optional[tuple] = None,
+    ):
+        self.module_name = module_name
+        self.category = module_name.rpartition(".")[2]
+        self.filename = filename
+        self.default = default
+        self.indexed = indexed
+        self._data = _UNRESOLVED
+        self._proxies: list[LazyProxy] = []
+        self._lock = threading.RLock()
+        # The names of the proxies in the owning module
+        self._bindings: dict[str, LazyProxy] = {}
+        # The profile `_data` was loaded from
+        self._profile: Optional[str] = _profile
+        # Loaded data and proxy targets of inactive profiles
+        self._profiles: dict[Optional[str], tuple[Any, list]] = {}
+        _loaders.add(self)
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether or not the pickle file has been loaded yet.
+        """
+        return self._data is not _UNRESOLVED
+
+    def proxy(
+        self,
+        *path: Any,
+        derive: Callable[[Any], Any] = None,
+        missing: Callable[[], Any] = None,
+    ) -> Any:
+        """
+        Creates a proxy for part of the loaded data.
+
+        :param path: A sequence of keys/indices to follow from the root of the
+            loaded data to the desired object.
+        :param derive: An optional function which is given the object at
+            ``path`` and returns the object to actually proxy, for values
+            which are computed from the pickled data instead of stored in it.
+        :param missing: An optional function which returns the value to use
+            if ``path`` does not exist in the loaded data, such as when the
+            data was written by an older version of Draftsman.
+        """
+        proxy = LazyProxy(self, path, derive, missing)
+        self._proxies.append(proxy)
+        return proxy
+
+    def load(self) -> Any:
+        """
+        Loads the pickle file (if it hasn't been already) and resolves every
+        proxy created from this object.
+
+        :returns: The unpickled data.
+        """
+        if self._data is not _UNRESOLVED:
+            return self._data
+
+        if (
+            _enabled_categories is not None
+            and self.category in categories
+            and self.category not in _enabled_categories
+        ):
+            raise DataNotLoadedError(
+                "Data category '{}' is not loaded in this process; enabled "
+                "categories are {} (see draftsman.data.configure())".format(
+                    self.category, sorted(_enabled_categories)
+                )
+            )
+
+        with self._lock:
+            if self._data is not _UNRESOLVED:  # pragma: no coverage
+                return self._data
+
+            try:
+                if self._profile is None:
+                    source = files(__name__) / self.filename
+                else:
+                    source = get_data_path(self.filename, self._profile)
+                with source.open("rb") as inp:
+                    data = pickle.load(inp)
+            except FileNotFoundError:  # pragma: no coverage
+                data = self.default
+
+            # If the mapping was written to an index store instead, the pickle
+            # file only contains a placeholder at its location
+            if self.indexed is not None and get_location(data, self.indexed) is None:
+                index_path = get_index_path(self.filename, self._profile)
+                data = set_location(data, self.indexed, IndexedStore(index_path))
+
+            for proxy in self._proxies:
+                try:
+                    proxy._resolve_from(data)
+                except (KeyError, IndexError):  # pragma: no coverage
+                    # Leave it unresolved; accessing it will raise the error
+                    pass
+
+            # Replace the proxies in the owning module with their actual values
+            # so that subsequent module attribute access has no overhead
+            module = sys.modules.get(self.module_name, None)
+            if module is not None:
+                for name, value in list(vars(module).items()):
+                    if isinstance(value, LazyProxy) and value._loader is self:
+                        self._bindings[name] = value
+                self._bind(module)
+
+            self._data = data
+
+        return data
+
+    def _bind(self, module) -> None:
+        for name, proxy in self._bindings.items():
+            target = object.__getattribute__(proxy, "_target")
+            setattr(module, name, proxy if target is _UNRESOLVED else target)
+
+    def _switch(self, profile: Optional[str]) -> None:
+        """
+        Makes ``profile`` the source of this object's data, restoring its
+        previously loaded data if there is any.
+        """
+        with self._lock:
+            if profile == self._profile:
+                return
+            if self._data is not _UNRESOLVED:
+                targets = [object.__getattribute__(p, "_target") for p in self._proxies]
+                self._profiles[self._profile] = (self._data, targets)
+
+            self._profile = profile
+            self._data, targets = self._profiles.pop(profile, (_UNRESOLVED, []))
+            for i, proxy in enumerate(self._proxies):
+                target = targets[i] if i < len(targets) else _UNRESOLVED
+                object.__setattr__(proxy, "_target", target)
+
+            module = sys.modules.get(self.module_name, None)
+            if module is not None:
+                self._bind(module)
+
+
+# All `LazyData` objects, so that they can be switched between profiles
+_loaders: "weakref.WeakSet[LazyData]" = weakref.WeakSet()
+
+
+def get_location(data: Any, location: tuple) -> Any:
+    """
+    Follows a sequence of keys/indices from ``data`` and returns the result.
+    """
+    for key in location:
+        data = data[key]
+    return data
+
+
+def set_location(data: Any, location: tuple, value: Any) -> Any:
+    """
+    Sets the object at ``location`` inside of ``data`` to ``value``. If
+    ``location`` is empty, ``value`` replaces ``data`` entirely.
+
+    :returns: The (possibly replaced) root object.
+    """
+    if len(location) == 0:
+        return value
+    get_location(data, location[:-1])[location[-1]] = value
+    return data
+
+
+def get_index_path(filename: str, profile: Optional[str] = None) -> str:
+    """
+    Gets the path to the :py:class:`IndexedStore` file which accompanies the
+    pickle file ``filename`` in this package, or in the data profile
+    ``profile`` if specified.
+    """
+    name = os.path.splitext(filename)[0] + ".idx"
+    if profile is None:
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    return str(get_data_path(name, profile))
+
+
+# =============================================================================
+# Profiles
+# =============================================================================
+
+
+def get_profiles_path() -> pathlib.Path:
+    """
+    Gets the folder which contains every named data profile, each in a
+    subfolder of the same name.
+    """
+    return pathlib.Path(__file__).resolve().parent.parent / "profiles"
+
+
+def get_data_path(filename: str, profile: str) -> pathlib.Path:
+    """
+    Gets the path to the data file ``filename`` of the data profile ``profile``.
+    """
+    return get_profiles_path() / profile / "data" / filename
+
+
+def list_profiles() -> list[str]:
+    """
+    Gets the names of all data profiles which have been written with
+    ``draftsman update --data-profile``, in alphabetical order.
+    """
+    try:
+        return sorted(
+            path.name
+            for path in get_profiles_path().iterdir()
+            if (path / "data").is_dir()
+        )
+    except FileNotFoundError:
+        return []
+
+
+def get_profile() -> Optional[str]:
+    """
+    Gets the name of the active data profile, or ``None`` if the data
+    installed in this package is active.
+    """
+    return _profile
+
+
+# Functions to call after the active profile changes
+_profile_callbacks: list[Callable[[], None]] = []
+
+# Held by `use_profile()` for its duration
+_profile_lock = threading.RLock()
+
+# Profiles which have been activated before, and therefore don't need to be
+# checked for on disk
+_known_profiles: set[Optional[str]] = {None}
+
+
+def on_profile_change(callback: Callable[[], None]) -> Callable[[], None]:
+    """
+    Registers a function to call whenever the active data profile changes,
+    typically one which clears a cache of values derived from the data. Can be
+    used as a decorator.
+    """
+    _profile_callbacks.append(callback)
+    return callback
+
+
+def set_profile(profile: Optional[str]) -> None:
+    """
+    Changes the data used by every module in this package to that of a named
+    data profile, as written by ``draftsman update --data-profile``. Each
+    profile's data is loaded the first time it's used and kept afterward, so
+    switching to a profile which has been used before does not touch the disk.
+
+    The active profile is global to the process. Data modules must be accessed
+    through their module (``entities.raw``) in order to observe the change;
+    objects which were imported by value after they were loaded continue to
+    refer to the data of the profile they were loaded from.
+
+    :param profile: The name of the profile to activate, or ``None`` to use the
+        data installed in this package.
+
+    :raises ValueError: If there is no profile with the name ``profile``.
+    """
+    global _profile
+    if profile not in _known_profiles:
+        if profile not in list_profiles():
+            raise ValueError(
+                "Unknown data profile '{}'; available profiles are {}".format(
+                    profile, list_profiles()
+                )
+            )
+        _known_profiles.add(profile)
+    with _profile_lock:
+        if profile == _profile:
+            return
+        for loader in list(_loaders):
+            loader._switch(profile)
+        _profile = profile
+        for callback in _profile_callbacks:
+            callback()
+
+
+@contextmanager
+def use_profile(profile: Optional[str]) -> Iterator[None]:
+    """
+    Context manager which activates a data profile for the duration of its
+    block, and restores the previous one afterward. Any Draftsman objects
+    created or modified inside the block use that profile's data. Other
+    threads entering ``use_profile()`` wait until the block is exited, so a
+    multi-threaded program can safely serve several profiles at once.
+
+    .. code-block:: python
+
+        with data.use_profile("space-age"):
+            blueprint = Blueprint(space_age_string)
+
+    :param profile: The name of the profile to activate, or ``None`` to use the
+        data installed in this package.
+
+    :raises ValueError: If there is no profile with the name ``profile``.
+    """
+    with _profile_lock:
+        previous = _profile
+        set_profile(profile)
+        try:
+            yield
+        finally:
+            set_profile(previous)
+
+
+# =============================================================================
+# Indexed stores
+# =============================================================================
+
+INDEX_MAGIC = b"DRFTINDX"
+_index_header = struct.Struct("<8sQQ")
+
+
+def write_indexed_store(path: str, mapping: Mapping[str, Any]) -> None:
+    """
+    Writes ``mapping`` to ``path`` in a format which can be opened with
+    :py:class:`IndexedStore`. Each value is pickled into its own record, and
+    the file ends with a table of the offset and size of each record, in the
+    same order as ``mapping``. The file is written atomically.
+
+    :param path: The location of the file to write.
+    :param mapping: The mapping to store. Values can be any picklable object.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(_index_header.pack(INDEX_MAGIC, 0, 0))
+            index = []
+            offset = _index_header.size
+            for key, value in mapping.items():
+                record = pickle.dumps(value, 5)
+                out.write(record)
+                index.append((key, offset, len(record)))
+                offset += len(record)
+            table = pickle.dumps(index, 5)
+            out.write(table)
+            out.seek(0)
+            out.write(_index_header.pack(INDEX_MAGIC, offset, len(table)))
+        # `mkstemp()` creates files only readable by the current user
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+class IndexedStore(MutableMapping):
+    """
+    A mapping backed by a memory-mapped file written with
+    :py:func:`write_indexed_store`. Only the table of keys is read when the
+    store is opened; each value is unpickled the first time it is accessed and
+    cached from then on. Because the file is mapped read-only, processes that
+    open the same store (or are forked after opening it) share its pages.
+
+    The store can be modified just like a ``dict``, though modifications only
+    exist in memory and are never written back to the file.
+
+    :param path: The location of the store to open.
+
+    :raises ValueError: If ``path`` is not an indexed store.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as inp:
+            self._mmap = mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, index_offset, index_length = _index_header.unpack_from(self._mmap)
+        except struct.error:
+            magic = None
+        if magic != INDEX_MAGIC:
+            self._mmap.close()
+            raise ValueError("'{}' is not an indexed store".format(path))
+        self.path = path
+        self._index: dict[str, tuple[int, int]] = {
+            key: (offset, length)
+            for key, offset, length in pickle.loads(
+                self._mmap[index_offset : index_offset + index_length]
+            )
+        }
+        # Decoded and user-assigned values
+        self._cache: dict[str, Any] = {}
+        # Keys which are not in the file, in the order they were added
+        self._added: dict[str, None] = {}
+        # Keys in the file which have been deleted
+        self._deleted: set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if key in self._deleted:
+            raise KeyError(key)
+        offset, length = self._index[key]
+        value = self._cache[key] = pickle.loads(self._mmap[offset : offset + length])
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._index:
+            self._added[key] = None
+        self._deleted.discard(key)
+        self._cache[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._cache.pop(key, None)
+        self._added.pop(key, None)
+        if key in self._index:
+            self._deleted.add(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._added or (key in self._index and key not in self._deleted)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._index:
+            if key not in self._deleted:
+                yield key
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        return len(self._index) - len(self._deleted) + len(self._added)
+
+    def __repr__(self) -> str:
+        return "<IndexedStore '{}' ({} entries, {} loaded)>".format(
+            self.path, len(self), len(self._cache)
+        )
+
+    def __reduce__(self):
+        # Copies and pickles are plain dicts; mapping the same file twice is
+        # rarely what's wanted
+        return (dict, (dict(self.items()),))
+
+
+# =============================================================================
+
+
+class LazyProxy:
+    """
+    Stand-in for a value from a :py:class:`LazyData` file which has not been
+    loaded yet. Loads the file on first use, and forwards all operations to the
+    loaded object afterwards. Reports the class of the loaded object, so
+    ``isinstance(proxy, dict)`` works as expected.
+    """
+
+    __slots__ = ("_loader", "_path", "_derive", "_missing", "_target")
+
+    def __init__(
+        self,
+        loader: LazyData,
+        path: tuple,
+        derive: Callable = None,
+        missing: Callable = None,
+    ):
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_derive", derive)
+        object.__setattr__(self, "_missing", missing)
+        object.__setattr__(self, "_target", _UNRESOLVED)
+
+    def _resolve_from(self, data: Any) -> Any:
+        try:
+            data = get_location(data, self._path)
+        except (KeyError, IndexError):
+            if self._missing is None:
+                raise
+            data = self._missing()
+        if self._derive is not None:
+            data = self._derive(data)
+        object.__setattr__(self, "_target", data)
+        return data
+
+    def _resolve(self) -> Any:
+        target = object.__getattribute__(self, "_target")
+        if target is _UNRESOLVED:
+            data = self._loader.load()
+            target = object.__getattribute__(self, "_target")
+            if target is _UNRESOLVED:  # pragma: no coverage
+                # Raise whatever error prevented resolution
+                target = self._resolve_from(data)
+        return target
+
+    @property
+    def __class__(self):
+        return type(self._resolve())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __bool__(self) -> bool:
+        return bool(self._resolve())
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __reduce_ex__(self, protocol):
+        return self._resolve().__reduce_ex__(protocol)
+
+
+def _forward(name: str):
+    def method(self, *args):
+        return getattr(self._resolve(), name)(*args)
+
+    method.__name__ = name
+    return method
+
+
+for _name in (
+    "__getitem__",
+    "__setitem__",
+    "__delitem__",
+    "__contains__",
+    "__len__",
+    "__reversed__",
+    "__hash__",
+    "__repr__",
+    "__str__",
+    "__format__",
+    "__eq__",
+    "__ne__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "__add__",
+    "__radd__",
+    "__iadd__",
+    "__mul__",
+    "__rmul__",
+    "__or__",
+    "__ror__",
+    "__ior__",
+    "__and__",
+    "__rand__",
+    "__iand__",
+    "__sub__",
+    "__rsub__",
+    "__isub__",
+    "__xor__",
+    "__rxor__",
+    "__ixor__",
+):
+    setattr(LazyProxy, _name, _forward(_name))
+del _name
+
+
+_configure_from_environment()
@@ -9,138 +9,158 @@
     environment as authoratative.
 """
 
-import pickle
-
-from importlib.resources import files
-
-from draftsman import data
+from draftsman.data import LazyData
 from draftsman.classes.collision_set import CollisionSet
 from draftsman.utils import PrimitiveAABB, AABB
 
 from typing import Optional
 
 
-try:
-    source = files(data) / "entities.pkl"
-    with source.open("rb") as inp:
-        _data: dict = pickle.load(inp)
-
-        # Aggregation of all the the entity dicts from data.raw collected in one
-        # place.
-        raw: dict[str, dict] = _data["raw"]
-
-        # A dictionary of entitiy names sorted by a particular prototype name,
-        # such as "container" or "assembling-machine".
-        of_type: dict[str, list[str]] = _data["of_type"]
-
-        # Whether or not each entity is flippable, indexed by their name.
-        flippable: dict[str, bool] = _data["flippable"]
-
-        # Indexes of unique collision sets for each entity. Shared between all
-        # entity instances, so we save memory by not including it in each Entity
-        # instance.
-        collision_sets: dict[str, CollisionSet] = _data["collision_sets"]
-
-        # Lists of strings, each containing a valid name for that entity type,
-        # sorted by their Factorio order strings.
-        accumulators: list[str] = of_type["accumulator"]
-        agricultural_towers: list[str] = of_type["agricultural-tower"]
-        ammo_turrets: list[str] = of_type["ammo-turret"]
-        arithmetic_combinators: list[str] = of_type["arithmetic-combinator"]
-        artillery_turrets: list[str] = of_type["artillery-turret"]
-        artillery_wagons: list[str] = of_type["artillery-wagon"]
-        assembling_machines: list[str] = of_type["assembling-machine"]
-        asteroid_collectors: list[str] = of_type["asteroid-collector"]
-        beacons: list[str] = of_type["beacon"]
-        boilers: list[str] = of_type["boiler"]
-        burner_generators: list[str] = of_type["burner-generator"]
-        cars: list[str] = of_type["car"]
-        cargo_bays: list[str] = of_type["cargo-bay"]
-        cargo_landing_pads: list[str] = of_type["cargo-landing-pad"]
-        cargo_wagons: list[str] = of_type["cargo-wagon"]
-        constant_combinators: list[str] = of_type["constant-combinator"]
-        containers: list[str] = of_type["container"]
-        curved_rails_a: list[str] = of_type["curved-rail-a"]
-        curved_rails_b: list[str] = of_type["curved-rail-b"]
-        decider_combinators: list[str] = of_type["decider-combinator"]
-        display_panels: list[str] = of_type["display-panel"]
-        electric_energy_interfaces: list[str] = of_type["electric-energy-interface"]
-        electric_poles: list[str] = of_type["electric-pole"]
-        electric_turrets: list[str] = of_type["electric-turret"]
-        elevated_curved_rails_a: list[str] = of_type["elevated-curved-rail-a"]
-        elevated_curved_rails_b: list[str] = of_type["elevated-curved-rail-b"]
-        elevated_half_diagonal_rails: list[str] = of_type["elevated-half-diagonal-rail"]
-        elevated_straight_rails: list[str] = of_type["elevated-straight-rail"]
-        fluid_turrets: list[str] = of_type["fluid-turret"]
-        fluid_wagons: list[str] = of_type["fluid-wagon"]
-        furnaces: list[str] = of_type["furnace"]
-        fusion_generators: list[str] = of_type["fusion-generator"]
-        fusion_reactors: list[str] = of_type["fusion-reactor"]
-        gates: list[str] = of_type["gate"]
-        generators: list[str] = of_type["generator"]
-        half_diagonal_rails: list[str] = of_type["half-diagonal-rail"]
-        heat_interfaces: list[str] = of_type["heat-interface"]
-        heat_pipes: list[str] = of_type["heat-pipe"]
-        infinity_containers: list[str] = of_type["infinity-container"]
-        infinity_pipes: list[str] = of_type["infinity-pipe"]
-        inserters: list[str] = of_type["inserter"]
-        labs: list[str] = of_type["lab"]
-        lamps: list[str] = of_type["lamp"]
-        land_mines: list[str] = of_type["land-mine"]
-        legacy_straight_rails: list[str] = of_type["legacy-straight-rail"]
-        legacy_curved_rails: list[str] = of_type["legacy-curved-rail"]
-        lightning_attractors: list[str] = of_type["lightning-attractor"]
-        linked_belts: list[str] = of_type["linked-belt"]
-        linked_containers: list[str] = of_type["linked-container"]
-        loaders: list[str] = of_type["loader"]
-        loaders_1x1: list[str] = of_type["loader-1x1"]
-        locomotives: list[str] = of_type["locomotive"]
-        # logistic_containers: list[str] = of_type["logistic-container"]
-        logistic_passive_containers: list[str] = of_type["logistic-container-passive"]
-        logistic_active_containers: list[str] = of_type["logistic-container-active"]
-        logistic_storage_containers: list[str] = of_type["logistic-container-storage"]
-        logistic_buffer_containers: list[str] = of_type["logistic-container-buffer"]
-        logistic_request_containers: list[str] = of_type["logistic-container-request"]
-        markets: list[str] = of_type["market"]
-        mining_drills: list[str] = of_type["mining-drill"]
-        offshore_pumps: list[str] = of_type["offshore-pump"]
-        pipes: list[str] = of_type["pipe"]
-        player_ports: list[str] = of_type["player-port"]
-        power_switches: list[str] = of_type["power-switch"]
-        programmable_speakers: list[str] = of_type["programmable-speaker"]
-        pumps: list[str] = of_type["pump"]
-        radars: list[str] = of_type["radar"]
-        rail_chain_signals: list[str] = of_type["rail-chain-signal"]
-        rail_ramps: list[str] = of_type["rail-ramp"]
-        rail_signals: list[str] = of_type["rail-signal"]
-        rail_supports: list[str] = of_type["rail-support"]
-        reactors: list[str] = of_type["reactor"]
-        roboports: list[str] = of_type["roboport"]
-        rocket_silos: list[str] = of_type["rocket-silo"]
-        selector_combinators: list[str] = of_type["selector-combinator"]
-        simple_entities_with_force: list[str] = of_type["simple-entity-with-force"]
-        simple_entities_with_owner: list[str] = of_type["simple-entity-with-owner"]
-        solar_panels: list[str] = of_type["solar-panel"]
-        space_platform_hubs: list[str] = of_type["space-platform-hub"]
-        spider_vehicles: list[str] = of_type["spider-vehicle"]
-        splitters: list[str] = of_type["splitter"]
-        storage_tanks: list[str] = of_type["storage-tank"]
-        straight_rails: list[str] = of_type["straight-rail"]
-        thrusters: list[str] = of_type["thruster"]
-        train_stops: list[str] = of_type["train-stop"]
-        transport_belts: list[str] = of_type["transport-belt"]
-        turrets: list[str] = of_type["turret"]
-        underground_belts: list[str] = of_type["underground-belt"]
-        underground_pipes: list[str] = of_type["pipe-to-ground"]
-        valves: list[str] = of_type["valve"]
-        walls: list[str] = of_type["wall"]
-
-
-except FileNotFoundError:  # pragma: no coverage
-    raw: dict[str, dict] = {}
-    of_type: dict[str, list[dict]] = {}
-    flippable: dict[str, bool] = {}
-    collision_sets: dict[str, CollisionSet] = {}
+_lazy = LazyData(
+    __name__,
+    "entities.pkl",
+    default={
+        "raw": {},
+        "of_type": {},
+        "flippable": {},
+        "collision_sets": {},
+        "rotated_collision_sets": {},
+    },
+    indexed=("raw",),
+)
+
+# Aggregation of all the the entity dicts from data.raw collected in one place.
+raw: dict[str, dict] = _lazy.proxy("raw")
+
+# A dictionary of entitiy names sorted by a particular prototype name, such as
+# "container" or "assembling-machine".
+of_type: dict[str, list[str]] = _lazy.proxy("of_type")
+
+# Whether or not each entity is flippable, indexed by their name.
+flippable: dict[str, bool] = _lazy.proxy("flippable")
+
+# Indexes of unique collision sets for each entity. Shared between all entity
+# instances, so we save memory by not including it in each Entity instance.
+collision_sets: dict[str, CollisionSet] = _lazy.proxy("collision_sets")
+
+# The collision set of each entity for every direction it can face, precomputed
+# by `draftsman update`. Only used by entity classes which rotate their collision
+# sets with the default rules; see `DirectionalMixin`.
+rotated_collision_sets: dict[str, dict[int, CollisionSet]] = _lazy.proxy(
+    "rotated_collision_sets", missing=dict
+)
+
+# Lists of strings, each containing a valid name for that entity type, sorted by
+# their Factorio order strings.
+accumulators: list[str] = _lazy.proxy("of_type", "accumulator")
+agricultural_towers: list[str] = _lazy.proxy("of_type", "agricultural-tower")
+ammo_turrets: list[str] = _lazy.proxy("of_type", "ammo-turret")
+arithmetic_combinators: list[str] = _lazy.proxy("of_type", "arithmetic-combinator")
+artillery_turrets: list[str] = _lazy.proxy("of_type", "artillery-turret")
+artillery_wagons: list[str] = _lazy.proxy("of_type", "artillery-wagon")
+assembling_machines: list[str] = _lazy.proxy("of_type", "assembling-machine")
+asteroid_collectors: list[str] = _lazy.proxy("of_type", "asteroid-collector")
+beacons: list[str] = _lazy.proxy("of_type", "beacon")
+boilers: list[str] = _lazy.proxy("of_type", "boiler")
+burner_generators: list[str] = _lazy.proxy("of_type", "burner-generator")
+cars: list[str] = _lazy.proxy("of_type", "car")
+cargo_bays: list[str] = _lazy.proxy("of_type", "cargo-bay")
+cargo_landing_pads: list[str] = _lazy.proxy("of_type", "cargo-landing-pad")
+cargo_wagons: list[str] = _lazy.proxy("of_type", "cargo-wagon")
+constant_combinators: list[str] = _lazy.proxy("of_type", "constant-combinator")
+containers: list[str] = _lazy.proxy("of_type", "container")
+curved_rails_a: list[str] = _lazy.proxy("of_type", "curved-rail-a")
+curved_rails_b: list[str] = _lazy.proxy("of_type", "curved-rail-b")
+decider_combinators: list[str] = _lazy.proxy("of_type", "decider-combinator")
+display_panels: list[str] = _lazy.proxy("of_type", "display-panel")
+electric_energy_interfaces: list[str] = _lazy.proxy(
+    "of_type", "electric-energy-interface"
+)
+electric_poles: list[str] = _lazy.proxy("of_type", "electric-pole")
+electric_turrets: list[str] = _lazy.proxy("of_type", "electric-turret")
+elevated_curved_rails_a: list[str] = _lazy.proxy("of_type", "elevated-curved-rail-a")
+elevated_curved_rails_b: list[str] = _lazy.proxy("of_type", "elevated-curved-rail-b")
+elevated_half_diagonal_rails: list[str] = _lazy.proxy(
+    "of_type", "elevated-half-diagonal-rail"
+)
+elevated_straight_rails: list[str] = _lazy.proxy("of_type", "elevated-straight-rail")
+fluid_turrets: list[str] = _lazy.proxy("of_type", "fluid-turret")
+fluid_wagons: list[str] = _lazy.proxy("of_type", "fluid-wagon")
+furnaces: list[str] = _lazy.proxy("of_type", "furnace")
+fusion_generators: list[str] = _lazy.proxy("of_type", "fusion-generator")
+fusion_reactors: list[str] = _lazy.proxy("of_type", "fusion-reactor")
+gates: list[str] = _lazy.proxy("of_type", "gate")
+generators: list[str] = _lazy.proxy("of_type", "generator")
+half_diagonal_rails: list[str] = _lazy.proxy("of_type", "half-diagonal-rail")
+heat_interfaces: list[str] = _lazy.proxy("of_type", "heat-interface")
+heat_pipes: list[str] = _lazy.proxy("of_type", "heat-pipe")
+infinity_containers: list[str] = _lazy.proxy("of_type", "infinity-container")
+infinity_pipes: list[str] = _lazy.proxy("of_type", "infinity-pipe")
+inserters: list[str] = _lazy.proxy("of_type", "inserter")
+labs: list[str] = _lazy.proxy("of_type", "lab")
+lamps: list[str] = _lazy.proxy("of_type", "lamp")
+land_mines: list[str] = _lazy.proxy("of_type", "land-mine")
+legacy_straight_rails: list[str] = _lazy.proxy("of_type", "legacy-straight-rail")
+legacy_curved_rails: list[str] = _lazy.proxy("of_type", "legacy-curved-rail")
+lightning_attractors: list[str] = _lazy.proxy("of_type", "lightning-attractor")
+linked_belts: list[str] = _lazy.proxy("of_type", "linked-belt")
+linked_containers: list[str] = _lazy.proxy("of_type", "linked-container")
+loaders: list[str] = _lazy.proxy("of_type", "loader")
+loaders_1x1: list[str] = _lazy.proxy("of_type", "loader-1x1")
+locomotives: list[str] = _lazy.proxy("of_type", "locomotive")
+# logistic_containers: list[str] = _lazy.proxy("of_type", "logistic-container")
+logistic_passive_containers: list[str] = _lazy.proxy(
+    "of_type", "logistic-container-passive"
+)
+logistic_active_containers: list[str] = _lazy.proxy(
+    "of_type", "logistic-container-active"
+)
+logistic_storage_containers: list[str] = _lazy.proxy(
+    "of_type", "logistic-container-storage"
+)
+logistic_buffer_containers: list[str] = _lazy.proxy(
+    "of_type", "logistic-container-buffer"
+)
+logistic_request_containers: list[str] = _lazy.proxy(
+    "of_type", "logistic-container-request"
+)
+markets: list[str] = _lazy.proxy("of_type", "market")
+mining_drills: list[str] = _lazy.proxy("of_type", "mining-drill")
+offshore_pumps: list[str] = _lazy.proxy("of_type", "offshore-pump")
+pipes: list[str] = _lazy.proxy("of_type", "pipe")
+player_ports: list[str] = _lazy.proxy("of_type", "player-port")
+power_switches: list[str] = _lazy.proxy("of_type", "power-switch")
+programmable_speakers: list[str] = _lazy.proxy("of_type", "programmable-speaker")
+pumps: list[str] = _lazy.proxy("of_type", "pump")
+radars: list[str] = _lazy.proxy("of_type", "radar")
+rail_chain_signals: list[str] = _lazy.proxy("of_type", "rail-chain-signal")
+rail_ramps: list[str] = _lazy.proxy("of_type", "rail-ramp")
+rail_signals: list[str] = _lazy.proxy("of_type", "rail-signal")
+rail_supports: list[str] = _lazy.proxy("of_type", "rail-support")
+reactors: list[str] = _lazy.proxy("of_type", "reactor")
+roboports: list[str] = _lazy.proxy("of_type", "roboport")
+rocket_silos: list[str] = _lazy.proxy("of_type", "rocket-silo")
+selector_combinators: list[str] = _lazy.proxy("of_type", "selector-combinator")
+simple_entities_with_force: list[str] = _lazy.proxy(
+    "of_type", "simple-entity-with-force"
+)
+simple_entities_with_owner: list[str] = _lazy.proxy(
+    "of_type", "simple-entity-with-owner"
+)
+solar_panels: list[str] = _lazy.proxy("of_type", "solar-panel")
+space_platform_hubs: list[str] = _lazy.proxy("of_type", "space-platform-hub")
+spider_vehicles: list[str] = _lazy.proxy("of_type", "spider-vehicle")
+splitters: list[str] = _lazy.proxy("of_type", "splitter")
+storage_tanks: list[str] = _lazy.proxy("of_type", "storage-tank")
+straight_rails: list[str] = _lazy.proxy("of_type", "straight-rail")
+thrusters: list[str] = _lazy.proxy("of_type", "thruster")
+train_stops: list[str] = _lazy.proxy("of_type", "train-stop")
+transport_belts: list[str] = _lazy.proxy("of_type", "transport-belt")
+turrets: list[str] = _lazy.proxy("of_type", "turret")
+underground_belts: list[str] = _lazy.proxy("of_type", "underground-belt")
+underground_pipes: list[str] = _lazy.proxy("of_type", "pipe-to-ground")
+valves: list[str] = _lazy.proxy("of_type", "valve")
+walls: list[str] = _lazy.proxy("of_type", "wall")
 
 
 ALL_EFFECTS = {"speed", "productivity", "consumption", "pollution", "quality"}
@@ -219,6 +239,8 @@ def add_entity(
     raw[name].update(kwargs)
 
     # Update others
+    # Any precomputed collision sets are now out of date
+    rotated_collision_sets.pop(name, None)
     collision_sets[name] = CollisionSet(
         [
             AABB(
@@ -1,36 +1,28 @@
-import pickle
+from draftsman.data import LazyData
 
-from importlib.resources import files
 
-from draftsman import data
+_lazy = LazyData(__name__, "equipment.pkl", default=({},))
 
-try:
-    source = files(data) / "equipment.pkl"
-    with source.open("rb") as inp:
-        _data = pickle.load(inp)
-        grids: dict[str, dict] = _data[0]
-        """
-        Equipment grid definitions.
+grids: dict[str, dict] = _lazy.proxy(0)
+"""
+Equipment grid definitions.
 
-        :example:
+:example:
 
-        .. code-block:: python
+.. code-block:: python
 
-            from draftsman.data import equipment
-            print(equipment.grids["large-equipment-grid"])
+    from draftsman.data import equipment
+    print(equipment.grids["large-equipment-grid"])
 
-        .. code-block:: python
+.. code-block:: python
 
-            {
-                'equipment_categories': ['armor'], 
-                'type': 'equipment-grid', 
-                'name': 'large-equipment-grid', 
-                'width': 10, 
-                'height': 10
-            }
+    {
+        'equipment_categories': ['armor'], 
+        'type': 'equipment-grid', 
+        'name': 'large-equipment-grid', 
+        'width': 10, 
+        'height': 10
+    }
 
-        :meta hide-value:
-        """
-
-except FileNotFoundError:  # pragma: no coverage
-    grids: dict[str, dict] = {}
+:meta hide-value:
+"""
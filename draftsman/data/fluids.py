@@ -1,55 +1,47 @@
 # fluids.py
 
-import pickle
+from draftsman.data import LazyData
+from draftsman.error import InvalidFluidError
 
-from importlib.resources import files
 
-from draftsman import data
-from draftsman.error import InvalidFluidError
+_lazy = LazyData(__name__, "fluids.pkl", default=({},))
+
+raw: dict[str, dict] = _lazy.proxy(0)
+"""
+A dictionary where each key is the name of a known fluid and its value
+is it's ``data.raw`` prototype entry.
+
+:example:
+
+.. code-block:: python
+
+    import json
+    from draftsman.data import fluids
+    print(fluids.raw["petroleum-gas"])
+
+.. code-block:: python
+
+    {
+        "subgroup": "fluid",
+        "type": "fluid",
+        "name": "petroleum-gas",
+        "icon": "__base__/graphics/icons/fluid/petroleum-gas.png",
+        "base_color": [
+            0.3,
+            0.1,
+            0.3
+        ],
+        "default_temperature": 25,
+        "order": "a[fluid]-b[oil]-b[petroleum-gas]",
+        "flow_color": [
+            0.8,
+            0.8,
+            0.8
+        ]
+    }
 
-try:
-    source = files(data) / "fluids.pkl"
-    with source.open("rb") as inp:
-        _data = pickle.load(inp)
-        raw: dict[str, dict] = _data[0]
-        """
-        A dictionary where each key is the name of a known fluid and its value
-        is it's ``data.raw`` prototype entry.
-
-        :example:
-
-        .. code-block:: python
-
-            import json
-            from draftsman.data import fluids
-            print(fluids.raw["petroleum-gas"])
-
-        .. code-block:: python
-
-            {
-                "subgroup": "fluid",
-                "type": "fluid",
-                "name": "petroleum-gas",
-                "icon": "__base__/graphics/icons/fluid/petroleum-gas.png",
-                "base_color": [
-                    0.3,
-                    0.1,
-                    0.3
-                ],
-                "default_temperature": 25,
-                "order": "a[fluid]-b[oil]-b[petroleum-gas]",
-                "flow_color": [
-                    0.8,
-                    0.8,
-                    0.8
-                ]
-            }
-
-        :meta hide-value:
-        """
-
-except FileNotFoundError:  # pragma: no coverage
-    raw: dict[str, dict] = {}
+:meta hide-value:
+"""
 
 
 def add_fluid(name: str, order: str = None, **kwargs):
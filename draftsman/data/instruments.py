@@ -1,27 +1,16 @@
 # instruments.py
 
-import pickle
-
-from importlib.resources import files
-
-from draftsman import data
+from draftsman.data import LazyData
 from draftsman.data.entities import of_type
 
 # from draftsman.data.entities import programmable_speakers
 
 
-try:
-    source = files(data) / "instruments.pkl"
-    with source.open("rb") as inp:
-        _data: list = pickle.load(inp)
-        raw: dict[str, list[dict]] = _data[0]
-        index_of: dict[str, dict[str, dict[str, int]]] = _data[1]
-        name_of: dict[str, dict[int, dict[int, str]]] = _data[2]
+_lazy = LazyData(__name__, "instruments.pkl", default=({}, {}, {}))
 
-except FileNotFoundError:  # pragma: no coverage
-    raw = {}
-    index_of = {}
-    name_of = {}
+raw: dict[str, list[dict]] = _lazy.proxy(0)
+index_of: dict[str, dict[str, dict[str, int]]] = _lazy.proxy(1)
+name_of: dict[str, dict[int, dict[int, str]]] = _lazy.proxy(2)
 
 
 def add_instrument(
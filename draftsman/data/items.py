@@ -1,30 +1,20 @@
 # items.py
 
-import pickle
-
-from importlib.resources import files
-
-from draftsman import data
-from draftsman.data import recipes
+from draftsman.data import LazyData, recipes
 
 from math import floor
 from typing import Optional
 
 
-try:
-    source = files(data) / "items.pkl"
-    with source.open("rb") as inp:
-        _data = pickle.load(inp)
-        raw: dict[str, dict] = _data[0]
-        subgroups: dict[str, dict] = _data[1]
-        groups: dict[str, dict] = _data[2]
-        fuels: dict[str, set[str]] = _data[3]
-        all_fuel_items: set[str] = set(
-            item for category in fuels for item in fuels[category]
-        )
+_lazy = LazyData(__name__, "items.pkl", default=({}, {}, {}, {}))
 
-except FileNotFoundError:  # pragma: no coverage
-    pass
+raw: dict[str, dict] = _lazy.proxy(0)
+subgroups: dict[str, dict] = _lazy.proxy(1)
+groups: dict[str, dict] = _lazy.proxy(2)
+fuels: dict[str, set[str]] = _lazy.proxy(3)
+all_fuel_items: set[str] = _lazy.proxy(
+    3, derive=lambda fuels: set(item for category in fuels for item in fuels[category])
+)
 
 
 def add_group(name: str, order: str = "", subgroups=[], **kwargs):
@@ -1,16 +1,8 @@
 # mods.py
 
-import pickle
+from draftsman.data import LazyData
 
-from importlib.resources import files
 
-from draftsman import data
+_lazy = LazyData(__name__, "mods.pkl", default={})
 
-
-try:
-    source = files(data) / "mods.pkl"
-    with source.open("rb") as inp:
-        versions: dict[str, tuple] = pickle.load(inp)
-
-except FileNotFoundError:  # pragma: no coverage
-    versions = {}
+versions: dict[str, tuple] = _lazy.proxy()
@@ -1,25 +1,15 @@
 # modules.py
 
-import pickle
-
-from importlib.resources import files
-
-from draftsman import data, DEFAULT_FACTORIO_VERSION
-from draftsman.data import recipes, mods
+from draftsman import DEFAULT_FACTORIO_VERSION
+from draftsman.data import LazyData, recipes, mods
 
 from typing import Optional
 
 
-try:
-    source = files(data) / "modules.pkl"
-    with source.open("rb") as inp:
-        _data = pickle.load(inp)
-        raw: dict[str, dict] = _data[0]
-        categories: dict[str, list[str]] = _data[1]
+_lazy = LazyData(__name__, "modules.pkl", default=({}, {}))
 
-except FileNotFoundError:  # pragma: no coverage
-    raw = {}
-    categories = {}
+raw: dict[str, dict] = _lazy.proxy(0)
+categories: dict[str, list[str]] = _lazy.proxy(1)
 
 
 def add_module_category(name: str, order: str = ""):
@@ -1,21 +1,11 @@
 # planets.py
 
-import pickle
+from draftsman.data import LazyData
 
-from importlib.resources import files
 
-from draftsman import data
+_lazy = LazyData(__name__, "planets.pkl", default=({},))
 
-
-try:
-    source = files(data) / "planets.pkl"
-    with source.open("rb") as inp:
-        _data: dict = pickle.load(inp)
-
-        raw: dict[str, dict] = _data[0]
-
-except FileNotFoundError:  # pragma: no coverage
-    raw = {}
+raw: dict[str, dict] = _lazy.proxy(0)
 
 
 def get_surface_properties(surface_name: str) -> dict:
@@ -1,16 +1,8 @@
 # qualities.py
 
-import pickle
+from draftsman.data import LazyData
 
-from importlib.resources import files
-from draftsman import data
 
+_lazy = LazyData(__name__, "qualities.pkl", default=({},))
 
-try:
-    source = files(data) / "qualities.pkl"
-    with source.open("rb") as inp:
-        _data = pickle.load(inp)
-        raw: dict[str, dict] = _data[0]
-
-except FileNotFoundError:  # pragma: no coverage
-    raw: dict[str, dict] = {}
+raw: dict[str, dict] = _lazy.proxy(0)
@@ -1,28 +1,15 @@
 # recipes.py
 
-import pickle
-
-from importlib.resources import files
-
-# from draftsman import data
-from .. import data
-
+from draftsman.data import LazyData
 from draftsman.data.planets import get_surface_properties
 from draftsman.utils import passes_surface_conditions
 
 
-try:
-    source = files(data) / "recipes.pkl"
-    with source.open("rb") as inp:
-        _data = pickle.load(inp)
-        raw: dict[str, dict] = _data[0]
-        categories: dict[str, list[str]] = _data[1]
-        for_machine: dict[str, list[str]] = _data[2]
+_lazy = LazyData(__name__, "recipes.pkl", default=({}, {}, {}), indexed=(0,))
 
-except FileNotFoundError:  # pragma: no coverage
-    raw = {}
-    categories = {}
-    for_machine = {}
+raw: dict[str, dict] = _lazy.proxy(0)
+categories: dict[str, list[str]] = _lazy.proxy(1)
+for_machine: dict[str, list[str]] = _lazy.proxy(2)
 
 
 def add_recipe(name: str, ingredients: list[str], result: str, **kwargs):
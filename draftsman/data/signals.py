@@ -1,48 +1,43 @@
 # signals.py
 
-from draftsman import data
-from draftsman.data import entities, modules
+from draftsman.data import LazyData, entities, modules
 from draftsman.error import InvalidSignalError, InvalidMapperError
 
-import pickle
 from typing import Literal
 
-from importlib.resources import files
-
-
-try:
-    source = files(data) / "signals.pkl"
-    with source.open("rb") as inp:
-        _data = pickle.load(inp)
-
-        raw: dict[str, dict] = _data["raw"]
-
-        # Look up table for a particular signal's type
-        type_of: dict[str, list[str]] = _data["type_of"]
-
-        # Lists of signal names organized by their type for easy iteration
-        virtual: list[str] = _data["virtual"]
-        item: list[str] = _data["item"]
-        fluid: list[str] = _data["fluid"]
-        recipe: list[str] = _data["recipe"]
-        entity: list[str] = _data["entity"]
-        space_location: list[str] = _data["space-location"]
-        asteroid_chunk: list[str] = _data["asteroid-chunk"]
-        quality: list[str] = _data["quality"]
-        # hidden: list[str] = _data["hidden"]
-
-except FileNotFoundError:  # pragma: no coverage
-    raw = {}
-    type_of = {}
-
-    virtual = []
-    item = []
-    fluid = []
-    recipe = []
-    entity = []
-    space_location = []
-    asteroid_chunk = []
-    quality = []
+
+_lazy = LazyData(
+    __name__,
+    "signals.pkl",
+    default={
+        "raw": {},
+        "type_of": {},
+        "virtual": [],
+        "item": [],
+        "fluid": [],
+        "recipe": [],
+        "entity": [],
+        "space-location": [],
+        "asteroid-chunk": [],
+        "quality": [],
+    },
+)
+
+raw: dict[str, dict] = _lazy.proxy("raw")
+
+# Look up table for a particular signal's type
+type_of: dict[str, list[str]] = _lazy.proxy("type_of")
+
+# Lists of signal names organized by their type for easy iteration
+virtual: list[str] = _lazy.proxy("virtual")
+item: list[str] = _lazy.proxy("item")
+fluid: list[str] = _lazy.proxy("fluid")
+recipe: list[str] = _lazy.proxy("recipe")
+entity: list[str] = _lazy.proxy("entity")
+space_location: list[str] = _lazy.proxy("space-location")
+asteroid_chunk: list[str] = _lazy.proxy("asteroid-chunk")
+quality: list[str] = _lazy.proxy("quality")
+# hidden: list[str] = _data["hidden"]
 
 pure_virtual: list[str] = ["signal-everything", "signal-anything", "signal-each"]
 
@@ -1,19 +1,11 @@
 # tiles.py
 
-import pickle
+from draftsman.data import LazyData
 
-from importlib.resources import files
 
-from draftsman import data
+_lazy = LazyData(__name__, "tiles.pkl", default={}, indexed=())
 
-
-try:
-    source = files(data) / "tiles.pkl"
-    with source.open("rb") as inp:
-        raw: dict[str, dict] = pickle.load(inp)
-
-except FileNotFoundError:  # pragma: no coverage
-    raw = {}
+raw: dict[str, dict] = _lazy.proxy()
 
 
 def add_tile(name: str, collision_mask: set[str] = set()):
@@ -3,103 +3,199 @@
 """
 Entity alias module. Imports the base-class :py:class:`.Entity`, as well as
 all the prototypes in :py:mod:`draftsman.prototypes`.
+
+Prototype classes are imported lazily; each one is only created the first time
+it is accessed from this module (or requested by :py:func:`get_entity_class`),
+so programs only pay for the entity types they actually use.
 """
 
-# fmt: off
 from draftsman.classes.entity import Entity
-from draftsman.prototypes.accumulator import Accumulator, accumulators
-from draftsman.prototypes.agricultural_tower import AgriculturalTower, agricultural_towers
-from draftsman.prototypes.ammo_turret import AmmoTurret, ammo_turrets
-from draftsman.prototypes.arithmetic_combinator import ArithmeticCombinator, arithmetic_combinators
-from draftsman.prototypes.artillery_turret import ArtilleryTurret, artillery_turrets
-from draftsman.prototypes.artillery_wagon import ArtilleryWagon, artillery_wagons
-from draftsman.prototypes.assembling_machine import AssemblingMachine, assembling_machines
-from draftsman.prototypes.asteroid_collector import AsteroidCollector, asteroid_collectors
-from draftsman.prototypes.beacon import Beacon, beacons
-from draftsman.prototypes.boiler import Boiler, boilers
-from draftsman.prototypes.burner_generator import BurnerGenerator, burner_generators
-from draftsman.prototypes.car import Car, cars
-from draftsman.prototypes.cargo_bay import CargoBay, cargo_bays
-from draftsman.prototypes.cargo_landing_pad import CargoLandingPad, cargo_landing_pads
-from draftsman.prototypes.cargo_wagon import CargoWagon, cargo_wagons
-from draftsman.prototypes.constant_combinator import ConstantCombinator, constant_combinators
-from draftsman.prototypes.container import Container, containers
-from draftsman.prototypes.curved_rail_a import CurvedRailA, curved_rails_a
-from draftsman.prototypes.curved_rail_b import CurvedRailB, curved_rails_b
-from draftsman.prototypes.decider_combinator import DeciderCombinator, decider_combinators
-from draftsman.prototypes.display_panel import DisplayPanel, display_panels
-from draftsman.prototypes.electric_energy_interface import ElectricEnergyInterface, electric_energy_interfaces
-from draftsman.prototypes.electric_pole import ElectricPole, electric_poles
-from draftsman.prototypes.electric_turret import ElectricTurret, electric_turrets
-from draftsman.prototypes.elevated_curved_rail_a import ElevatedCurvedRailA, elevated_curved_rails_a
-from draftsman.prototypes.elevated_curved_rail_b import ElevatedCurvedRailB, elevated_curved_rails_b
-from draftsman.prototypes.elevated_half_diagonal_rail import ElevatedHalfDiagonalRail, elevated_half_diagonal_rails
-from draftsman.prototypes.elevated_straight_rail import ElevatedStraightRail, elevated_straight_rails
-from draftsman.prototypes.fluid_turret import FluidTurret, fluid_turrets
-from draftsman.prototypes.fluid_wagon import FluidWagon, fluid_wagons
-from draftsman.prototypes.furnace import Furnace, furnaces
-from draftsman.prototypes.fusion_generator import FusionGenerator, fusion_generators
-from draftsman.prototypes.fusion_reactor import FusionReactor, fusion_reactors
-from draftsman.prototypes.gate import Gate, gates
-from draftsman.prototypes.generator import Generator, generators
-from draftsman.prototypes.half_diagonal_rail import HalfDiagonalRail, half_diagonal_rails
-from draftsman.prototypes.heat_interface import HeatInterface, heat_interfaces
-from draftsman.prototypes.heat_pipe import HeatPipe, heat_pipes
-from draftsman.prototypes.infinity_container import InfinityContainer, infinity_containers
-from draftsman.prototypes.infinity_pipe import InfinityPipe, infinity_pipes
-from draftsman.prototypes.inserter import Inserter, inserters
-from draftsman.prototypes.lab import Lab, labs
-from draftsman.prototypes.lamp import Lamp, lamps
-from draftsman.prototypes.land_mine import LandMine, land_mines
-from draftsman.prototypes.legacy_curved_rail import LegacyCurvedRail, legacy_curved_rails
-from draftsman.prototypes.legacy_straight_rail import LegacyStraightRail, legacy_straight_rails
-from draftsman.prototypes.lightning_attractor import LightningAttractor, lightning_attractors
-from draftsman.prototypes.linked_belt import LinkedBelt, linked_belts
-from draftsman.prototypes.linked_container import LinkedContainer, linked_containers
-from draftsman.prototypes.loader import Loader, loaders
-# from draftsman.prototypes.loader_1x1 import Loader1x1, loaders_1x1
-from draftsman.prototypes.locomotive import Locomotive, locomotives
-from draftsman.prototypes.logistic_active_container import LogisticActiveContainer, logistic_active_containers
-from draftsman.prototypes.logistic_buffer_container import LogisticBufferContainer, logistic_buffer_containers
-from draftsman.prototypes.logistic_passive_container import LogisticPassiveContainer, logistic_passive_containers
-from draftsman.prototypes.logistic_request_container import LogisticRequestContainer, logistic_request_containers
-from draftsman.prototypes.logistic_storage_container import LogisticStorageContainer, logistic_storage_containers
-from draftsman.prototypes.mining_drill import MiningDrill, mining_drills
-from draftsman.prototypes.offshore_pump import OffshorePump, offshore_pumps
-from draftsman.prototypes.pipe import Pipe, pipes
-from draftsman.prototypes.player_port import PlayerPort, player_ports
-from draftsman.prototypes.power_switch import PowerSwitch, power_switches
-from draftsman.prototypes.programmable_speaker import ProgrammableSpeaker, programmable_speakers
-from draftsman.prototypes.pump import Pump, pumps
-from draftsman.prototypes.radar import Radar, radars
-from draftsman.prototypes.rail_chain_signal import RailChainSignal, rail_chain_signals
-from draftsman.prototypes.rail_ramp import RailRamp, rail_ramps
-from draftsman.prototypes.rail_signal import RailSignal, rail_signals
-from draftsman.prototypes.rail_support import RailSupport, rail_supports
-from draftsman.prototypes.reactor import Reactor, reactors
-from draftsman.prototypes.roboport import Roboport, roboports
-from draftsman.prototypes.rocket_silo import RocketSilo, rocket_silos
-from draftsman.prototypes.selector_combinator import SelectorCombinator, selector_combinators
-from draftsman.prototypes.simple_entity_with_force import SimpleEntityWithForce, simple_entities_with_force
-from draftsman.prototypes.simple_entity_with_owner import SimpleEntityWithOwner, simple_entities_with_owner
-from draftsman.prototypes.solar_panel import SolarPanel, solar_panels
-from draftsman.prototypes.space_platform_hub import SpacePlatformHub, space_platform_hubs
-from draftsman.prototypes.spider_vehicle import SpiderVehicle, spider_vehicles
-from draftsman.prototypes.splitter import Splitter, splitters
-from draftsman.prototypes.storage_tank import StorageTank, storage_tanks
-from draftsman.prototypes.straight_rail import StraightRail, straight_rails
-from draftsman.prototypes.thruster import Thruster, thrusters
-from draftsman.prototypes.train_stop import TrainStop, train_stops
-from draftsman.prototypes.transport_belt import TransportBelt, transport_belts
-from draftsman.prototypes.underground_belt import UndergroundBelt, underground_belts
-from draftsman.prototypes.underground_pipe import UndergroundPipe, underground_pipes
-from draftsman.prototypes.valve import Valve, valves
-from draftsman.prototypes.wall import Wall, walls
-# fmt: on
+from draftsman.data import entities
+from draftsman.data.entities import (
+    accumulators,
+    agricultural_towers,
+    ammo_turrets,
+    arithmetic_combinators,
+    artillery_turrets,
+    artillery_wagons,
+    assembling_machines,
+    asteroid_collectors,
+    beacons,
+    boilers,
+    burner_generators,
+    cars,
+    cargo_bays,
+    cargo_landing_pads,
+    cargo_wagons,
+    constant_combinators,
+    containers,
+    curved_rails_a,
+    curved_rails_b,
+    decider_combinators,
+    display_panels,
+    electric_energy_interfaces,
+    electric_poles,
+    electric_turrets,
+    elevated_curved_rails_a,
+    elevated_curved_rails_b,
+    elevated_half_diagonal_rails,
+    elevated_straight_rails,
+    fluid_turrets,
+    fluid_wagons,
+    furnaces,
+    fusion_generators,
+    fusion_reactors,
+    gates,
+    generators,
+    half_diagonal_rails,
+    heat_interfaces,
+    heat_pipes,
+    infinity_containers,
+    infinity_pipes,
+    inserters,
+    labs,
+    lamps,
+    land_mines,
+    legacy_curved_rails,
+    legacy_straight_rails,
+    lightning_attractors,
+    linked_belts,
+    linked_containers,
+    loaders,
+    locomotives,
+    logistic_active_containers,
+    logistic_buffer_containers,
+    logistic_passive_containers,
+    logistic_request_containers,
+    logistic_storage_containers,
+    mining_drills,
+    offshore_pumps,
+    pipes,
+    player_ports,
+    power_switches,
+    programmable_speakers,
+    pumps,
+    radars,
+    rail_chain_signals,
+    rail_ramps,
+    rail_signals,
+    rail_supports,
+    reactors,
+    roboports,
+    rocket_silos,
+    selector_combinators,
+    simple_entities_with_force,
+    simple_entities_with_owner,
+    solar_panels,
+    space_platform_hubs,
+    spider_vehicles,
+    splitters,
+    storage_tanks,
+    straight_rails,
+    thrusters,
+    train_stops,
+    transport_belts,
+    underground_belts,
+    underground_pipes,
+    valves,
+    walls,
+)
 
-from draftsman.data.entities import raw
+import importlib
+from typing import TYPE_CHECKING, Optional
 
-from typing import Optional
+# Imported lazily at runtime by `__getattr__` below; imported here so that type
+# checkers, linters and IDEs can still see every prototype class
+if TYPE_CHECKING:  # pragma: no coverage
+    # fmt: off
+    from draftsman.prototypes.accumulator import Accumulator
+    from draftsman.prototypes.agricultural_tower import AgriculturalTower
+    from draftsman.prototypes.ammo_turret import AmmoTurret
+    from draftsman.prototypes.arithmetic_combinator import ArithmeticCombinator
+    from draftsman.prototypes.artillery_turret import ArtilleryTurret
+    from draftsman.prototypes.artillery_wagon import ArtilleryWagon
+    from draftsman.prototypes.assembling_machine import AssemblingMachine
+    from draftsman.prototypes.asteroid_collector import AsteroidCollector
+    from draftsman.prototypes.beacon import Beacon
+    from draftsman.prototypes.boiler import Boiler
+    from draftsman.prototypes.burner_generator import BurnerGenerator
+    from draftsman.prototypes.car import Car
+    from draftsman.prototypes.cargo_bay import CargoBay
+    from draftsman.prototypes.cargo_landing_pad import CargoLandingPad
+    from draftsman.prototypes.cargo_wagon import CargoWagon
+    from draftsman.prototypes.constant_combinator import ConstantCombinator
+    from draftsman.prototypes.container import Container
+    from draftsman.prototypes.curved_rail_a import CurvedRailA
+    from draftsman.prototypes.curved_rail_b import CurvedRailB
+    from draftsman.prototypes.decider_combinator import DeciderCombinator
+    from draftsman.prototypes.display_panel import DisplayPanel
+    from draftsman.prototypes.electric_energy_interface import ElectricEnergyInterface
+    from draftsman.prototypes.electric_pole import ElectricPole
+    from draftsman.prototypes.electric_turret import ElectricTurret
+    from draftsman.prototypes.elevated_curved_rail_a import ElevatedCurvedRailA
+    from draftsman.prototypes.elevated_curved_rail_b import ElevatedCurvedRailB
+    from draftsman.prototypes.elevated_half_diagonal_rail import ElevatedHalfDiagonalRail
+    from draftsman.prototypes.elevated_straight_rail import ElevatedStraightRail
+    from draftsman.prototypes.fluid_turret import FluidTurret
+    from draftsman.prototypes.fluid_wagon import FluidWagon
+    from draftsman.prototypes.furnace import Furnace
+    from draftsman.prototypes.fusion_generator import FusionGenerator
+    from draftsman.prototypes.fusion_reactor import FusionReactor
+    from draftsman.prototypes.gate import Gate
+    from draftsman.prototypes.generator import Generator
+    from draftsman.prototypes.half_diagonal_rail import HalfDiagonalRail
+    from draftsman.prototypes.heat_interface import HeatInterface
+    from draftsman.prototypes.heat_pipe import HeatPipe
+    from draftsman.prototypes.infinity_container import InfinityContainer
+    from draftsman.prototypes.infinity_pipe import InfinityPipe
+    from draftsman.prototypes.inserter import Inserter
+    from draftsman.prototypes.lab import Lab
+    from draftsman.prototypes.lamp import Lamp
+    from draftsman.prototypes.land_mine import LandMine
+    from draftsman.prototypes.legacy_curved_rail import LegacyCurvedRail
+    from draftsman.prototypes.legacy_straight_rail import LegacyStraightRail
+    from draftsman.prototypes.lightning_attractor import LightningAttractor
+    from draftsman.prototypes.linked_belt import LinkedBelt
+    from draftsman.prototypes.linked_container import LinkedContainer
+    from draftsman.prototypes.loader import Loader
+    from draftsman.prototypes.locomotive import Locomotive
+    from draftsman.prototypes.logistic_active_container import LogisticActiveContainer
+    from draftsman.prototypes.logistic_buffer_container import LogisticBufferContainer
+    from draftsman.prototypes.logistic_passive_container import LogisticPassiveContainer
+    from draftsman.prototypes.logistic_request_container import LogisticRequestContainer
+    from draftsman.prototypes.logistic_storage_container import LogisticStorageContainer
+    from draftsman.prototypes.mining_drill import MiningDrill
+    from draftsman.prototypes.offshore_pump import OffshorePump
+    from draftsman.prototypes.pipe import Pipe
+    from draftsman.prototypes.player_port import PlayerPort
+    from draftsman.prototypes.power_switch import PowerSwitch
+    from draftsman.prototypes.programmable_speaker import ProgrammableSpeaker
+    from draftsman.prototypes.pump import Pump
+    from draftsman.prototypes.radar import Radar
+    from draftsman.prototypes.rail_chain_signal import RailChainSignal
+    from draftsman.prototypes.rail_ramp import RailRamp
+    from draftsman.prototypes.rail_signal import RailSignal
+    from draftsman.prototypes.rail_support import RailSupport
+    from draftsman.prototypes.reactor import Reactor
+    from draftsman.prototypes.roboport import Roboport
+    from draftsman.prototypes.rocket_silo import RocketSilo
+    from draftsman.prototypes.selector_combinator import SelectorCombinator
+    from draftsman.prototypes.simple_entity_with_force import SimpleEntityWithForce
+    from draftsman.prototypes.simple_entity_with_owner import SimpleEntityWithOwner
+    from draftsman.prototypes.solar_panel import SolarPanel
+    from draftsman.prototypes.space_platform_hub import SpacePlatformHub
+    from draftsman.prototypes.spider_vehicle import SpiderVehicle
+    from draftsman.prototypes.splitter import Splitter
+    from draftsman.prototypes.storage_tank import StorageTank
+    from draftsman.prototypes.straight_rail import StraightRail
+    from draftsman.prototypes.thruster import Thruster
+    from draftsman.prototypes.train_stop import TrainStop
+    from draftsman.prototypes.transport_belt import TransportBelt
+    from draftsman.prototypes.underground_belt import UndergroundBelt
+    from draftsman.prototypes.underground_pipe import UndergroundPipe
+    from draftsman.prototypes.valve import Valve
+    from draftsman.prototypes.wall import Wall
+    # fmt: on
 
 # fmt: off
 __all__ = [
@@ -198,6 +294,215 @@ __all__ = [
 # fmt: on
 
 
+# The module in :py:mod:`draftsman.prototypes` that each prototype class is
+# defined in
+# fmt: off
+_prototype_modules: dict[str, str] = {
+    "Accumulator": "accumulator",
+    "AgriculturalTower": "agricultural_tower",
+    "AmmoTurret": "ammo_turret",
+    "ArithmeticCombinator": "arithmetic_combinator",
+    "ArtilleryTurret": "artillery_turret",
+    "ArtilleryWagon": "artillery_wagon",
+    "AssemblingMachine": "assembling_machine",
+    "AsteroidCollector": "asteroid_collector",
+    "Beacon": "beacon",
+    "Boiler": "boiler",
+    "BurnerGenerator": "burner_generator",
+    "Car": "car",
+    "CargoBay": "cargo_bay",
+    "CargoLandingPad": "cargo_landing_pad",
+    "CargoWagon": "cargo_wagon",
+    "ConstantCombinator": "constant_combinator",
+    "Container": "container",
+    "CurvedRailA": "curved_rail_a",
+    "CurvedRailB": "curved_rail_b",
+    "DeciderCombinator": "decider_combinator",
+    "DisplayPanel": "display_panel",
+    "ElectricEnergyInterface": "electric_energy_interface",
+    "ElectricPole": "electric_pole",
+    "ElectricTurret": "electric_turret",
+    "ElevatedCurvedRailA": "elevated_curved_rail_a",
+    "ElevatedCurvedRailB": "elevated_curved_rail_b",
+    "ElevatedHalfDiagonalRail": "elevated_half_diagonal_rail",
+    "ElevatedStraightRail": "elevated_straight_rail",
+    "FluidTurret": "fluid_turret",
+    "FluidWagon": "fluid_wagon",
+    "Furnace": "furnace",
+    "FusionGenerator": "fusion_generator",
+    "FusionReactor": "fusion_reactor",
+    "Gate": "gate",
+    "Generator": "generator",
+    "HalfDiagonalRail": "half_diagonal_rail",
+    "HeatInterface": "heat_interface",
+    "HeatPipe": "heat_pipe",
+    "InfinityContainer": "infinity_container",
+    "InfinityPipe": "infinity_pipe",
+    "Inserter": "inserter",
+    "Lab": "lab",
+    "Lamp": "lamp",
+    "LandMine": "land_mine",
+    "LegacyCurvedRail": "legacy_curved_rail",
+    "LegacyStraightRail": "legacy_straight_rail",
+    "LightningAttractor": "lightning_attractor",
+    "LinkedBelt": "linked_belt",
+    "LinkedContainer": "linked_container",
+    "Loader": "loader",
+    "Locomotive": "locomotive",
+    "LogisticActiveContainer": "logistic_active_container",
+    "LogisticBufferContainer": "logistic_buffer_container",
+    "LogisticPassiveContainer": "logistic_passive_container",
+    "LogisticRequestContainer": "logistic_request_container",
+    "LogisticStorageContainer": "logistic_storage_container",
+    "MiningDrill": "mining_drill",
+    "OffshorePump": "offshore_pump",
+    "Pipe": "pipe",
+    "PlayerPort": "player_port",
+    "PowerSwitch": "power_switch",
+    "ProgrammableSpeaker": "programmable_speaker",
+    "Pump": "pump",
+    "Radar": "radar",
+    "RailChainSignal": "rail_chain_signal",
+    "RailRamp": "rail_ramp",
+    "RailSignal": "rail_signal",
+    "RailSupport": "rail_support",
+    "Reactor": "reactor",
+    "Roboport": "roboport",
+    "RocketSilo": "rocket_silo",
+    "SelectorCombinator": "selector_combinator",
+    "SimpleEntityWithForce": "simple_entity_with_force",
+    "SimpleEntityWithOwner": "simple_entity_with_owner",
+    "SolarPanel": "solar_panel",
+    "SpacePlatformHub": "space_platform_hub",
+    "SpiderVehicle": "spider_vehicle",
+    "Splitter": "splitter",
+    "StorageTank": "storage_tank",
+    "StraightRail": "straight_rail",
+    "Thruster": "thruster",
+    "TrainStop": "train_stop",
+    "TransportBelt": "transport_belt",
+    "UndergroundBelt": "underground_belt",
+    "UndergroundPipe": "underground_pipe",
+    "Valve": "valve",
+    "Wall": "wall",
+}
+# fmt: on
+
+# The name of the prototype class associated with each entity type
+# fmt: off
+_type_mappings: dict[str | tuple[str, str], str] = {
+    "accumulator": "Accumulator",
+    "agricultural-tower": "AgriculturalTower",
+    "ammo-turret": "AmmoTurret",
+    "arithmetic-combinator": "ArithmeticCombinator",
+    "artillery-turret": "ArtilleryTurret",
+    "artillery-wagon": "ArtilleryWagon",
+    "assembling-machine": "AssemblingMachine",
+    "asteroid-collector": "AsteroidCollector",
+    "beacon": "Beacon",
+    "boiler": "Boiler",
+    "burner-generator": "BurnerGenerator",
+    "car": "Car",
+    "cargo-bay": "CargoBay",
+    "cargo-landing-pad": "CargoLandingPad",
+    "cargo-wagon": "CargoWagon",
+    "constant-combinator": "ConstantCombinator",
+    "container": "Container",
+    "curved-rail-a": "CurvedRailA",
+    "curved-rail-b": "CurvedRailB",
+    "decider-combinator": "DeciderCombinator",
+    "display-panel": "DisplayPanel",
+    "electric-energy-interface": "ElectricEnergyInterface",
+    "electric-pole": "ElectricPole",
+    "electric-turret": "ElectricTurret",
+    "elevated-curved-rail-a": "ElevatedCurvedRailA",
+    "elevated-curved-rail-b": "ElevatedCurvedRailB",
+    "elevated-half-diagonal-rail": "ElevatedHalfDiagonalRail",
+    "elevated-straight-rail": "ElevatedStraightRail",
+    "fluid-turret": "FluidTurret",
+    "fluid-wagon": "FluidWagon",
+    "furnace": "Furnace",
+    "fusion-generator": "FusionGenerator",
+    "fusion-reactor": "FusionReactor",
+    "gate": "Gate",
+    "generator": "Generator",
+    "half-diagonal-rail": "HalfDiagonalRail",
+    "heat-interface": "HeatInterface",
+    "heat-pipe": "HeatPipe",
+    "infinity-container": "InfinityContainer",
+    "infinity-pipe": "InfinityPipe",
+    "inserter": "Inserter",
+    "lab": "Lab",
+    "lamp": "Lamp",
+    "land-mine": "LandMine",
+    "legacy-curved-rail": "LegacyCurvedRail",
+    "legacy-straight-rail": "LegacyStraightRail",
+    "lightning-attractor": "LightningAttractor",
+    "linked-belt": "LinkedBelt",
+    "linked-container": "LinkedContainer",
+    "loader": "Loader",
+    "locomotive": "Locomotive",
+    ("logistic-container", "active-provider"): "LogisticActiveContainer",
+    ("logistic-container", "buffer"): "LogisticBufferContainer",
+    ("logistic-container", "passive-provider"): "LogisticPassiveContainer",
+    ("logistic-container", "requester"): "LogisticRequestContainer",
+    ("logistic-container", "storage"): "LogisticStorageContainer",
+    "mining-drill": "MiningDrill",
+    "offshore-pump": "OffshorePump",
+    "pipe": "Pipe",
+    "player-port": "PlayerPort",
+    "power-switch": "PowerSwitch",
+    "programmable-speaker": "ProgrammableSpeaker",
+    "pump": "Pump",
+    "radar": "Radar",
+    "rail-chain-signal": "RailChainSignal",
+    "rail-ramp": "RailRamp",
+    "rail-signal": "RailSignal",
+    "rail-support": "RailSupport",
+    "reactor": "Reactor",
+    "roboport": "Roboport",
+    "rocket-silo": "RocketSilo",
+    "selector-combinator": "SelectorCombinator",
+    "simple-entity-with-force": "SimpleEntityWithForce",
+    "simple-entity-with-owner": "SimpleEntityWithOwner",
+    "solar-panel": "SolarPanel",
+    "space-platform-hub": "SpacePlatformHub",
+    "spider-vehicle": "SpiderVehicle",
+    "splitter": "Splitter",
+    "storage-tank": "StorageTank",
+    "straight-rail": "StraightRail",
+    "train-stop": "TrainStop",
+    "transport-belt": "TransportBelt",
+    "underground-belt": "UndergroundBelt",
+    "pipe-to-ground": "UndergroundPipe",
+    "wall": "Wall",
+}
+# fmt: on
+
+
+def _load_prototype(class_name: str) -> type[Entity]:
+    """
+    Imports the prototype class ``class_name`` and caches it in this module's
+    namespace, so subsequent lookups bypass :py:func:`__getattr__` entirely.
+    """
+    module = importlib.import_module(
+        "draftsman.prototypes." + _prototype_modules[class_name]
+    )
+    cls = getattr(module, class_name)
+    globals()[class_name] = cls
+    return cls
+
+
+def __getattr__(name: str):
+    if name in _prototype_modules:
+        return _load_prototype(name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 def get_entity_class(name: str) -> type[Entity]:
     """
     Deduce the Draftsman :py:class:`Entity` subclass that this entity name would
@@ -205,100 +510,20 @@ def get_entity_class(name: str) -> type[Entity]:
     matches, it returns the base :py:class:`Entity` class itself.
     """
     # If input entity is entirely unknown, just return the base class
+    raw = entities.raw
     if name not in raw:
         return Entity
     # d_type = (raw[d["name"]]["type"], raw[d["name"]].get("logistic_mode"))
     d_type = raw[name]["type"]
     if d_type == "logistic-container":
         d_type = (d_type, raw[name]["logistic_mode"])
-    type_mappings = {
-        "accumulator": Accumulator,
-        "agricultural-tower": AgriculturalTower,
-        "ammo-turret": AmmoTurret,
-        "arithmetic-combinator": ArithmeticCombinator,
-        "artillery-turret": ArtilleryTurret,
-        "artillery-wagon": ArtilleryWagon,
-        "assembling-machine": AssemblingMachine,
-        "asteroid-collector": AsteroidCollector,
-        "beacon": Beacon,
-        "boiler": Boiler,
-        "burner-generator": BurnerGenerator,
-        "car": Car,
-        "cargo-bay": CargoBay,
-        "cargo-landing-pad": CargoLandingPad,
-        "cargo-wagon": CargoWagon,
-        "constant-combinator": ConstantCombinator,
-        "container": Container,
-        "curved-rail-a": CurvedRailA,
-        "curved-rail-b": CurvedRailB,
-        "decider-combinator": DeciderCombinator,
-        "display-panel": DisplayPanel,
-        "electric-energy-interface": ElectricEnergyInterface,
-        "electric-pole": ElectricPole,
-        "electric-turret": ElectricTurret,
-        "elevated-curved-rail-a": ElevatedCurvedRailA,
-        "elevated-curved-rail-b": ElevatedCurvedRailB,
-        "elevated-half-diagonal-rail": ElevatedHalfDiagonalRail,
-        "elevated-straight-rail": ElevatedStraightRail,
-        "fluid-turret": FluidTurret,
-        "fluid-wagon": FluidWagon,
-        "furnace": Furnace,
-        "fusion-generator": FusionGenerator,
-        "fusion-reactor": FusionReactor,
-        "gate": Gate,
-        "generator": Generator,
-        "half-diagonal-rail": HalfDiagonalRail,
-        "heat-interface": HeatInterface,
-        "heat-pipe": HeatPipe,
-        "infinity-container": InfinityContainer,
-        "infinity-pipe": InfinityPipe,
-        "inserter": Inserter,
-        "lab": Lab,
-        "lamp": Lamp,
-        "land-mine": LandMine,
-        "legacy-curved-rail": LegacyCurvedRail,
-        "legacy-straight-rail": LegacyStraightRail,
-        "lightning-attractor": LightningAttractor,
-        "linked-belt": LinkedBelt,
-        "linked-container": LinkedContainer,
-        "loader": Loader,
-        "locomotive": Locomotive,
-        ("logistic-container", "active-provider"): LogisticActiveContainer,
-        ("logistic-container", "buffer"): LogisticBufferContainer,
-        ("logistic-container", "passive-provider"): LogisticPassiveContainer,
-        ("logistic-container", "requester"): LogisticRequestContainer,
-        ("logistic-container", "storage"): LogisticStorageContainer,
-        "mining-drill": MiningDrill,
-        "offshore-pump": OffshorePump,
-        "pipe": Pipe,
-        "player-port": PlayerPort,
-        "power-switch": PowerSwitch,
-        "programmable-speaker": ProgrammableSpeaker,
-        "pump": Pump,
-        "radar": Radar,
-        "rail-chain-signal": RailChainSignal,
-        "rail-ramp": RailRamp,
-        "rail-signal": RailSignal,
-        "rail-support": RailSupport,
-        "reactor": Reactor,
-        "roboport": Roboport,
-        "rocket-silo": RocketSilo,
-        "selector-combinator": SelectorCombinator,
-        "simple-entity-with-force": SimpleEntityWithForce,
-        "simple-entity-with-owner": SimpleEntityWithOwner,
-        "solar-panel": SolarPanel,
-        "space-platform-hub": SpacePlatformHub,
-        "spider-vehicle": SpiderVehicle,
-        "splitter": Splitter,
-        "storage-tank": StorageTank,
-        "straight-rail": StraightRail,
-        "train-stop": TrainStop,
-        "transport-belt": TransportBelt,
-        "underground-belt": UndergroundBelt,
-        "pipe-to-ground": UndergroundPipe,
-        "wall": Wall,
-    }
-    return type_mappings.get(d_type, Entity)
+    class_name = _type_mappings.get(d_type, None)
+    if class_name is None:
+        return Entity
+    cls = globals().get(class_name, None)
+    if cls is None:
+        cls = _load_prototype(class_name)
+    return cls
 
 
 def new_entity(name: str, **kwargs) -> Entity:
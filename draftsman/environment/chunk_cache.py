@@ -0,0 +1,83 @@
+# chunk_cache.py
+
+"""
+Reuse of compiled Lua code between runs of the data lifecycle, for tools which
+build the data of several mod configurations in a row.
+
+Every call to :py:func:`.run_data_lifecycle` has to create a new Lua runtime,
+since Lua has no way of copying the state of one; and because the ``data``
+stage of ``base`` depends on the settings, the ``mods`` table and the feature
+flags of the configuration being built, it has to run again every time too.
+Most of the code it runs is made up of large table constructors however, which
+take several times longer to compile than to run. Passing the same
+:py:class:`ChunkCache` to each run compiles every file (``defines.lua``,
+``util.lua``, ``dataloader.lua``, and each file of each mod) only the first
+time it's loaded, and loads its bytecode directly every time after.
+"""
+
+import lupa.lua52 as lupa
+from typing import Optional
+
+
+class ChunkCache:
+    """
+    Cache of Lua chunks compiled to bytecode, which can be shared between any
+    number of Lua runtimes. Each chunk is keyed by both its name and its source
+    code, so a file which has changed since it was cached is compiled again.
+    """
+
+    def __init__(self):
+        # Compiled in a runtime of our own, which returns Lua strings as `bytes`
+        # instead of decoding them (which bytecode could never be decoded as)
+        self._compiler = lupa.LuaRuntime(encoding=None)
+        self._compile = self._compiler.eval(
+            """
+            function(source, name)
+                local chunk = load(source, name)
+                return chunk and string.dump(chunk)
+            end
+            """
+        )
+        self._chunks: dict[tuple[str, str], bytes] = {}
+        self.hits = 0
+        """
+        The number of chunks which have been loaded from the cache.
+        """
+        self.misses = 0
+        """
+        The number of chunks which have been compiled.
+        """
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def compile(self, source: str, name: str) -> Optional[bytes]:
+        """
+        Returns the bytecode of ``source`` compiled as the chunk ``name``, which
+        can be loaded by any Lua 5.2 runtime with ``load(bytecode, name, "b")``.
+        Stack traces and ``debug.getinfo()`` report the same source name as if
+        ``source`` had been loaded directly.
+
+        :param source: The Lua source code to compile.
+        :param name: The name of the chunk, as would be passed to ``load()``.
+
+        :returns: The bytecode of the chunk, or ``None`` if ``source`` has a
+            syntax error; load ``source`` itself to get the error message.
+        """
+        key = (name, source)
+        bytecode = self._chunks.get(key)
+        if bytecode is not None:
+            self.hits += 1
+            return bytecode
+
+        self.misses += 1
+        bytecode = self._compile(source.encode("utf-8"), name.encode("utf-8"))
+        if bytecode is not None:
+            self._chunks[key] = bytecode
+        return bytecode
+
+    def clear(self) -> None:
+        """
+        Removes every compiled chunk from the cache.
+        """
+        self._chunks.clear()
@@ -5,14 +5,23 @@ from draftsman.error import IncorrectModFormatError, MissingModError
 from draftsman.utils import version_string_to_tuple
 
 import attrs
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import io
 import json
 import os
+import posixpath
 import re
+import tempfile
 from typing import Optional
 import zipfile
 
 
+# Incremented whenever the format of the entries in the mod cache changes, so
+# that caches written by older versions are discarded instead of misread
+mod_cache_version = 1
+
+
 @attrs.define
 class Dependency:
     flag: str
@@ -42,6 +51,9 @@ class Mod:
         r"^(\!|\?|\(\?\)|~)?[^\w\?\!]*([\w-]+)([><=]=?)?([\d\.]+)?"
     )
 
+    # The number of decoded files each archived mod keeps
+    archive_cache_size = 32
+
     def __init__(
         self,
         # Path to the parent folder or archive file
@@ -112,14 +124,74 @@ class Mod:
         # Any extra information can be accessed here
         self.extra_info = kwargs
 
-    def setup_archive(self, archive: zipfile.ZipFile, archive_folder: str):
+    def setup_archive(self, archive: Optional[zipfile.ZipFile], archive_folder: str):
         """
-        Initialize the internal structure with archive data.
+        Initialize the internal structure with archive data. If ``archive`` is
+        ``None`` (such as when this mod's metadata was read from the mod
+        cache), the archive at :py:attr:`location` is only opened once its
+        contents are first needed.
         """
         self.is_archive = True
-        self.archive = archive
+        self._archive = archive
+        self._archive_index: Optional[dict[str, str]] = None
+        # Decoded files, most recently read last
+        self._archive_files: OrderedDict[str, str] = OrderedDict()
         self.archive_folder = archive_folder
 
+    @property
+    def archive(self) -> zipfile.ZipFile:
+        """
+        The opened archive of this mod. Opened on first access, if it wasn't
+        already open when this mod was registered.
+        """
+        if self._archive is None:
+            self._archive = zipfile.ZipFile(self.location, mode="r")
+        return self._archive
+
+    @property
+    def archive_index(self) -> dict[str, str]:
+        """
+        A mapping of the normalized path of every member of :py:attr:`archive`
+        to its actual name.
+        """
+        # Built once, so that finding a file never has to probe the archive
+        # itself
+        if self._archive_index is None:
+            self._archive_index = {
+                normalize_archive_path(name): name for name in self.archive.namelist()
+            }
+        return self._archive_index
+
+    def read_archive_file(self, filepath: str) -> str:
+        """
+        Grabs the contents of a file inside of this mod's archive as a string.
+        ``filepath`` is relative to the root of the archive (and so should
+        usually begin with :py:attr:`archive_folder`), and is normalized before
+        it is looked up.
+
+        :exception KeyError: If no file exists at ``filepath``.
+        """
+        name = self.archive_index[normalize_archive_path(filepath)]
+        return self.read_archive_member(name)
+
+    def read_archive_member(self, name: str) -> str:
+        """
+        Returns the contents of the member ``name`` of :py:attr:`archive` with
+        :py:func:`archive_to_string`, caching the decoded contents of the most
+        recently read files of this mod. Files of library mods are required
+        again by each mod that uses them, and are then only decompressed and
+        decoded once. The cache is released along with this mod.
+        """
+        contents = self._archive_files.get(name)
+        if contents is None:
+            contents = archive_to_string(self.archive, name)
+            self._archive_files[name] = contents
+            if len(self._archive_files) > self.archive_cache_size:
+                self._archive_files.popitem(last=False)
+        else:
+            self._archive_files.move_to_end(name)
+        return contents
+
     def setup_folder(self):
         """
         Initialize the internal structure with folder data.
@@ -147,7 +219,7 @@ class Mod:
         Grabs the data from the file as a string.
         """
         if self.is_archive:
-            return archive_to_string(self.archive, self.archive_folder + "/" + filepath)
+            return self.read_archive_file(self.archive_folder + "/" + filepath)
         else:
             return file_to_string(filepath=self.location + "/" + filepath)
 
@@ -185,6 +257,15 @@ def archive_to_string(archive: zipfile.ZipFile, filepath: str) -> str:
         return formatted_file.read()
 
 
+def normalize_archive_path(filepath: str) -> str:
+    """
+    Normalizes a path inside of an archive so that equivalent paths compare
+    equal, converting any backslashes to forward slashes and collapsing any
+    redundant separators and ``.`` or ``..`` components.
+    """
+    return posixpath.normpath(filepath.replace("\\", "/"))
+
+
 def read_mod_list_json(mods_path):
     """
     Simple wrapper to read from a `mod-list.json` file.
@@ -206,12 +287,164 @@ def write_mod_list_json(mods_path, json_dict):
         mod_list_file.write(fixed)
 
 
-def register_mod(mod_name, mod_location, mod_list_json={"mods": {}}):
+def read_mod_cache(cache_path: str) -> dict[str, dict]:
+    """
+    Reads the metadata of every mod archive stored in the mod cache at
+    ``cache_path``, keyed by the absolute path of each archive. Returns an
+    empty ``dict`` if the cache is missing, unreadable, or was written by an
+    incompatible version of this function.
+    """
+    try:
+        with open(cache_path, "r") as cache_file:
+            cache = json.load(cache_file)
+        if cache["version"] == mod_cache_version:
+            return cache["mods"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {}
+
+
+def write_mod_cache(cache_path: str, entries: dict[str, dict]) -> None:
+    """
+    Writes the metadata of each mod archive in ``entries`` to the mod cache at
+    ``cache_path``, creating its directory if it does not exist. The cache is
+    written to a temporary file and then swapped in, so that concurrent
+    processes never see a partially written cache.
+    """
+    cache_dir = os.path.dirname(os.path.abspath(cache_path))
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir)
+    try:
+        with os.fdopen(fd, "w") as temp_file:
+            json.dump({"version": mod_cache_version, "mods": entries}, temp_file)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def get_cached_archive(
+    cache: dict[str, dict], mod_location: str, stat: Optional[os.stat_result] = None
+) -> Optional[dict]:
+    """
+    Returns the cached metadata of the mod archive at ``mod_location``, or
+    ``None`` if it isn't in ``cache`` or if its size or modification time have
+    changed since it was cached.
+
+    :param stat: The result of ``os.stat(mod_location)``, if already known.
+    """
+    entry = cache.get(os.path.abspath(mod_location))
+    if entry is None:
+        return None
+    if stat is None:
+        stat = os.stat(mod_location)
+    if (entry["size"], entry["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+        return None
+    return entry
+
+
+def read_archive_metadata(
+    mod_name: str, folder_name: str, mod_location: str
+) -> tuple[zipfile.ZipFile, str, dict, set[str]]:
+    """
+    Opens the mod archive at ``mod_location`` and reads its metadata: the name
+    of the folder inside of it which contains the mod, the contents of its
+    ``info.json`` file, and which stage files (``data.lua``, etc.) it has.
+
+    :returns: A ``tuple`` of the opened archive, the internal folder name, the
+        parsed ``info.json``, and the ``set`` of stage files present.
+    """
+    files = zipfile.ZipFile(mod_location, mode="r")
+
+    # There is no restriction on the name of the internal folder, just
+    # that there is only one at the root of the archive
+    # All the mods I've seen use the same "mod-name_mod-version", but
+    # the wiki says this is not enforced
+    # Hence, we use this scuffed code to actually get a list of all the
+    # root-most directories
+    topdirs = set()
+    for file in files.namelist():
+        basename = None  # guards against UnboundLocalError
+        while file:
+            file, basename = os.path.split(file)
+        topdirs.add(basename)
+
+    # REVISION: sometimes there are multiple folders in a single archive
+    # (even though the wiki says only one); eg: "__MACOSX" in
+    # "Mining Drones Harder" mod (seems to be reserved file when
+    # compressing on Mac)
+    if len(topdirs) == 1:
+        # If there's one folder, use that
+        mod_folder = topdirs.pop()
+    elif folder_name in topdirs:
+        # If there's multiple, but one matches exactly, use that
+        mod_folder = folder_name
+    else:
+        # Try a case insensitive alphanumeric only comparison,
+        # and succeed if we get exactly one hit.
+        dirs = list(topdirs)
+        simplified_dirs = [re.sub(r"[^a-zA-Z0-9]", "", s).lower() for s in dirs]
+        simplified_foldername = re.sub(r"[^a-zA-Z0-9]", "", folder_name).lower()
+        if simplified_dirs.count(simplified_foldername) == 1:
+            # we want the original folder, so get the index.
+            index = simplified_dirs.index(simplified_foldername)
+            mod_folder = dirs[index]
+        else:
+            # Otherwise, who knows! Fix your mods or update the wiki!
+            # Why do I always get the short end of the stick!?
+            raise IncorrectModFormatError(
+                "Mod archive '{}' has more than one internal folder, and "
+                "none of the internal folders match it's external name".format(mod_name)
+            )
+
+    try:
+        # Zipfiles don't like backslashes on Windows, so we manually
+        # concatenate
+        mod_info = json.loads(archive_to_string(files, mod_folder + "/info.json"))
+    except KeyError:
+        raise IncorrectModFormatError(
+            "Mod '{}' has no 'info.json' file in its root folder".format(mod_name)
+        )
+
+    # Check which stage files are present
+    mod_stages = set()
+    for stage in (
+        "settings.lua",
+        "settings-updates.lua",
+        "settings-final-fixes.lua",
+        "data.lua",
+        "data-updates.lua",
+        "data-final-fixes.lua",
+    ):
+        try:
+            files.getinfo(mod_folder + "/" + stage)
+            mod_stages.add(stage)
+        except KeyError:
+            pass
+
+    return files, mod_folder, mod_info, mod_stages
+
+
+def register_mod(
+    mod_name,
+    mod_location,
+    mod_list_json={"mods": {}},
+    cache: Optional[dict[str, dict]] = None,
+):
     """
     Attempts to create a :py:class:`.Mod` object from the given folder or zip
     file. This function not only touches the archive or folder pointed to, but
     also determines whether or not it's enabled from the ``mod_list_json``
     parameter (if present).
+
+    If ``cache`` is given, the metadata of a zip file is taken from it instead
+    of from the archive itself, as long as the size and modification time of
+    the archive still match the ones it was cached with; the archive is then
+    only opened once its contents are needed. Otherwise, the metadata read
+    from the archive is added to ``cache``. Folders are always read directly,
+    since their modification time does not change when the files inside of
+    them are edited.
     """
 
     # external_mod_version = None  # Optional (the version indicated by filepath)
@@ -228,59 +461,32 @@ def register_mod(mod_name, mod_location, mod_list_json={"mods": {}}):
         folder_name = m.group(1)
         mod_name = m.group(2)
         # external_mod_version = m.group(3)
-        files = zipfile.ZipFile(mod_location, mode="r")
-
-        # There is no restriction on the name of the internal folder, just
-        # that there is only one at the root of the archive
-        # All the mods I've seen use the same "mod-name_mod-version", but
-        # the wiki says this is not enforced
-        # Hence, we use this scuffed code to actually get a list of all the
-        # root-most directories
-        topdirs = set()
-        for file in files.namelist():
-            basename = None  # guards against UnboundLocalError
-            while file:
-                file, basename = os.path.split(file)
-            topdirs.add(basename)
-
-        # REVISION: sometimes there are multiple folders in a single archive
-        # (even though the wiki says only one); eg: "__MACOSX" in
-        # "Mining Drones Harder" mod (seems to be reserved file when
-        # compressing on Mac)
-        if len(topdirs) == 1:
-            # If there's one folder, use that
-            mod_folder = topdirs.pop()
-        elif folder_name in topdirs:
-            # If there's multiple, but one matches exactly, use that
-            mod_folder = folder_name
-        else:
-            # Try a case insensitive alphanumeric only comparison,
-            # and succeed if we get exactly one hit.
-            dirs = list(topdirs)
-            simplified_dirs = [re.sub(r"[^a-zA-Z0-9]", "", s).lower() for s in dirs]
-            simplified_foldername = re.sub(r"[^a-zA-Z0-9]", "", folder_name).lower()
-            if simplified_dirs.count(simplified_foldername) == 1:
-                # we want the original folder, so get the index.
-                index = simplified_dirs.index(simplified_foldername)
-                mod_folder = dirs[index]
-            else:
-                # Otherwise, who knows! Fix your mods or update the wiki!
-                # Why do I always get the short end of the stick!?
-                raise IncorrectModFormatError(
-                    "Mod archive '{}' has more than one internal folder, and "
-                    "none of the internal folders match it's external name".format(
-                        mod_name
-                    )
-                )
 
-        try:
-            # Zipfiles don't like backslashes on Windows, so we manually
-            # concatenate
-            mod_info = json.loads(archive_to_string(files, mod_folder + "/info.json"))
-        except KeyError:
-            raise IncorrectModFormatError(
-                "Mod '{}' has no 'info.json' file in its root folder".format(mod_name)
+        entry = None
+        if cache is not None:
+            stat = os.stat(mod_location)
+            cache_key = os.path.abspath(mod_location)
+            entry = get_cached_archive(cache, mod_location, stat)
+
+        if entry is not None:
+            # The archive is unchanged since it was cached, so it doesn't need
+            # to be opened at all
+            files = None
+            mod_folder = entry["folder"]
+            mod_info = entry["info"]
+            mod_stages = set(entry["stages"])
+        else:
+            files, mod_folder, mod_info, mod_stages = read_archive_metadata(
+                mod_name, folder_name, mod_location
             )
+            if cache is not None:
+                cache[cache_key] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "folder": mod_folder,
+                    "info": mod_info,
+                    "stages": sorted(mod_stages),
+                }
 
         # mod_version = mod_info["version"]
         is_archive = True
@@ -343,31 +549,8 @@ def register_mod(mod_name, mod_location, mod_list_json={"mods": {}}):
         # registered
         # assert mod_factorio_version <= mods.versions["base"]
 
-    mod_stages = set()
-    if is_archive:
-        # Attempt to load any setting files present
-        settings_stages = (
-            "settings.lua",
-            "settings-updates.lua",
-            "settings-final-fixes.lua",
-        )
-        for stage in settings_stages:
-            try:
-                # mod_data[stage] = archive_to_string(files, mod_folder + "/" + stage)
-                files.getinfo(mod_folder + "/" + stage)
-                mod_stages.add(stage)
-            except KeyError:
-                pass
-        # Attempt to load any data files present
-        data_stages = ("data.lua", "data-updates.lua", "data-final-fixes.lua")
-        for stage in data_stages:
-            try:
-                # mod_data[stage] = archive_to_string(files, mod_folder + "/" + stage)
-                files.getinfo(mod_folder + "/" + stage)
-                mod_stages.add(stage)
-            except KeyError:
-                pass
-    else:  # folder
+    if not is_archive:
+        mod_stages = set()
         # Attempt to load any setting files present
         settings_stages = (
             "settings.lua",
@@ -420,7 +603,12 @@ def register_mod(mod_name, mod_location, mod_list_json={"mods": {}}):
 
 
 def discover_mods(
-    game_path: str, mods_path: str, no_mods: bool = False
+    game_path: str,
+    mods_path: str,
+    no_mods: bool = False,
+    cache_path: Optional[str] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
 ) -> dict[str, list[Mod]]:
     """
     Returns an list of all mods detected at a specific game data and mod folder
@@ -428,10 +616,27 @@ def discover_mods(
     multiples of the same mod found, the mods are sorted latest version first,
     preferring folders if there's a tie.
 
+    If ``cache_path`` is provided, the metadata read from each mod archive is
+    saved to a cache file at that path, keyed by the path, size, and
+    modification time of each archive. Later calls with the same cache (in
+    this or any other process) then reuse the metadata of every archive which
+    hasn't changed since, instead of opening each one and parsing its
+    ``info.json``. Archives which were removed from ``mods_path`` are removed
+    from the cache.
+
     :param game_path: Path to the directory which houses Factorio's game data.
     :param mods_path: Path the the directory which houses the desired user mods.
     :param no_mods: Omits any user mods found at ``mods_path``, while leaving
         game data untouched.
+    :param cache_path: Path to a file to cache the metadata of mod archives
+        in. The file (and its directory) is created if it does not exist. If
+        omitted, no cache is read or written.
+    :param parallel: Whether or not to read each mod in a thread pool. Reading
+        mods is mostly spent waiting on the filesystem, so this can be much
+        faster when there are many mods that aren't cached.
+    :param max_workers: The maximum number of threads to use when
+        ``parallel`` is ``True``. Defaults to the default of
+        :py:class:`concurrent.futures.ThreadPoolExecutor`.
     """
 
     # Check that our paths actually exist
@@ -447,14 +652,15 @@ def discover_mods(
         # Supply default
         mod_list_json = {"mods": {}}
 
-    # List of "mods". In Factorio parlance, a Mod is just a collection of files
-    # associated with one another, meaning that base-game components like `base`
-    # and `core` are also considered "mods", and as such are returned by this
-    # function.
-    # All found interpretable mods are added to this list, regardless of whether
-    # or not they are enabled or not. Any duplicate mods (same name, different
-    # version) are added to the list of mods with that name.
-    mod_list: dict[str, list[Mod]] = {}
+    if cache_path is not None:
+        cached_entries = read_mod_cache(cache_path)
+        cache = dict(cached_entries)
+    else:
+        cache = None
+
+    # Gather the name and location of every potential mod first, so that they
+    # can all be registered at once
+    candidates: list[tuple[str, str]] = []
 
     # Traverse the game-data folder to find Wube "mods", like `base` and `core`
     for game_obj in os.listdir(game_path):
@@ -464,16 +670,7 @@ def discover_mods(
         if not os.path.isdir(location):
             continue
 
-        # Add the mod to the list of mods
-        mod = register_mod(
-            mod_name=game_obj,
-            mod_location=location,
-            mod_list_json=mod_list_json,
-        )
-        if mod.name in mod_list:
-            mod_list[mod.name].append(mod)
-        else:
-            mod_list[mod.name] = [mod]
+        candidates.append((game_obj, location))
 
     # After that, we can register all of the regular mods, if present at path
     # and the no_mods flag is false
@@ -481,20 +678,68 @@ def discover_mods(
         for mod_obj in os.listdir(mods_path):
             location = os.path.join(mods_path, mod_obj)
 
-            # Only consider folders and zipfiles
-            if not os.path.isdir(location) and not zipfile.is_zipfile(location):
+            # Only consider folders and zipfiles (any archive which is unchanged
+            # since it was cached is known to be a zipfile already)
+            if (
+                not os.path.isdir(location)
+                and not (
+                    cache is not None
+                    and get_cached_archive(cache, location) is not None
+                )
+                and not zipfile.is_zipfile(location)
+            ):
                 continue
 
-            # Add the mod to the list of mods
-            mod = register_mod(
-                mod_name=mod_obj,
-                mod_location=location,
-                mod_list_json=mod_list_json,
-            )
-            if mod.name in mod_list:
-                mod_list[mod.name].append(mod)
-            else:
-                mod_list[mod.name] = [mod]
+            candidates.append((mod_obj, location))
+
+    def register(candidate: tuple[str, str]) -> Mod:
+        mod_name, location = candidate
+        return register_mod(
+            mod_name=mod_name,
+            mod_location=location,
+            mod_list_json=mod_list_json,
+            cache=cache,
+        )
+
+    if parallel:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            registered_mods = list(executor.map(register, candidates))
+    else:
+        registered_mods = [register(candidate) for candidate in candidates]
+
+    # List of "mods". In Factorio parlance, a Mod is just a collection of files
+    # associated with one another, meaning that base-game components like `base`
+    # and `core` are also considered "mods", and as such are returned by this
+    # function.
+    # All found interpretable mods are added to this list, regardless of whether
+    # or not they are enabled or not. Any duplicate mods (same name, different
+    # version) are added to the list of mods with that name.
+    mod_list: dict[str, list[Mod]] = {}
+    for mod in registered_mods:
+        if mod.name in mod_list:
+            mod_list[mod.name].append(mod)
+        else:
+            mod_list[mod.name] = [mod]
+
+    if cache is not None:
+        # Forget any archives which used to be in the mods folder but aren't
+        # anymore; entries from other mods folders are left alone
+        if not no_mods:
+            discovered = {os.path.abspath(location) for _, location in candidates}
+            mods_dir = os.path.abspath(mods_path)
+            for cache_key in list(cache):
+                if (
+                    os.path.dirname(cache_key) == mods_dir
+                    and cache_key not in discovered
+                ):
+                    del cache[cache_key]
+        if cache != cached_entries:
+            try:
+                write_mod_cache(cache_path, cache)
+            except OSError:
+                # The cache only makes discovery faster, so failing to write
+                # it (in a read-only installation, for example) is harmless
+                pass
 
     # Sort mods of different versions, preferring more modern ones. If two mods
     # of the same version are found and one is a folder, the folder is preferred
@@ -620,13 +865,20 @@ def set_mods_enabled(
     mod_names: list[str],
     enabled: bool = True,
     verbose: bool = False,
+    mod_cache_path: Optional[str] = None,
 ):
     """
     Sets a given list of mod names to be either enabled or disabled, based on
-    parameter ``enabled``.
+    parameter ``enabled``. ``mod_cache_path`` is passed to
+    :py:func:`discover_mods` as its ``cache_path``.
     """
     # Grab the mods at `game_path` and `mods_path`
-    mods = discover_mods(game_path=game_path, mods_path=mods_path)
+    mods = discover_mods(
+        game_path=game_path,
+        mods_path=mods_path,
+        cache_path=mod_cache_path,
+        parallel=True,
+    )
 
     # Grab the current `mod-list.json` (or get default if not present)
     try:
@@ -2,7 +2,6 @@
 
 from draftsman import DEFAULT_FACTORIO_VERSION
 from draftsman.data import mods
-from draftsman.utils import encode_version, decode_version
 
 from enum import IntEnum
 import io
@@ -27,77 +26,217 @@ ModSettings = TypedDict(
 )
 
 
-def decode_mod_settings(input_stream: io.BytesIO) -> ModSettings:
+_uint32 = struct.Struct("<I")
+_int64 = struct.Struct("<q")
+_uint64 = struct.Struct("<Q")
+_double = struct.Struct("<d")
+_version = struct.Struct("<4H")
+
+_unpack_uint32 = _uint32.unpack_from
+_unpack_int64 = _int64.unpack_from
+_unpack_uint64 = _uint64.unpack_from
+_unpack_double = _double.unpack_from
+
+# Comparing against plain ints is much faster than comparing against members of
+# `PropertyTreeType`, which adds up over thousands of nodes
+_NONE = PropertyTreeType.NONE.value
+_BOOL = PropertyTreeType.BOOL.value
+_NUMBER = PropertyTreeType.NUMBER.value
+_STRING = PropertyTreeType.STRING.value
+_LIST = PropertyTreeType.LIST.value
+_DICTIONARY = PropertyTreeType.DICTIONARY.value
+_SIGNED_INTEGER = PropertyTreeType.SIGNED_INTEGER.value
+_UNSIGNED_INTEGER = PropertyTreeType.UNSIGNED_INTEGER.value
+
+# The type byte of each node is followed by an "any type" flag, which is largely
+# internal to Factorio and is always written as 0
+_none_header = bytes((_NONE, 0))
+_bool_header = bytes((_BOOL, 0))
+_number_header = bytes((_NUMBER, 0))
+_string_header = bytes((_STRING, 0))
+_list_header = bytes((_LIST, 0))
+_dictionary_header = bytes((_DICTIONARY, 0))
+_signed_integer_header = bytes((_SIGNED_INTEGER, 0))
+_unsigned_integer_header = bytes((_UNSIGNED_INTEGER, 0))
+
+
+def _decode_string(buffer: memoryview, offset: int) -> tuple[str, int]:
+    # Strings start with a flag which is set if the string is empty
+    if buffer[offset]:
+        return "", offset + 1
+    # Lengths below 255 are stored in a single byte; otherwise that byte is 255
+    # and the length is stored in the following 4 bytes
+    length = buffer[offset + 1]
+    offset += 2
+    if length == 255:
+        length = _unpack_uint32(buffer, offset)[0]
+        offset += 4
+    end = offset + length
+    if end > len(buffer):
+        raise ValueError("String at offset {} is truncated".format(offset))
+    return str(buffer[offset:end], "utf-8"), end
+
+
+def decode_property_tree(
+    buffer: bytes | memoryview, offset: int = 0
+) -> tuple[None | bool | float | int | str | list | dict, int]:
+    """
+    Decodes a single PropertyTree node (and everything inside of it) from
+    ``buffer``, starting at ``offset``. Numbers are decoded as ``float``, and
+    both signed and unsigned integers as ``int``.
+
+    :param buffer: The encoded bytes to read from.
+    :param offset: The position in ``buffer`` the node starts at.
+
+    :returns: A ``tuple`` of the decoded value, and the position in ``buffer``
+        immediately after the node.
+
+    :exception ValueError: If the node has an unknown type, or is truncated.
     """
-    Reads a byte stream of a Factorio PropertyTree and decodes it into a JSON-
-    like ``dict``. Primarily used for decoding `mod-settings.dat`.
+    buffer = memoryview(buffer)
+    try:
+        return _decode_node(buffer, offset)
+    except (IndexError, struct.error):
+        raise ValueError("PropertyTree is truncated") from None
+
+
+def _decode_node(buffer: memoryview, offset: int):
+    data_type = buffer[offset]
+    offset += 2  # Skip the "any type" flag
+    # Ordered roughly by how common each type is in `mod-settings.dat`
+    if data_type == _DICTIONARY:
+        length = _unpack_uint32(buffer, offset)[0]
+        offset += 4
+        out = {}
+        for _ in range(length):
+            key, offset = _decode_string(buffer, offset)
+            out[key], offset = _decode_node(buffer, offset)
+        return out, offset
+    elif data_type == _STRING:
+        return _decode_string(buffer, offset)
+    elif data_type == _BOOL:
+        return buffer[offset] != 0, offset + 1
+    elif data_type == _NUMBER:
+        return _unpack_double(buffer, offset)[0], offset + 8
+    elif data_type == _LIST:
+        # Lists are stored the same way as dictionaries, but with every key
+        # empty
+        length = _unpack_uint32(buffer, offset)[0]
+        offset += 4
+        out = []
+        for _ in range(length):
+            _, offset = _decode_string(buffer, offset)
+            value, offset = _decode_node(buffer, offset)
+            out.append(value)
+        return out, offset
+    elif data_type == _SIGNED_INTEGER:
+        return _unpack_int64(buffer, offset)[0], offset + 8
+    elif data_type == _UNSIGNED_INTEGER:
+        return _unpack_uint64(buffer, offset)[0], offset + 8
+    elif data_type == _NONE:
+        return None, offset
+    else:
+        raise ValueError("Unknown PropertyTreeType ID '{}'".format(data_type))
+
+
+def decode_mod_settings(input_stream: io.BytesIO | bytes) -> ModSettings:
     """
-    # TODO: check endianness
-    # Grab version number
-    # We could return it, but it's not really useful...
-    version_num = struct.unpack("<Q", input_stream.read(8))[0]
-    _version = decode_version(version_num)[::-1]  # Reversed, for some reason
-
-    # Read dummy byte (must be 0)
-    header_flag = bool(struct.unpack("<?", input_stream.read(1))[0])
-    assert (
-        not header_flag
-    ), "mod-settings.dat header did not end with 0 byte, malformed input"
-
-    def read_string(binary_stream: io.BytesIO) -> str | None:
-        string_absent = bool(struct.unpack("<?", binary_stream.read(1))[0])
-        if string_absent:
-            return None
-
-        # Read a single byte of data; if it's < 255, then that's the length of
-        # our string.
-        length = struct.unpack("<B", binary_stream.read(1))[0]
-        # If it's == 255, then that means that the string length is actually
-        # encoded in the following 4 bytes:
-        if length == 255:
-            length = struct.unpack("<I", binary_stream.read(4))[0]
-
-        return binary_stream.read(length).decode()
-
-    # Read the data
-    def read_node(binary_stream: io.BytesIO) -> None | bool | float | str | list | dict:
-        # Read the signature byte to tell us what kind of node we're reading
-        data_type = struct.unpack("<B", binary_stream.read(1))[0]
-        # "Any type" flag, largely internal, ignore
-        binary_stream.read(1)
-        if data_type == PropertyTreeType.NONE:
-            return None
-        elif data_type == PropertyTreeType.BOOL:
-            value = bool(struct.unpack("<?", binary_stream.read(1))[0])
-            return value  # bool(struct.unpack("<?", binary_stream.read(1))[0])
-        elif data_type == PropertyTreeType.NUMBER:
-            value = struct.unpack("<d", binary_stream.read(8))[0]
-            return value
-        elif data_type == PropertyTreeType.STRING:
-            return read_string(binary_stream)
-        elif data_type == PropertyTreeType.LIST:
-            list_length = struct.unpack("<I", binary_stream.read(4))
-            out = list()
-            for _ in range(list_length):
-                out.append(read_node(binary_stream))
-            return out
-        elif data_type == PropertyTreeType.DICTIONARY:
-            dict_length = struct.unpack("<I", binary_stream.read(4))[0]
-            out = dict()
-            for _ in range(dict_length):
-                name = read_string(binary_stream)
-                value = read_node(binary_stream)
-                out[name] = value
-            return out
-        elif data_type == PropertyTreeType.SIGNED_INTEGER:
-            value = struct.unpack("<q", binary_stream.read(8))[0]
-            return value
-        elif data_type == PropertyTreeType.UNSIGNED_INTEGER:
-            value = struct.unpack("<Q", binary_stream)
-        else:
-            raise ValueError("Unknown PropertyTreeType ID '{}'".format(data_type))
+    Reads a byte stream (or an already read ``bytes`` object) of a Factorio
+    PropertyTree and decodes it into a JSON-like ``dict``. Primarily used for
+    decoding `mod-settings.dat`.
 
-    return read_node(input_stream)
+    :exception ValueError: If the input is malformed or truncated.
+    """
+    if isinstance(input_stream, (bytes, bytearray, memoryview)):
+        buffer = memoryview(input_stream)
+    else:
+        buffer = memoryview(input_stream.read())
+
+    # The file starts with the version of Factorio that wrote it; we could
+    # return it, but it's not really useful...
+    if len(buffer) < _version.size + 1:
+        raise ValueError("mod-settings.dat is too short, malformed input")
+
+    # Followed by a dummy byte (must be 0)
+    if buffer[_version.size] != 0:
+        raise ValueError(
+            "mod-settings.dat header did not end with 0 byte, malformed input"
+        )
+
+    value, _ = decode_property_tree(buffer, _version.size + 1)
+    return value
+
+
+def _encode_string(s: str, out: bytearray) -> None:
+    # Factorio never sets the empty flag itself, and writes empty strings with
+    # a length of 0 instead
+    data = s.encode()
+    length = len(data)
+    if length < 255:
+        out.append(0)
+        out.append(length)
+    else:
+        out += b"\x00\xff"
+        out += _uint32.pack(length)
+    out += data
+
+
+def encode_property_tree(
+    node: None | bool | float | int | str | list | dict, out: bytearray
+) -> None:
+    """
+    Encodes ``node`` (and everything inside of it) as a PropertyTree, and
+    appends it to ``out``. ``float`` values are encoded as numbers, and ``int``
+    values as signed integers, unless they're too large to fit in one, in
+    which case they are encoded as unsigned integers.
+
+    :exception TypeError: If ``node`` contains a value which cannot be
+        represented in a PropertyTree.
+    :exception ValueError: If ``node`` contains an ``int`` which is too large
+        to be represented in 64 bits.
+    """
+    if isinstance(node, dict):
+        out += _dictionary_header
+        out += _uint32.pack(len(node))
+        for key, value in node.items():
+            _encode_string(key, out)
+            encode_property_tree(value, out)
+    elif isinstance(node, str):
+        out += _string_header
+        _encode_string(node, out)
+    elif isinstance(node, bool):
+        out += _bool_header
+        out.append(node)
+    elif isinstance(node, float):
+        out += _number_header
+        out += _double.pack(node)
+    elif isinstance(node, int):
+        if node >= 1 << 63:
+            out += _unsigned_integer_header
+            packer = _uint64
+        else:
+            out += _signed_integer_header
+            packer = _int64
+        try:
+            out += packer.pack(node)
+        except struct.error:
+            raise ValueError(
+                "Integer {} is too large for a PropertyTree".format(node)
+            ) from None
+    elif isinstance(node, list):
+        out += _list_header
+        out += _uint32.pack(len(node))
+        for value in node:
+            out += b"\x00\x00"  # Every key of a list is empty
+            encode_property_tree(value, out)
+    elif node is None:
+        out += _none_header
+    else:
+        raise TypeError(
+            "Cannot encode object of type '{}' as a PropertyTree".format(
+                type(node).__name__
+            )
+        )
 
 
 def encode_mod_settings(
@@ -111,67 +250,15 @@ def encode_mod_settings(
     function is separate from the file creation step to allow for more
     flexibility, if desired.
     """
-    # TODO: check endianness
     if factorio_version is None:
         factorio_version = mods.versions.get("base", DEFAULT_FACTORIO_VERSION)
-    # Write version number
-    version_num = encode_version(*factorio_version)
-    destination.write(struct.pack("<Q"), version_num)
+    out = bytearray()
+    # Write version number, padded to all 4 components
+    out += _version.pack(*(tuple(factorio_version) + (0, 0, 0, 0))[:4])
     # Write empty header flag
-    destination.write(struct.pack("<?"), 0)
-
-    def write_string(s: str) -> None:
-        destination.write(struct.pack("<B", PropertyTreeType.STRING))
-        destination.write(struct.pack("<B", 0))  # "Any type" flag, dummy value
-
-        # Handle dynamic lengths
-        if len(s) >= 255:
-            destination.write(255)
-            destination.write(struct.pack("<I", len(s)))
-        else:
-            destination.write(struct.pack("<B", len(s)))
-
-        # Write the actual data
-        destination.write(s.encode())
-
-    def write_node(node: None | bool | float | str | list | dict) -> None:
-        if node is None:
-            destination.write(struct.pack("<B", PropertyTreeType.NONE))
-            destination.write(struct.pack("<B", 0))  # "Any type" flag, dummy value
-        elif type(node) is bool:
-            destination.write(struct.pack("<B", PropertyTreeType.BOOL))
-            destination.write(struct.pack("<B", 0))  # "Any type" flag, dummy value
-            destination.write(struct.pack("<B", node))
-        elif type(node) is float:
-            destination.write(struct.pack("<B", PropertyTreeType.NUMBER))
-            destination.write(struct.pack("<B", 0))  # "Any type" flag, dummy value
-            destination.write(struct.pack("<d", node))
-        elif type(node) is str:
-            write_string(node)
-        elif type(node) is list:
-            destination.write(struct.pack("<B", PropertyTreeType.LIST))
-            destination.write(struct.pack("<B", 0))  # "Any type" flag, dummy value
-            destination.write(struct.pack("<I", len(node)))
-            for elem in node:
-                write_node(elem)
-        elif type(dict) is dict:
-            destination.write(struct.pack("<B", PropertyTreeType.DICTIONARY))
-            destination.write(struct.pack("<B", 0))  # "Any type" flag, dummy value
-            destination.write(struct.pack("<I", len(node)))
-            for key, value in node.items():
-                write_string(key)
-                write_node(value)
-        elif type(node) is int:
-            destination.write(struct.pack("<B", PropertyTreeType.SIGNED_INTEGER))
-            destination.write(struct.pack("<B", 0))  # "Any type" flag, dummy value
-            destination.write(struct.pack("<q", node))
-
-        # TODO: there might be a problem with an unsigned int getting loaded by
-        # `decode_mod_settings` and getting coerced to a signed integer here;
-        # but these property types are so new I will kick that can down the
-        # proverbial road
-
-    write_node(property_tree)
+    out.append(0)
+    encode_property_tree(property_tree, out)
+    destination.write(out)
 
 
 def read_mod_settings(mods_path: str) -> ModSettings:
@@ -0,0 +1,176 @@
+# profiling.py
+
+"""
+Profiling of the data lifecycle run by ``draftsman update``, for finding out
+which mod (and which of its stages) makes an update slow. Pass a
+:py:class:`LifecycleProfile` to :py:func:`.update_draftsman_data` (or run
+``draftsman update --profile``) to record:
+
+* The wall time of each stage file run by each mod, along with the memory in
+  use by Lua after it finished, as reported by ``collectgarbage("count")``.
+  This includes any garbage which has not been collected yet, so the change in
+  memory of a single stage is only an estimate of how much it allocated.
+* The time spent in each step of extracting the data afterwards, including
+  each ``extract_*`` function.
+"""
+
+import attrs
+import contextlib
+import lupa.lua52 as lupa
+import time
+from typing import Iterator, Optional
+
+
+@attrs.define
+class StageProfile:
+    """
+    The measurements of a single stage file (like ``data-updates.lua``) run by
+    a single mod.
+    """
+
+    mod: str
+    """
+    The name of the mod which ran the stage.
+    """
+    stage: str
+    """
+    The filename of the stage.
+    """
+    seconds: float
+    """
+    The wall time the stage took to run.
+    """
+    memory: float
+    """
+    The memory in use by Lua after the stage finished, in KiB.
+    """
+    memory_change: float
+    """
+    The difference in memory in use by Lua from before the stage started, in
+    KiB.
+    """
+
+
+class LifecycleProfile:
+    """
+    Records the measurements of every stage of every mod while running the data
+    lifecycle, and the time spent extracting each category of data afterwards.
+    """
+
+    def __init__(self):
+        self.stages: list[StageProfile] = []
+        self.extraction: dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def measure(
+        self, lua: lupa.LuaRuntime, mod_name: str, stage: str
+    ) -> Iterator[None]:
+        """
+        Records the time and Lua memory taken by the code run inside of the
+        ``with`` block as the stage ``stage`` of the mod ``mod_name``.
+        """
+        # Lua 5.2 returns a second value with the remainder in bytes, which is
+        # discarded by the parentheses
+        memory_before = lua.eval('(collectgarbage("count"))')
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+        memory = lua.eval('(collectgarbage("count"))')
+        self.stages.append(
+            StageProfile(mod_name, stage, seconds, memory, memory - memory_before)
+        )
+
+    def get_mod_totals(self) -> dict[str, float]:
+        """
+        Returns the total time spent running the stages of each mod, slowest
+        mod first.
+        """
+        totals: dict[str, float] = {}
+        for stage in self.stages:
+            totals[stage.mod] = totals.get(stage.mod, 0.0) + stage.seconds
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def to_dict(self) -> dict:
+        """
+        Returns every measurement as a JSON-serializable ``dict``, with the
+        stages in the order they were run.
+        """
+        return {
+            "stages": [attrs.asdict(stage) for stage in self.stages],
+            "mods": self.get_mod_totals(),
+            "extraction": dict(self.extraction),
+        }
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """
+        Returns a human readable report of the profile, with the slowest stages,
+        mods and extraction steps listed first.
+
+        :param limit: The maximum number of stages and mods to list. Defaults
+            to listing all of them.
+        """
+        lines = []
+
+        stages = sorted(self.stages, key=lambda stage: stage.seconds, reverse=True)
+        lines.append("Slowest mod stages:")
+        if stages:
+            name_width = max(len(stage.mod) for stage in stages)
+            stage_width = max(len(stage.stage) for stage in stages)
+            lines.append(
+                "    {:>9}  {:<{}}  {:<{}}  {:>12}  {:>12}".format(
+                    "time",
+                    "mod",
+                    name_width,
+                    "stage",
+                    stage_width,
+                    "memory",
+                    "change",
+                )
+            )
+            for stage in stages[:limit]:
+                lines.append(
+                    "    {:>8.3f}s  {:<{}}  {:<{}}  {:>9.0f}KiB  {:>+9.0f}KiB".format(
+                        stage.seconds,
+                        stage.mod,
+                        name_width,
+                        stage.stage,
+                        stage_width,
+                        stage.memory,
+                        stage.memory_change,
+                    )
+                )
+
+        lines.append("Slowest mods:")
+        totals = list(self.get_mod_totals().items())
+        for mod_name, seconds in totals[:limit]:
+            lines.append("    {:>8.3f}s  {}".format(seconds, mod_name))
+
+        lines.append("Extraction:")
+        extraction = sorted(
+            self.extraction.items(), key=lambda item: item[1], reverse=True
+        )
+        for name, seconds in extraction:
+            lines.append("    {:>8.3f}s  {}".format(seconds, name))
+
+        total = sum(stage.seconds for stage in self.stages)
+        lines.append(
+            "Total: {:.3f}s running mods, {:.3f}s extracting".format(
+                total, sum(self.extraction.values())
+            )
+        )
+        return "\n".join(lines)
+
+
+def measure_stage(
+    profile: Optional[LifecycleProfile],
+    lua: lupa.LuaRuntime,
+    mod_name: str,
+    stage: str,
+) -> contextlib.AbstractContextManager:
+    """
+    Returns :py:meth:`LifecycleProfile.measure` for ``profile``, or a context
+    manager which does nothing if ``profile`` is ``None``.
+    """
+    if profile is None:
+        return contextlib.nullcontext()
+    return profile.measure(lua, mod_name, stage)
@@ -5,10 +5,13 @@ from draftsman._version import __version__
 
 from draftsman.environment.mod_list import discover_mods, display_mods, set_mods_enabled
 from draftsman.environment.mod_settings import read_mod_settings
+from draftsman.environment.profiling import LifecycleProfile
 from draftsman.environment.update import specify_factorio_version, update_draftsman_data
 
 import argparse
+import json
 import os
+from typing import Optional
 
 
 class DraftsmanCommandArgs(argparse.Namespace):
@@ -27,6 +30,11 @@ class DraftsmanCommandArgs(argparse.Namespace):
     owns: list[str]
     no_mods: bool
     no_dlc: bool
+    indexed: bool
+    data_profile: Optional[str]
+    force: bool
+    jobs: Optional[int]
+    profile: Optional[str]
     log: bool
 
 
@@ -40,6 +48,8 @@ def main():
 
     default_game_path = os.path.join(draftsman_install_folder, "factorio-data")
     default_mod_path = os.path.join(draftsman_install_folder, "factorio-mods")
+    # Reused by every command which discovers mods
+    mod_cache_path = os.path.join(draftsman_install_folder, "mod-cache.json")
 
     parser = argparse.ArgumentParser(
         prog="draftsman",
@@ -189,6 +199,52 @@ def main():
         "DLC content. Superceeds the `owns` argument; equivalent to setting "
         "`--owns` to an empty list.",
     )
+    update_command.add_argument(
+        "--indexed",
+        action="store_true",
+        help="Writes the prototype data of entities, recipes and tiles to "
+        "memory-mappable index files, so that each prototype is "
+        "only loaded when it is first used. Useful for large modpacks and "
+        "programs which use many worker processes.",
+    )
+    update_command.add_argument(
+        "--data-profile",
+        type=str,
+        default=None,
+        metavar="NAME",
+        help="Writes the extracted data to a named data profile alongside the "
+        "installed data instead of replacing it. Profiles can be switched "
+        "between at runtime with `draftsman.data.set_profile()`.",
+    )
+    update_command.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Runs the update even if the game version, mods, mod settings, "
+        "and owned DLC are all unchanged since the last update, which is "
+        "otherwise skipped.",
+    )
+    update_command.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="The number of worker processes to extract the data with once the "
+        "data lifecycle has finished. Defaults to the number of CPUs; `1` "
+        "extracts everything in a single process.",
+    )
+    update_command.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="FILE",
+        help="Records the time and Lua memory taken by each stage of each mod, "
+        "and the time taken to extract each category of data. The slowest "
+        "are printed once the update finishes, or if FILE is given, every "
+        "measurement is written to it as JSON instead.",
+    )
     update_command.add_argument(
         "-l",
         "--log",
@@ -231,7 +287,12 @@ def main():
             )
 
     elif args.operation == "list":
-        mod_list = discover_mods(args.game_path, args.mods_path)
+        mod_list = discover_mods(
+            args.game_path,
+            args.mods_path,
+            cache_path=mod_cache_path,
+            parallel=True,
+        )
         display_mods(mod_list, verbose=args.verbose)
 
     elif args.operation == "mod-settings":
@@ -270,25 +331,52 @@ def main():
 
     elif args.operation == "enable":
         set_mods_enabled(
-            args.game_path, args.mods_path, args.mod_names, True, args.verbose
+            args.game_path,
+            args.mods_path,
+            args.mod_names,
+            True,
+            args.verbose,
+            mod_cache_path=mod_cache_path,
         )
 
     elif args.operation == "disable":
         set_mods_enabled(
-            args.game_path, args.mods_path, args.mod_names, False, args.verbose
+            args.game_path,
+            args.mods_path,
+            args.mod_names,
+            False,
+            args.verbose,
+            mod_cache_path=mod_cache_path,
         )
 
     elif args.operation in "update":
         owned_dlc = [] if args.no_dlc else args.owns
-        update_draftsman_data(
+        profile = None if args.profile is None else LifecycleProfile()
+        updated = update_draftsman_data(
             game_path=args.game_path,
             mods_path=args.mods_path,
             owned_dlc=owned_dlc,
             no_mods=args.no_mods,
             verbose=args.verbose,
             show_logs=args.log,
+            indexed=args.indexed,
+            data_profile=args.data_profile,
+            force=args.force,
+            processes=args.jobs,
+            mod_cache_path=mod_cache_path,
+            profile=profile,
         )
 
+        if profile is not None:
+            if not updated:
+                print("Nothing was profiled, since the update was skipped.")
+                print("(Use `--force` to update anyway)")
+            elif args.profile:
+                with open(args.profile, "w") as profile_file:
+                    json.dump(profile.to_dict(), profile_file, indent=4)
+            else:
+                print(profile.report(limit=20))
+
 
 if __name__ == "__main__":
     main()
@@ -6,16 +6,27 @@
 # is annoying.
 
 from draftsman import DEFAULT_FACTORIO_VERSION, __file__ as draftsman_root_file
+from draftsman._version import __version__
 from draftsman.classes.collision_set import CollisionSet
+from draftsman.classes.mixins.directional import get_default_rotated_collision_sets
+from draftsman.data import (
+    get_index_path,
+    get_location,
+    get_profiles_path,
+    set_location,
+    write_indexed_store,
+)
 from draftsman.data.entities import add_entity
+from draftsman.environment.chunk_cache import ChunkCache
 from draftsman.environment.mod_list import (
     Mod,
     file_to_string,
-    archive_to_string,
+    normalize_archive_path,
     discover_mods,
     display_mods,
 )
 from draftsman.environment.mod_settings import read_mod_settings
+from draftsman.environment.profiling import LifecycleProfile, measure_stage
 from draftsman.error import (
     MissingModError,
     IncompatableModError,
@@ -27,11 +38,16 @@ import git
 import lupa.lua52 as lupa
 
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import hashlib
 import json
 import os
-import pathlib
 import pickle
 import re
+import shutil
+import tempfile
+import time
 from typing import Optional, Union
 
 
@@ -223,14 +239,49 @@ def specify_factorio_version(
             )
 
 
-def run_lua_file(lua: lupa.LuaRuntime, file: str, custom_name: str | None = None):
-    lua.execute(file_to_string(file), name=file if custom_name is None else custom_name)
+def execute_chunk(
+    lua: lupa.LuaRuntime,
+    source: str,
+    name: str | None = None,
+    chunk_cache: Optional[ChunkCache] = None,
+):
+    """
+    Runs ``source`` in ``lua`` as the chunk ``name``. If ``chunk_cache`` is
+    given, the chunk is loaded from the bytecode it compiled for a previous run
+    instead of being compiled again.
+    """
+    if chunk_cache is not None:
+        # Named the same as `LuaRuntime.execute()` names unnamed chunks
+        chunk_name = "<python>" if name is None else name
+        bytecode = chunk_cache.compile(source, chunk_name)
+        if bytecode is not None:
+            return lua.globals().load(bytecode, chunk_name, "b")()
+    # Syntax errors are always reported by compiling the source here
+    return lua.execute(source, name=name)
+
+
+def run_lua_file(
+    lua: lupa.LuaRuntime,
+    file: str,
+    custom_name: str | None = None,
+    chunk_cache: Optional[ChunkCache] = None,
+):
+    execute_chunk(
+        lua,
+        file_to_string(file),
+        name=file if custom_name is None else custom_name,
+        chunk_cache=chunk_cache,
+    )
 
 
 def py_get_source_lines(mods_list: dict[str, Mod]):
     # We need access to the mods list, but we don't have that information on the
     # Lua side. We pass a reference to it during the `run_data_lifecycle` part
     # instead and generate the function like a decorator.
+    rename = re.compile(r"__([\w-]+)__")
+    # Archived mods by location, so that finding the archive a module belongs
+    # to doesn't have to search the mods list or touch the filesystem
+    archives = {mod.location: mod for mod in mods_list.values() if mod.is_archive}
 
     def py_get_source_lines(
         module_name: str,
@@ -241,43 +292,34 @@ def py_get_source_lines(mods_list: dict[str, Mod]):
         ``line_no``.
         """
 
-        # TODO: this could probably be optimized, but since it only runs when an
-        # error occurs it's not mission critical
-
         # `module_name` can contain the __mod-name__ syntax, so we want to
         # remedy that first
-        rename = re.compile(r"__([\w-]+)__")
         match = rename.match(module_name)
         if match:
             module_name = rename.sub(mods_list[match[1]].location, module_name)
 
         # We're given a generic module name, which can point to either a regular
         # folder or a compressed archive.
-        # The given string should be coercable to a path object:
-        module_path = pathlib.Path(module_name)
-        # If we go through all parent path objects and at least one of them is a
-        # file, then we know that we're dealing with an archive
-        file_parents = [parent for parent in module_path.parents if parent.is_file()]
-        if len(file_parents) > 0:
-            archive = True
-            archive_path = file_parents[0]
-        else:
-            archive = False
-
-        if archive:
-            # Archive module names should be of the format:
-            #   mod-folder/mod.zip/path/to/file.lua
-            # So we should be able to replace the location substring of
-            # "mod-folder/mod.zip" with the internal `archive_folder` and grab
-            # it natively
-            for _, mod in mods_list.items():
-                if mod.location == str(pathlib.PurePosixPath(archive_path)):
-                    break
+        # Archive module names should be of the format:
+        #   mod-folder/mod.zip/path/to/file.lua
+        # So if the module name starts with the location of an archived mod,
+        # we can replace the location substring of "mod-folder/mod.zip" with the
+        # internal `archive_folder` and grab it natively
+        posix_name = module_name.replace("\\", "/")
+        mod = next(
+            (
+                mod
+                for location, mod in archives.items()
+                if posix_name.startswith(location + "/")
+            ),
+            None,
+        )
 
-            module_name = module_name.replace(mod.location, mod.archive_folder)
+        if mod is not None:
+            module_name = posix_name.replace(mod.location, mod.archive_folder, 1)
 
             try:
-                source = archive_to_string(mod.archive, module_name)
+                source = mod.read_archive_file(module_name)
                 err = None
             except KeyError:
                 source = None
@@ -347,10 +389,13 @@ def py_search_archive(
         filepath = filepath.replace(mod.location, mod.archive_folder)
         # Normalize `__mod-name__` syntax
         filepath = filepath.replace(f"__{mod.name}__", mod.archive_folder)
-        try:
-            return archive_to_string(mod.archive, filepath), None
-        except KeyError:
-            pass
+        # Resolve against the archive's index instead of probing the archive
+        # (most paths are already normalized, so try them as they are first)
+        name = mod.archive_index.get(filepath) or mod.archive_index.get(
+            normalize_archive_path(filepath)
+        )
+        if name is not None:
+            return mod.read_archive_member(name), None
 
     # Otherwise, we found squat
     return None, "\n\tno module '{}' found in '{}' archive".format(
@@ -358,7 +403,12 @@ def py_search_archive(
     )
 
 
-def run_mod_phase(lua: lupa.LuaRuntime, mod: Mod, stage: str) -> None:
+def run_mod_phase(
+    lua: lupa.LuaRuntime,
+    mod: Mod,
+    stage: str,
+    chunk_cache: Optional[ChunkCache] = None,
+) -> None:
     """
     Runs one of the mod entry-points for either the settings or the data stage.
     (`settings.lua`, `data-updates.lua`, etc.)
@@ -371,7 +421,7 @@ def run_mod_phase(lua: lupa.LuaRuntime, mod: Mod, stage: str) -> None:
     # Add the base mod folder as a base path
     lua.globals().lua_add_path(mod.location + "/?.lua")
 
-    lua.execute(mod.get_file(stage), name=file_name)
+    execute_chunk(lua, mod.get_file(stage), name=file_name, chunk_cache=chunk_cache)
 
 
 def run_settings_stage(
@@ -381,12 +431,16 @@ def run_settings_stage(
     draftsman_path: str,
     base_path: str,
     verbose: bool = False,
+    profile: Optional[LifecycleProfile] = None,
+    chunk_cache: Optional[ChunkCache] = None,
 ):
     """
     Runs all 3 settings stages (``settings.lua``, ``settings-updates.lua``,
     ``settings-final-fixes.lua``). Afterward, the lua data is copied to the
     correct location that the data stage expects, and any user-defined settings
-    are applied ontop of the default ones.
+    are applied ontop of the default ones. If ``profile`` is given, each stage
+    of each mod is recorded to it. If ``chunk_cache`` is given, each file is
+    loaded from its previously compiled bytecode.
     """
     stages = ("settings.lua", "settings-updates.lua", "settings-final-fixes.lua")
     for stage in stages:
@@ -402,7 +456,9 @@ def run_settings_stage(
                 if verbose:
                     print("\tmod:", mod.name)
 
-                run_mod_phase(lua, mod, stage)  # TODO: wrap in try-catch
+                with measure_stage(profile, lua, mod.name, stage):
+                    # TODO: wrap in try-catch
+                    run_mod_phase(lua, mod, stage, chunk_cache=chunk_cache)
 
                 # Reset the included modules
                 lua.globals().lua_unload_cache()
@@ -415,9 +471,11 @@ def run_settings_stage(
     lua.globals().REQUIRE_STACK = lua.eval('{{"{}"}}'.format(file_name))
     lua.globals().MODS_STACK = lua.eval("{}")
     lua.globals().lua_stage_reset()
-    lua.execute(
+    execute_chunk(
+        lua,
         file_to_string(os.path.join(draftsman_path, "compatibility", "settings.lua")),
         name=file_name,
+        chunk_cache=chunk_cache,
     )
 
     # If there is a `mod-settings.dat` file present, we overwrite the current
@@ -435,11 +493,18 @@ def run_settings_stage(
 
 
 def run_data_stage(
-    lua: lupa.LuaRuntime, load_order: list[Mod], base_path: str, verbose: bool = False
+    lua: lupa.LuaRuntime,
+    load_order: list[Mod],
+    base_path: str,
+    verbose: bool = False,
+    profile: Optional[LifecycleProfile] = None,
+    chunk_cache: Optional[ChunkCache] = None,
 ):
     """
     Runs all 3 data stages (``data.lua``, ``data-updates.lua``,
-    ``data-final-fixes.lua``).
+    ``data-final-fixes.lua``). If ``profile`` is given, each stage of each mod
+    is recorded to it. If ``chunk_cache`` is given, each file is loaded from
+    its previously compiled bytecode.
     """
     stages = ("data.lua", "data-updates.lua", "data-final-fixes.lua")
     for stage in stages:
@@ -455,7 +520,9 @@ def run_data_stage(
                 if verbose:
                     print("\tmod:", mod.name)
 
-                run_mod_phase(lua, mod, stage)  # TODO: wrap in try-catch
+                with measure_stage(profile, lua, mod.name, stage):
+                    # TODO: wrap in try-catch
+                    run_mod_phase(lua, mod, stage, chunk_cache=chunk_cache)
 
                 # Reset the included modules
                 lua.globals().lua_unload_cache()
@@ -471,6 +538,9 @@ def run_data_lifecycle(
     no_mods: bool = False,
     verbose: bool = False,
     show_logs: bool = False,
+    mod_cache_path: Optional[str] = None,
+    profile: Optional[LifecycleProfile] = None,
+    chunk_cache: Optional[ChunkCache] = None,
 ) -> lupa.LuaRuntime:
     """
     Runs the entire Factorio data lifecycle, from discovering mods, determining
@@ -495,6 +565,15 @@ def run_data_lifecycle(
     :param show_logs: If enabled, any `log()` messages created on the Lua side
         of things will be printed to stdout. This will happen regardless of the
         value of ``verbose``.
+    :param mod_cache_path: Path to a file to cache the metadata of mod archives
+        in while discovering mods. See :py:func:`.discover_mods` for more
+        information.
+    :param profile: A :py:class:`.LifecycleProfile` to record the time and Lua
+        memory taken by each stage of each mod to.
+    :param chunk_cache: A :py:class:`.ChunkCache` to compile every Lua file
+        with. Pass the same one to each call when building several
+        configurations in a row, so that files shared between them (like all
+        of ``core`` and ``base``) are only compiled by the first.
 
     :returns: A :py:class:`lupa.LuaRuntime` object containing all relevant Lua
         tables with corresponding data, such as `data.raw`, `mods`, etc. that
@@ -513,7 +592,13 @@ def run_data_lifecycle(
     if verbose:
         print("Discovering mods...\n")
 
-    mods = discover_mods(game_path=game_path, mods_path=mods_path, no_mods=no_mods)
+    mods = discover_mods(
+        game_path=game_path,
+        mods_path=mods_path,
+        no_mods=no_mods,
+        cache_path=mod_cache_path,
+        parallel=True,
+    )
 
     if verbose:
         display_mods(mods, verbose=False)  # We want the slick version
@@ -627,14 +712,20 @@ def run_data_lifecycle(
     # This is not included in `factorio-data` and has to be manually extracted
     # (See compatibility/defines.lua for more info).
     if version_string_to_tuple(mods["base"].version) < (2, 0):
-        lua.execute(
+        execute_chunk(
+            lua,
             file_to_string(
                 os.path.join(draftsman_path, "compatibility", "defines", "1.0.0.lua")
-            )
+            ),
+            chunk_cache=chunk_cache,
         )
     else:
-        lua.execute(
-            file_to_string(os.path.join(draftsman_path, "compatibility", "defines.lua"))
+        execute_chunk(
+            lua,
+            file_to_string(
+                os.path.join(draftsman_path, "compatibility", "defines.lua")
+            ),
+            chunk_cache=chunk_cache,
         )
 
     if verbose:
@@ -685,6 +776,9 @@ def run_data_lifecycle(
     # As well as a generic one that grabs a fixed number of lines from either
     # folders or archives for generating readable stack traces
     lua.globals().py_get_source_lines = py_get_source_lines(mods)
+    # Files required by mods are compiled by the chunk cache, if given
+    if chunk_cache is not None:
+        lua.globals().py_compile_chunk = chunk_cache.compile
 
     # TODO: set base path
 
@@ -692,7 +786,11 @@ def run_data_lifecycle(
     # Factorio's internal load process.
     # Primarily, it updates the require function to now handle `python_require`,
     # and fixes a few small discrepancies that Factorio's environment has.
-    run_lua_file(lua, os.path.join(draftsman_path, "compatibility", "interface.lua"))
+    run_lua_file(
+        lua,
+        os.path.join(draftsman_path, "compatibility", "interface.lua"),
+        chunk_cache=chunk_cache,
+    )
 
     # We also add a special path, which is just the entire module
     # (This is used for local paths in archives which also uses the same
@@ -719,7 +817,11 @@ def run_data_lifecycle(
     base_path = lua.globals().package.path
 
     # Factorio utility functions
-    run_lua_file(lua, os.path.join(game_path, "core", "lualib", "util.lua"))
+    run_lua_file(
+        lua,
+        os.path.join(game_path, "core", "lualib", "util.lua"),
+        chunk_cache=chunk_cache,
+    )
 
     # Factorio `data:extend` function
     # NOTE: the actual load process might load all files in `lualib`, but it
@@ -732,6 +834,7 @@ def run_data_lifecycle(
         lua,
         os.path.join(game_path, "core", "lualib", "dataloader.lua"),
         custom_name="__core__/lualib/dataloader.lua",
+        chunk_cache=chunk_cache,
     )
 
     # Construct and send the `mods` table to the Lua instance in `interface.lua`
@@ -759,10 +862,19 @@ def run_data_lifecycle(
         draftsman_path=draftsman_path,
         base_path=base_path,
         verbose=verbose,
+        profile=profile,
+        chunk_cache=chunk_cache,
     )
 
     # Load the data stage
-    run_data_stage(lua, load_order=load_order, base_path=base_path, verbose=verbose)
+    run_data_stage(
+        lua,
+        load_order=load_order,
+        base_path=base_path,
+        verbose=verbose,
+        profile=profile,
+        chunk_cache=chunk_cache,
+    )
 
     return lua
 
@@ -788,16 +900,62 @@ def convert_table_to_dict(table) -> Union[dict, list]:
     return out
 
 
-def get_items(lua, game_version: tuple[int, int, int, int]):
+def _decode_tagged_keys(pairs: list[tuple[str, object]]) -> dict:
+    # Restores the number and boolean keys which `encode.lua` had to store as
+    # strings
+    out = {}
+    for key, value in pairs:
+        if key.startswith("\x00n"):
+            key = json.loads(key[2:])
+        elif key.startswith("\x00b"):
+            key = key[2:] == "true"
+        out[key] = value
+    return out
+
+
+def convert_table_bulk(lua: lupa.LuaRuntime, table) -> Union[dict, list]:
+    """
+    Converts a Lua table to a Python dict, with the same result as
+    :py:func:`convert_table_to_dict`. The table is serialized to a single JSON
+    string on the Lua side (see ``compatibility/encode.lua``) and then parsed
+    all at once, which is much faster for large tables than converting each
+    key and value across the Lua/Python boundary individually.
+    """
+    draftsman_path = os.path.dirname(os.path.abspath(draftsman_root_file))
+    encode = lua.execute(
+        file_to_string(os.path.join(draftsman_path, "compatibility", "encode.lua"))
+    )
+    string, tagged = encode(table)
+    return json.loads(string, object_pairs_hook=_decode_tagged_keys if tagged else None)
+
+
+def get_data_raw(lua: lupa.LuaRuntime) -> dict:
+    """
+    Converts the entire ``data.raw`` table of a loaded Lua instance to a
+    Python dict in one pass. :py:func:`extract_data` calls this once and shares
+    the result between every extraction function; since they all read from the
+    same dict, they must copy any part of it that they intend to modify.
+    """
+    return convert_table_bulk(lua, lua.globals().data.raw)
+
+
+def get_items(
+    lua: lupa.LuaRuntime,
+    game_version: tuple[int, int, int, int],
+    data_raw: Optional[dict] = None,
+):
     """
     Gets the loaded items, item subgroups, and item groups. Sorts them and
     returns them. Saves us the trouble of recalcualting this every time we sort
     something along item order, which we commonly do.
     """
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
-    groups = convert_table_to_dict(data.raw["item-group"])
-    subgroups = convert_table_to_dict(data.raw["item-subgroup"])
+    groups = {name: dict(group) for name, group in data_raw["item-group"].items()}
+    subgroups = {
+        name: dict(subgroup) for name, subgroup in data_raw["item-subgroup"].items()
+    }
 
     def to_ordered_dict(elem):
         sorted_elem = OrderedDict()
@@ -838,7 +996,7 @@ def get_items(lua, game_version: tuple[int, int, int, int]):
         subgroup_index_dict[subgroup["name"]] = subgroup
 
     def add_item(category, item_name):
-        item = category[item_name]
+        item = dict(category[item_name])
         # if "flags" in item:
         #     if "hidden" in item["flags"].values():
         #         return
@@ -851,30 +1009,29 @@ def get_items(lua, game_version: tuple[int, int, int, int]):
         subgroup["items"].append(item)
 
     def add_items(category):
-        category = convert_table_to_dict(category)
         for item_name in category:
             add_item(category, item_name)
 
     # Iterate over every item
-    add_items(data.raw["item"])
-    add_items(data.raw["item-with-entity-data"])
-    add_items(data.raw["tool"])
-    add_items(data.raw["ammo"])
-    add_items(data.raw["module"])
-    add_items(data.raw["armor"])
-    add_items(data.raw["gun"])
-    add_items(data.raw["capsule"])
+    add_items(data_raw["item"])
+    add_items(data_raw["item-with-entity-data"])
+    add_items(data_raw["tool"])
+    add_items(data_raw["ammo"])
+    add_items(data_raw["module"])
+    add_items(data_raw["armor"])
+    add_items(data_raw["gun"])
+    add_items(data_raw["capsule"])
     # Extras
-    add_items(data.raw["blueprint"])
-    add_items(data.raw["blueprint-book"])
-    add_items(data.raw["upgrade-item"])
-    add_items(data.raw["deconstruction-item"])
-    add_items(data.raw["spidertron-remote"])
-    add_items(data.raw["repair-tool"])  # not an item somehow
-    add_items(data.raw["rail-planner"])
-    add_items(data.raw["copy-paste-tool"])
+    add_items(data_raw["blueprint"])
+    add_items(data_raw["blueprint-book"])
+    add_items(data_raw["upgrade-item"])
+    add_items(data_raw["deconstruction-item"])
+    add_items(data_raw["spidertron-remote"])
+    add_items(data_raw["repair-tool"])  # not an item somehow
+    add_items(data_raw["rail-planner"])
+    add_items(data_raw["copy-paste-tool"])
     if game_version >= (2, 0):
-        add_items(data.raw["space-platform-starter-pack"])
+        add_items(data_raw["space-platform-starter-pack"])
 
     # Sort everything
     for i, _ in enumerate(group_list):
@@ -916,6 +1073,56 @@ def get_items(lua, game_version: tuple[int, int, int, int]):
     return sorted_items, sorted_subgroups, sorted_groups
 
 
+def write_file_atomically(path: str, contents: bytes) -> None:
+    """
+    Writes ``contents`` to a temporary file next to ``path`` and then renames
+    it to ``path``, so that ``path`` is never left partially written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(contents)
+        # `mkstemp()` creates files only readable by the current user
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def write_data_file(
+    draftsman_path: str,
+    filename: str,
+    data,
+    indexed_location: Optional[tuple] = None,
+    indexed: bool = False,
+) -> None:
+    """
+    Pickles ``data`` to ``filename`` in :py:mod:`draftsman.data`. The file is
+    written atomically.
+
+    If ``indexed`` is ``True``, the mapping at ``indexed_location`` inside of
+    ``data`` is instead written to a separate :py:class:`.IndexedStore` file,
+    so that each of its values can be loaded individually on demand. Otherwise,
+    any index file left over from a previous update is removed so that it
+    can't shadow the new data.
+    """
+    index_path = os.path.join(
+        draftsman_path, "data", os.path.basename(get_index_path(filename))
+    )
+    if indexed and indexed_location is not None:
+        write_indexed_store(index_path, get_location(data, indexed_location))
+        # Leave a placeholder where the mapping would otherwise go
+        data = set_location(copy.copy(data), indexed_location, None)
+    elif os.path.exists(index_path):
+        os.remove(index_path)
+
+    write_file_atomically(
+        os.path.join(draftsman_path, "data", filename), pickle.dumps(data, 4)
+    )
+
+
 def extract_mods(
     lua: lupa.LuaRuntime, draftsman_path: str, verbose: bool = False
 ) -> None:
@@ -928,8 +1135,7 @@ def extract_mods(
         if key != "core"
     }
 
-    with open(os.path.join(draftsman_path, "data", "mods.pkl"), "wb") as out:
-        pickle.dump(out_mods, out, 4)
+    write_data_file(draftsman_path, "mods.pkl", out_mods)
 
     if verbose:
         print("Extracted mods...")
@@ -941,19 +1147,21 @@ def extract_entities(
     game_version,
     sort_tuple,
     verbose: bool = False,
+    indexed: bool = False,
+    data_raw: Optional[dict] = None,
 ) -> None:
     """
     Extracts the entities to ``entities.pkl`` in :py:mod:`draftsman.data`.
     """
-
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
     try:
         # In modern Factorio, default collision masks are defined by the game
-        default_collision_masks = convert_table_to_dict(
-            data.raw["utility-constants"]["default"]["default_collision_masks"]
-        )
-    except TypeError:
+        default_collision_masks = data_raw["utility-constants"]["default"][
+            "default_collision_masks"
+        ]
+    except KeyError:
         # If not, we have to manually define their defaults ourselves
         default_collision_masks = {
             "gate": {
@@ -1113,7 +1321,10 @@ def extract_entities(
 
         # 2.0 Factorio has more keys than just the layers
         if "layers" in entity["collision_mask"]:
-            entity["collision_mask"]["layers"] = set(entity["collision_mask"]["layers"])
+            entity["collision_mask"] = {
+                **entity["collision_mask"],
+                "layers": set(entity["collision_mask"]["layers"]),
+            }
         # 1.0 Factorio is just a simple set
         else:
             entity["collision_mask"] = set(entity["collision_mask"])
@@ -1137,12 +1348,13 @@ def extract_entities(
     def add_entities(prototype_name: str, source_name: str | None = None):
         if source_name is None:
             source_name = prototype_name
-        if source_name not in data.raw:
+        if source_name not in data_raw:
             # If not present, then typically it means its not present in this version
             # of the game; thus return an empty list
             entities["of_type"][prototype_name] = []
             return
-        for name, contents in convert_table_to_dict(data.raw[source_name]).items():
+        for name, contents in data_raw[source_name].items():
+            contents = dict(contents)
             if not categorize_entity(name, contents):
                 continue
             contents["type"] = prototype_name
@@ -1215,8 +1427,9 @@ def extract_entities(
     entities["of_type"]["logistic-container-storage"] = []
     entities["of_type"]["logistic-container-buffer"] = []
     entities["of_type"]["logistic-container-request"] = []
-    logi_containers = convert_table_to_dict(data.raw["logistic-container"])
+    logi_containers = data_raw["logistic-container"]
     for container_name, container in logi_containers.items():
+        container = dict(container)
         if not categorize_entity(container_name, container):
             continue
         add_entity(**container, target=(unordered_entities_raw, entities["of_type"]))
@@ -1311,8 +1524,21 @@ def extract_entities(
         else:
             collision_sets[name] = CollisionSet([])
 
-    with open(os.path.join(draftsman_path, "data", "entities.pkl"), "wb") as out:
-        pickle.dump(entities, out, 4)
+    # Precompute the collision set of every entity in each direction it can
+    # face, so that constructing entities does not have to rotate them
+    rotated_collision_sets = {}
+    for name in raw_order:
+        try:
+            rotated_collision_sets[name] = get_default_rotated_collision_sets(
+                entities["raw"][name], collision_sets[name]
+            )
+        except ValueError:
+            # Non-square boxes cannot be rotated diagonally; these entities
+            # are not directional (or hardcode their collision sets) anyway
+            pass
+    entities["rotated_collision_sets"] = rotated_collision_sets
+
+    write_data_file(draftsman_path, "entities.pkl", entities, ("raw",), indexed)
 
     if verbose:
         print("Extracted entities...")
@@ -1322,22 +1548,26 @@ def extract_entities(
 
 
 def extract_equipment(
-    lua: lupa.LuaRuntime, draftsman_path: str, sort_tuple, verbose: bool = False
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    sort_tuple,
+    verbose: bool = False,
+    data_raw: Optional[dict] = None,
 ) -> None:
     """
     Extracts equipment to ``equipment.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
-    unordered_equipment_raw = convert_table_to_dict(data.raw["equipment-grid"])
+    unordered_equipment_raw = data_raw["equipment-grid"]
     raw_order = get_order(unordered_equipment_raw, *sort_tuple)
 
     equipment_raw = {}
     for name in raw_order:
         equipment_raw[name] = unordered_equipment_raw[name]
 
-    with open(os.path.join(draftsman_path, "data", "equipment.pkl"), "wb") as out:
-        pickle.dump((equipment_raw,), out, 4)
+    write_data_file(draftsman_path, "equipment.pkl", (equipment_raw,))
 
     if verbose:
         print("Extracted equipment...")
@@ -1347,22 +1577,26 @@ def extract_equipment(
 
 
 def extract_fluids(
-    lua: lupa.LuaRuntime, draftsman_path: str, sort_tuple, verbose: bool = False
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    sort_tuple,
+    verbose: bool = False,
+    data_raw: Optional[dict] = None,
 ):
     """
     Extracts the fluids to ``fluids.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
-    unordered_fluids_raw = convert_table_to_dict(data.raw["fluid"])
+    unordered_fluids_raw = data_raw["fluid"]
     raw_order = get_order(unordered_fluids_raw, *sort_tuple)
 
     fluids_raw = OrderedDict()
     for name in raw_order:
         fluids_raw[name] = unordered_fluids_raw[name]
 
-    with open(os.path.join(draftsman_path, "data", "fluids.pkl"), "wb") as out:
-        pickle.dump((fluids_raw,), out, 4)
+    write_data_file(draftsman_path, "fluids.pkl", (fluids_raw,))
 
     if verbose:
         print("Extracted fluids...")
@@ -1372,17 +1606,21 @@ def extract_fluids(
 
 
 def extract_instruments(
-    lua: lupa.LuaRuntime, draftsman_path: str, verbose: bool = False
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    verbose: bool = False,
+    data_raw: Optional[dict] = None,
 ):
     """
     Extracts the instruments to ``instruments.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
     instrument_raw = OrderedDict()
     instrument_index = {}
     instrument_names = {}
-    speakers = convert_table_to_dict(data.raw["programmable-speaker"])
+    speakers = data_raw["programmable-speaker"]
     for speaker in speakers:
         instrument_list = speakers[speaker]["instruments"]
         instrument_raw[speaker] = instrument_list
@@ -1399,9 +1637,8 @@ def extract_instruments(
             instrument_index[speaker][instrument["name"]] = index_dict
             instrument_names[speaker][i] = name_dict
 
-    with open(os.path.join(draftsman_path, "data", "instruments.pkl"), "wb") as out:
-        instrument_data = [instrument_raw, instrument_index, instrument_names]
-        pickle.dump(instrument_data, out, 4)
+    instrument_data = [instrument_raw, instrument_index, instrument_names]
+    write_data_file(draftsman_path, "instruments.pkl", instrument_data)
 
     if verbose:
         print("Extracted instruments...")
@@ -1410,16 +1647,23 @@ def extract_instruments(
 # =============================================================================
 
 
-def extract_items(lua: lupa.LuaRuntime, draftsman_path: str, sort_tuple, verbose):
+def extract_items(
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    sort_tuple,
+    verbose,
+    data_raw: Optional[dict] = None,
+):
     """
     Extracts the items to ``items.pkl`` in :py:mod:`draftsman.data`.
     """
     sorted_items, sorted_subgroups, sorted_groups = sort_tuple
 
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
     # Grab fuel items
-    fuel_categories = convert_table_to_dict(data.raw["fuel-category"])
+    fuel_categories = data_raw["fuel-category"]
 
     fuels = {category: set() for category in fuel_categories}
 
@@ -1427,9 +1671,8 @@ def extract_items(lua: lupa.LuaRuntime, draftsman_path: str, sort_tuple, verbose
         if "fuel_category" in item:
             fuels[item["fuel_category"]].add(item_name)
 
-    with open(os.path.join(draftsman_path, "data", "items.pkl"), "wb") as out:
-        items = [sorted_items, sorted_subgroups, sorted_groups, fuels]
-        pickle.dump(items, out, 4)
+    items = [sorted_items, sorted_subgroups, sorted_groups, fuels]
+    write_data_file(draftsman_path, "items.pkl", items)
 
     if verbose:
         print("Extracted items...")
@@ -1439,20 +1682,25 @@ def extract_items(lua: lupa.LuaRuntime, draftsman_path: str, sort_tuple, verbose
 
 
 def extract_modules(
-    lua: lupa.LuaRuntime, draftsman_path: str, sort_tuple, verbose: bool = False
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    sort_tuple,
+    verbose: bool = False,
+    data_raw: Optional[dict] = None,
 ):
     """
     Extracts the modules to ``modules.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
     # Init categories
-    categories = convert_table_to_dict(data.raw["module-category"])
+    categories = data_raw["module-category"]
     out_categories = OrderedDict()
     for category in categories:
         out_categories[category] = []
 
-    modules = convert_table_to_dict(data.raw["module"])
+    modules = data_raw["module"]
     unsorted_modules_raw = {}
     for module in modules:
         unsorted_modules_raw[module] = modules[module]
@@ -1465,8 +1713,7 @@ def extract_modules(
         module_type = unsorted_modules_raw[name]["category"]
         out_categories[module_type].append(name)
 
-    with open(os.path.join(draftsman_path, "data", "modules.pkl"), "wb") as out:
-        pickle.dump([modules_raw, out_categories], out, 4)
+    write_data_file(draftsman_path, "modules.pkl", [modules_raw, out_categories])
 
     if verbose:
         print("Extracted modules...")
@@ -1476,18 +1723,17 @@ def extract_modules(
 
 
 def extract_planets(
-    lua: lupa.LuaRuntime, draftsman_path: str, verbose: bool = False
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    verbose: bool = False,
+    data_raw: Optional[dict] = None,
 ) -> None:
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
-    try:
-        planets = convert_table_to_dict(data.raw["planet"])
-    except TypeError:
-        planets = {}
+    planets = data_raw.get("planet", {})
 
-    with open(os.path.join(draftsman_path, "data", "planets.pkl"), "wb") as out:
-        data = [planets]
-        pickle.dump(data, out, 4)
+    write_data_file(draftsman_path, "planets.pkl", [planets])
 
     if verbose:
         print("Extracted planets...")
@@ -1501,18 +1747,14 @@ def extract_qualities(
     draftsman_path: str,
     sort_tuple,
     verbose: bool = False,
+    data_raw: Optional[dict] = None,
 ):
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
-    data = lua.globals().data
+    raw_qualities = data_raw.get("quality", {})
 
-    try:
-        raw_qualities = convert_table_to_dict(data.raw["quality"])
-    except TypeError:
-        raw_qualities = {}
-
-    with open(os.path.join(draftsman_path, "data", "qualities.pkl"), "wb") as out:
-        data = [raw_qualities]
-        pickle.dump(data, out, 4)
+    write_data_file(draftsman_path, "qualities.pkl", [raw_qualities])
 
     if verbose:
         print("Extracted qualities...")
@@ -1522,26 +1764,32 @@ def extract_qualities(
 
 
 def extract_recipes(
-    lua: lupa.LuaRuntime, draftsman_path: str, sort_tuple, verbose: bool = False
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    sort_tuple,
+    verbose: bool = False,
+    indexed: bool = False,
+    data_raw: Optional[dict] = None,
 ) -> None:
     """
     Extracts the recipes to ``recipes.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
     out_categories = {}
     for_machine = {}
 
-    categories = convert_table_to_dict(data.raw["recipe-category"])
+    categories = data_raw["recipe-category"]
     for category in categories:
         out_categories[category] = []
 
-    unsorted_recipes = convert_table_to_dict(data.raw["recipe"])
+    unsorted_recipes = data_raw["recipe"]
     for recipe in unsorted_recipes:
         category = unsorted_recipes[recipe].get("category", "crafting")
         out_categories[category].append(unsorted_recipes[recipe]["name"])
 
-    machines = convert_table_to_dict(data.raw["assembling-machine"])
+    machines = data_raw["assembling-machine"]
     for machine_name in machines:
         for_machine[machine_name] = []
         machine = machines[machine_name]
@@ -1557,9 +1805,8 @@ def extract_recipes(
     for recipe in recipe_order:
         recipes[recipe] = unsorted_recipes[recipe]
 
-    with open(os.path.join(draftsman_path, "data", "recipes.pkl"), "wb") as out:
-        data = [recipes, out_categories, for_machine]
-        pickle.dump(data, out, 4)
+    data = [recipes, out_categories, for_machine]
+    write_data_file(draftsman_path, "recipes.pkl", data, (0,), indexed)
 
     if verbose:
         print("Extracted recipes...")
@@ -1569,12 +1816,17 @@ def extract_recipes(
 
 
 def extract_signals(
-    lua: lupa.LuaRuntime, draftsman_path: str, sort_tuple, verbose: bool = False
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    sort_tuple,
+    verbose: bool = False,
+    data_raw: Optional[dict] = None,
 ):
     """
     Extracts the signals to ``signals.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
     unsorted_raw_signals = {}
     type_of_signals: dict[str, list[str]] = {}
@@ -1592,10 +1844,10 @@ def extract_signals(
 
     def add_signals(signal_category_name, target_location, signal_type):
         # Depending on configuration, some items/signals might not exist
-        if signal_category_name not in data.raw:
+        if signal_category_name not in data_raw:
             return
 
-        signal_category = convert_table_to_dict(data.raw[signal_category_name])
+        signal_category = data_raw[signal_category_name]
         for signal_name in signal_category:
             signal_obj = signal_category[signal_name]
 
@@ -1808,21 +2060,20 @@ def extract_signals(
     for signal in all_signals_order:
         raw_signals[signal] = unsorted_raw_signals[signal]
 
-    with open(os.path.join(draftsman_path, "data", "signals.pkl"), "wb") as out:
-        data = {
-            "raw": raw_signals,
-            "type_of": type_of_signals,
-            "virtual": virtual_signals,
-            "item": item_signals,
-            "fluid": fluid_signals,
-            "recipe": recipe_signals,
-            "entity": entity_signals,
-            "space-location": space_location_signals,
-            "asteroid-chunk": asteroid_chunk_signals,
-            "quality": quality_signals,
-            # "hidden": hidden_signals
-        }
-        pickle.dump(data, out, 4)
+    data = {
+        "raw": raw_signals,
+        "type_of": type_of_signals,
+        "virtual": virtual_signals,
+        "item": item_signals,
+        "fluid": fluid_signals,
+        "recipe": recipe_signals,
+        "entity": entity_signals,
+        "space-location": space_location_signals,
+        "asteroid-chunk": asteroid_chunk_signals,
+        "quality": quality_signals,
+        # "hidden": hidden_signals
+    }
+    write_data_file(draftsman_path, "signals.pkl", data)
 
     if verbose:
         print("Extracted signals...")
@@ -1831,20 +2082,28 @@ def extract_signals(
 # =============================================================================
 
 
-def extract_tiles(lua: lupa.LuaRuntime, draftsman_path: str, verbose: bool = False):
+def extract_tiles(
+    lua: lupa.LuaRuntime,
+    draftsman_path: str,
+    verbose: bool = False,
+    indexed: bool = False,
+    data_raw: Optional[dict] = None,
+):
     """
     Extracts the tiles to ``tiles.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
+    if data_raw is None:
+        data_raw = get_data_raw(lua)
 
-    tiles = convert_table_to_dict(data.raw["tile"])
+    tiles = {name: dict(tile) for name, tile in data_raw["tile"].items()}
 
     tile_list = []
     for tile in tiles:
         if "layers" in tiles[tile]["collision_mask"]:
-            tiles[tile]["collision_mask"]["layers"] = set(
-                tiles[tile]["collision_mask"]["layers"]
-            )
+            tiles[tile]["collision_mask"] = {
+                **tiles[tile]["collision_mask"],
+                "layers": set(tiles[tile]["collision_mask"]["layers"]),
+            }
         else:
             tiles[tile]["collision_mask"] = set(tiles[tile]["collision_mask"])
         tile_order = tiles[tile].get("order", None)
@@ -1859,19 +2118,146 @@ def extract_tiles(lua: lupa.LuaRuntime, draftsman_path: str, verbose: bool = Fal
     for tile in result:
         out_tiles[tile] = tiles[tile]
 
-    with open(os.path.join(draftsman_path, "data", "tiles.pkl"), "wb") as out:
-        pickle.dump(out_tiles, out, 4)
+    write_data_file(draftsman_path, "tiles.pkl", out_tiles, (), indexed)
 
     if verbose:
         print("Extracted tiles...")
 
 
+extractors = (
+    "entities",
+    "equipment",
+    "fluids",
+    "instruments",
+    "items",
+    "modules",
+    "planets",
+    "qualities",
+    "recipes",
+    "signals",
+    "tiles",
+)
+"""
+The name of every extraction function run by :py:func:`extract_data`, in the
+order they are run.
+"""
+
+
+def run_extractor(
+    name: str,
+    draftsman_path: str,
+    game_version: tuple[int, ...],
+    sort_tuple,
+    data_raw: dict,
+    verbose: bool = False,
+    indexed: bool = False,
+) -> float:
+    """
+    Runs the extraction function named ``name`` (one of :py:data:`extractors`)
+    on an already converted ``data_raw``, without needing a Lua instance.
+
+    :returns: The number of seconds the extraction function took.
+    """
+    start = time.perf_counter()
+    if name == "entities":
+        extract_entities(
+            None, draftsman_path, game_version, sort_tuple, verbose, indexed, data_raw
+        )
+    elif name == "equipment":
+        extract_equipment(None, draftsman_path, sort_tuple, verbose, data_raw)
+    elif name == "fluids":
+        extract_fluids(None, draftsman_path, sort_tuple, verbose, data_raw)
+    elif name == "instruments":
+        extract_instruments(None, draftsman_path, verbose, data_raw)
+    elif name == "items":
+        extract_items(None, draftsman_path, sort_tuple, verbose, data_raw)
+    elif name == "modules":
+        extract_modules(None, draftsman_path, sort_tuple, verbose, data_raw)
+    elif name == "planets":
+        extract_planets(None, draftsman_path, verbose, data_raw)
+    elif name == "qualities":
+        extract_qualities(None, draftsman_path, sort_tuple, verbose, data_raw)
+    elif name == "recipes":
+        extract_recipes(None, draftsman_path, sort_tuple, verbose, indexed, data_raw)
+    elif name == "signals":
+        extract_signals(None, draftsman_path, sort_tuple, verbose, data_raw)
+    elif name == "tiles":
+        extract_tiles(None, draftsman_path, verbose, indexed, data_raw)
+    else:
+        raise ValueError("Unknown extractor '{}'".format(name))
+    return time.perf_counter() - start
+
+
+# The arguments to `run_extractor()` in a worker process, which are set once
+# when the worker starts so that `data.raw` isn't sent along with every task
+_worker_arguments: Optional[dict] = None
+
+
+def _init_extraction_worker(arguments: dict) -> None:
+    global _worker_arguments
+    _worker_arguments = arguments
+
+
+def _run_extractor_in_worker(name: str) -> float:
+    return run_extractor(name, **_worker_arguments)
+
+
+def _move_extracted_files(source: str, destination: str) -> None:
+    """
+    Moves every file in ``source`` to ``destination``, replacing any existing
+    files. Index files are moved before the pickles that refer to them, and any
+    index file which was not rewritten is removed so that it can't shadow the
+    data of its new pickle.
+
+    Each file is replaced atomically, but the files are moved one at a time, so
+    an interruption can leave ``destination`` with a mix of old and new files.
+    Any ``fingerprint.json`` in ``destination`` is therefore removed first, so
+    that such a mix is never mistaken for the output of a complete update.
+    """
+    fingerprint_path = os.path.join(destination, "fingerprint.json")
+    if os.path.exists(fingerprint_path):
+        os.remove(fingerprint_path)
+
+    filenames = sorted(os.listdir(source), key=lambda f: not f.endswith(".idx"))
+    for filename in filenames:
+        stem, extension = os.path.splitext(filename)
+        index_path = os.path.join(destination, stem + ".idx")
+        if (
+            extension == ".pkl"
+            and stem + ".idx" not in filenames
+            and os.path.exists(index_path)
+        ):
+            os.remove(index_path)
+        os.replace(os.path.join(source, filename), os.path.join(destination, filename))
+
+
 def extract_data(
     lua: lupa.LuaRuntime,
     draftsman_path: str,
     game_version: tuple[int, ...] = DEFAULT_FACTORIO_VERSION,
     verbose: bool = False,
+    indexed: bool = False,
+    processes: Optional[int] = None,
+    profile: Optional[LifecycleProfile] = None,
 ):
+    """
+    Extracts all of the data Draftsman needs from a Lua instance which has run
+    the data lifecycle, and writes it to the ``data`` folder in
+    ``draftsman_path``.
+
+    ``data.raw`` is converted to Python once, after which the extraction
+    functions are independent of each other and of Lua, and run in a pool of
+    ``processes`` worker processes. Every file is first written to a temporary
+    folder and only moved into place once every extraction function has
+    succeeded, so a failed or interrupted extraction never leaves a mix of old
+    and new data behind.
+
+    :param processes: The number of worker processes to run the extraction
+        functions in. Defaults to the number of CPUs; if ``1``, the extraction
+        functions are run one after another in the current process instead.
+    :param profile: A :py:class:`.LifecycleProfile` to record the time taken by
+        each step of the extraction to.
+    """
     # TODO: this needs to be customizable; how do we do this?
     # Ideally we would have some user-friendly pattern syntax that users could
     # specify...
@@ -1890,24 +2276,157 @@ def extract_data(
     if verbose:
         print("Extracting data...\n")
 
-    extract_mods(lua=lua, draftsman_path=draftsman_path, verbose=verbose)
+    data_path = os.path.join(draftsman_path, "data")
+    os.makedirs(data_path, exist_ok=True)
+    staging_path = tempfile.mkdtemp(prefix=".extract-", dir=draftsman_path)
+    os.mkdir(os.path.join(staging_path, "data"))
+    extraction_start = time.perf_counter()
+    timings: dict[str, float] = {}
+    try:
+        start = time.perf_counter()
+        extract_mods(lua=lua, draftsman_path=staging_path, verbose=verbose)
+        timings["mods"] = time.perf_counter() - start
+
+        # Convert all of `data.raw` to Python in a single pass, and share it
+        # with every extraction function
+        start = time.perf_counter()
+        data_raw = get_data_raw(lua)
+        timings["data.raw"] = time.perf_counter() - start
+
+        # Lots of items are sorted by item order, subgroup and group
+        # Here we get these things once and pass them into each extraction
+        # function as necessary
+        start = time.perf_counter()
+        items = get_items(lua, game_version, data_raw)
+        timings["item order"] = time.perf_counter() - start
+
+        arguments = {
+            "draftsman_path": staging_path,
+            "game_version": game_version,
+            "sort_tuple": items,
+            "data_raw": data_raw,
+            "verbose": verbose,
+            "indexed": indexed,
+        }
+        if processes == 1:
+            for name in extractors:
+                timings[name] = run_extractor(name, **arguments)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_init_extraction_worker,
+                initargs=(arguments,),
+            ) as executor:
+                results = executor.map(_run_extractor_in_worker, extractors)
+                timings.update(zip(extractors, results))
+
+        _move_extracted_files(os.path.join(staging_path, "data"), data_path)
+    finally:
+        shutil.rmtree(staging_path, ignore_errors=True)
+
+    if profile is not None:
+        profile.extraction.update(timings)
+
+    if verbose:
+        print("\nExtraction timings:")
+        width = max(len(name) for name in timings) + 1
+        for name, seconds in timings.items():
+            print("    {:<{}} {:.3f}s".format(name + ":", width, seconds))
+        print(
+            "    {:<{}} {:.3f}s".format(
+                "total:", width, time.perf_counter() - extraction_start
+            )
+        )
+
+
+def hash_mod(mod: Mod) -> str:
+    """
+    Returns a hash identifying the contents of a mod. Archives are hashed by
+    their contents; folders (which can be very large, like the game's ``base``
+    folder) are hashed by the path, size and modification time of each file
+    inside of them.
+    """
+    hasher = hashlib.sha256()
+    if mod.is_archive:
+        with open(mod.location, "rb") as archive:
+            for chunk in iter(lambda: archive.read(1 << 20), b""):
+                hasher.update(chunk)
+    else:
+        for root, dirs, files in os.walk(mod.location):
+            dirs.sort()
+            for file in sorted(files):
+                filepath = os.path.join(root, file)
+                stat = os.stat(filepath)
+                relpath = os.path.relpath(filepath, mod.location)
+                entry = "{}:{}:{}\n".format(relpath, stat.st_size, stat.st_mtime_ns)
+                hasher.update(entry.encode())
+    return hasher.hexdigest()
+
+
+def get_update_fingerprint(
+    game_path: str,
+    mods_path: str,
+    owned_dlc: list[str] = ["space-age"],
+    no_mods: bool = False,
+    indexed: bool = False,
+    mod_cache_path: Optional[str] = None,
+) -> dict:
+    """
+    Gathers every input which affects the data extracted by
+    :py:func:`update_draftsman_data`: the game version, the name, version and
+    hash of every enabled mod, the contents of ``mod-settings.dat``, the owned
+    DLC, the output format, and the version of Draftsman itself.
 
-    # Lots of items are sorted by item order, subgroup and group
-    # Here we get these things once and pass them into each extraction function
-    # as necessary
-    items = get_items(lua, game_version)
+    ``mod_cache_path`` is passed to :py:func:`.discover_mods` as its
+    ``cache_path``.
 
-    extract_entities(lua, draftsman_path, game_version, items, verbose)
-    extract_equipment(lua, draftsman_path, items, verbose)
-    extract_fluids(lua, draftsman_path, items, verbose)
-    extract_instruments(lua, draftsman_path, verbose)
-    extract_items(lua, draftsman_path, items, verbose)
-    extract_modules(lua, draftsman_path, items, verbose)
-    extract_planets(lua, draftsman_path, verbose)
-    extract_qualities(lua, draftsman_path, items, verbose)
-    extract_recipes(lua, draftsman_path, items, verbose)
-    extract_signals(lua, draftsman_path, items, verbose)
-    extract_tiles(lua, draftsman_path, verbose)
+    :returns: A ``dict`` with a ``"fingerprint"`` key, which is a single hash of
+        all of the inputs, and an ``"inputs"`` key with the inputs themselves.
+    """
+    with open(os.path.join(game_path, "base", "info.json")) as base_info_file:
+        game_version = json.load(base_info_file)["version"]
+
+    mods = discover_mods(
+        game_path=game_path,
+        mods_path=mods_path,
+        no_mods=no_mods,
+        cache_path=mod_cache_path,
+        parallel=True,
+    )
+    enabled_mods = {
+        name: {"version": mod_list[0].version, "hash": hash_mod(mod_list[0])}
+        for name, mod_list in sorted(mods.items())
+        if mod_list[0].enabled
+    }
+
+    try:
+        with open(os.path.join(mods_path, "mod-settings.dat"), "rb") as settings:
+            mod_settings = hashlib.sha256(settings.read()).hexdigest()
+    except FileNotFoundError:
+        mod_settings = None
+
+    inputs = {
+        "draftsman_version": __version__,
+        "game_version": game_version,
+        "mods": enabled_mods,
+        "mod_settings": mod_settings,
+        "owned_dlc": sorted(owned_dlc),
+        "indexed": indexed,
+    }
+    fingerprint = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode())
+    return {"fingerprint": fingerprint.hexdigest(), "inputs": inputs}
+
+
+def read_update_fingerprint(draftsman_path: str) -> Optional[str]:
+    """
+    Returns the fingerprint of the last update written to the ``data`` folder
+    of ``draftsman_path``, or ``None`` if there isn't one.
+    """
+    try:
+        with open(os.path.join(draftsman_path, "data", "fingerprint.json")) as f:
+            return json.load(f)["fingerprint"]
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
 
 
 def update_draftsman_data(
@@ -1917,12 +2436,24 @@ def update_draftsman_data(
     no_mods: bool = False,
     verbose: bool = False,
     show_logs: bool = False,
-) -> None:
+    indexed: bool = False,
+    data_profile: Optional[str] = None,
+    force: bool = False,
+    processes: Optional[int] = None,
+    mod_cache_path: Optional[str] = None,
+    profile: Optional[LifecycleProfile] = None,
+    chunk_cache: Optional[ChunkCache] = None,
+) -> bool:
     """
     Runs the Factorio data lifecycle, and then extracts all of the relevant data
     that Draftsman needs to operate. The extracted data is written to a set of
     pickle files located in the ``draftsman/data`` folder, wherever it is
-    installed.
+    installed, or to a named data profile if ``data_profile`` is specified.
+
+    A fingerprint of the inputs to the update (see
+    :py:func:`get_update_fingerprint`) is written alongside the extracted data.
+    If the fingerprint of a subsequent update matches, nothing has changed and
+    the update is skipped entirely, unless ``force`` is specified.
 
     If you want to just run the data lifecycle part so that you can extract the
     game's data in whatever manner you wish, then instead use
@@ -1947,14 +2478,60 @@ def update_draftsman_data(
     :param show_logs: If enabled, any `log()` messages created on the Lua side
         of things will be printed to stdout. This will happen regardless of the
         value of ``verbose``.
+    :param indexed: If enabled, the large ``raw`` tables of entities, recipes
+        and tiles are written to memory-mappable index files next to
+        their pickles, so that each prototype is only loaded when it is first
+        accessed. See :py:class:`.IndexedStore` for more information.
+    :param data_profile: The name of a data profile to write the extracted data
+        to, instead of replacing the data installed with Draftsman. Profiles can
+        be switched between at runtime with :py:func:`draftsman.data.set_profile`.
+    :param force: Runs the update even if none of its inputs have changed since
+        the last one.
+    :param processes: The number of worker processes to extract the data with,
+        once the data lifecycle has finished. Defaults to the number of CPUs;
+        ``1`` extracts everything in the current process. See
+        :py:func:`extract_data` for more information.
+    :param mod_cache_path: Path to a file to cache the metadata of mod archives
+        in while discovering mods. See :py:func:`.discover_mods` for more
+        information.
+    :param profile: A :py:class:`.LifecycleProfile` to record the time and Lua
+        memory taken by each stage of each mod, and the time taken by each step
+        of the extraction, to. Nothing is recorded if the update is skipped.
+    :param chunk_cache: A :py:class:`.ChunkCache` to compile every Lua file
+        with, which can be shared between updates of different configurations.
+        See :py:func:`run_data_lifecycle` for more information.
+
+    :returns: ``True`` if the data was updated, or ``False`` if the update was
+        skipped because the data was already up to date.
     """
     draftsman_path = os.path.dirname(os.path.abspath(draftsman_root_file))
 
     if game_path is None:
         game_path = os.path.join(draftsman_path, "factorio-data")
-    if game_path is None:
+    if mods_path is None:
         mods_path = os.path.join(draftsman_path, "factorio-mods")
 
+    # Extraction writes to the `data` folder of whichever path it's given
+    if data_profile is None:
+        output_path = draftsman_path
+    else:
+        output_path = os.path.join(get_profiles_path(), data_profile)
+
+    fingerprint = get_update_fingerprint(
+        game_path=game_path,
+        mods_path=mods_path,
+        owned_dlc=owned_dlc,
+        no_mods=no_mods,
+        indexed=indexed,
+        mod_cache_path=mod_cache_path,
+    )
+    previous_fingerprint = read_update_fingerprint(output_path)
+    if not force and previous_fingerprint == fingerprint["fingerprint"]:
+        if verbose:
+            print("Data is already up to date; skipping update.")
+            print("(Use `--force` to update anyway)")
+        return False
+
     # Get the version of Factorio specified by the game data
     with open(os.path.join(game_path, "base", "info.json")) as base_info_file:
         base_info = json.load(base_info_file)
@@ -1971,6 +2548,9 @@ def update_draftsman_data(
         no_mods=no_mods,
         verbose=verbose,
         show_logs=show_logs,
+        mod_cache_path=mod_cache_path,
+        profile=profile,
+        chunk_cache=chunk_cache,
     )
 
     # At this point, `data.raw` in `lua_instance` and should(!) be properly
@@ -1979,13 +2559,27 @@ def update_draftsman_data(
     if verbose:
         print()
 
+    os.makedirs(os.path.join(output_path, "data"), exist_ok=True)
+
     extract_data(
         lua=lua_instance,
-        draftsman_path=draftsman_path,
+        draftsman_path=output_path,
         game_version=factorio_version_info,
         verbose=verbose,
+        indexed=indexed,
+        processes=processes,
+        profile=profile,
+    )
+
+    # Written last (the previous one is removed before any data is replaced), so
+    # that an interrupted update is never considered current
+    write_file_atomically(
+        os.path.join(output_path, "data", "fingerprint.json"),
+        json.dumps(fingerprint, indent=4).encode("utf-8"),
     )
 
     if verbose:
         print("\nUpdate finished.")  # Phew.
         print("hella slick; nothing broke!")
+
+    return True
@@ -306,6 +306,21 @@ class InvalidItemError(DraftsmanError):
     pass
 
 
+# =============================================================================
+# Data
+# =============================================================================
+
+
+class DataNotLoadedError(DraftsmanError):
+    """
+    Raised when accessing a category of data in :py:mod:`draftsman.data` which
+    this process has not been permitted to load with
+    :py:func:`draftsman.data.configure`.
+    """
+
+    pass
+
+
 # =============================================================================
 # Utilities
 # =============================================================================
@@ -319,3 +334,13 @@ class MalformedBlueprintStringError(DraftsmanError):
     """
 
     pass
+
+
+class MalformedSnapshotError(DraftsmanError):
+    """
+    Raised when a binary snapshot cannot be loaded, either because the data is
+    not a Draftsman snapshot, is corrupted, or was written by a different
+    version of Draftsman.
+    """
+
+    pass
@@ -0,0 +1,323 @@
+# instrumentation.py
+
+"""
+Opt-in counters for Draftsman's hot paths, for finding out *why* a particular
+blueprint is slow to work with. Each counter records how many times an
+operation was performed and the cumulative time spent doing so:
+
+.. code-block:: python
+
+    from draftsman import instrumentation
+
+    with instrumentation.snapshot() as stats:
+        blueprint = Blueprint.from_string(blueprint_string)
+    print(stats["entity_constructions"].count, stats["validator_calls"].seconds)
+
+Instrumentation is disabled by default. When disabled, the instrumented
+functions are the original, unwrapped functions, so the only remaining cost is
+a single flag check per validator call.
+
+The counters in :py:data:`counters` are totals for the whole process, and are
+not locked; counts gathered while multiple threads are using Draftsman are
+approximate. Each thread also keeps its own counters, which are what
+:py:func:`snapshot` reports, so a snapshot only includes the work done by the
+thread which took it (and not, for example, that of the worker threads of
+``BlueprintBook.to_string(parallel=True)``). Instrumentation stays enabled
+while any snapshot is active in any thread. Timings include the time spent in
+any nested instrumented calls, so a deepcopy of a blueprint also includes the
+time of the deepcopies of each of its entities.
+"""
+
+import contextlib
+import functools
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+
+class Counter:
+    """
+    The number of times an instrumented operation was performed, and the total
+    number of seconds spent performing it.
+    """
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self, count: int = 0, seconds: float = 0.0):
+        self.count = count
+        self.seconds = seconds
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, Counter)
+            and self.count == other.count
+            and self.seconds == other.seconds
+        )
+
+    def __repr__(self) -> str:  # pragma: no coverage
+        return "Counter(count={}, seconds={})".format(self.count, self.seconds)
+
+
+names = (
+    "entity_constructions",
+    "deepcopies",
+    "validator_calls",
+    "spatial_adds",
+    "spatial_removes",
+    "spatial_queries",
+    "overlap_checks",
+    "structure_calls",
+    "unstructure_calls",
+)
+"""
+The name of every counter.
+"""
+
+counters: dict[str, Counter] = {name: Counter() for name in names}
+"""
+The total of every counter across all threads.
+"""
+
+enabled = False
+"""
+Whether or not instrumentation is currently enabled. Read only; use
+:py:func:`enable` and :py:func:`disable` to change it.
+"""
+
+# Whether `enable()` was called, and how many snapshots are currently active;
+# instrumentation stays enabled while either is the case
+_enabled_explicitly = False
+_active_snapshots = 0
+_lock = threading.Lock()
+
+# Counters of the current thread only
+_local = threading.local()
+
+# (owner, attribute name, original value) of every wrapped function
+_patches: list[tuple[Any, str, Any]] = []
+
+# Instrumented subclass of each type of converter, keyed by that type
+_converter_types: dict[type, type] = {}
+
+
+def _get_thread_counters() -> dict[str, Counter]:
+    try:
+        return _local.counters
+    except AttributeError:
+        _local.counters = {name: Counter() for name in names}
+        return _local.counters
+
+
+def _wrap(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(name, start)
+
+    return wrapper
+
+
+def _get_converter_type(cls: type) -> type:
+    # cattrs converters are slotted, so their methods can't be wrapped on the
+    # instance; instead, each of Draftsman's converters is switched to an
+    # instrumented subclass while enabled, which leaves every other converter
+    # (and cattrs itself) untouched
+    try:
+        return _converter_types[cls]
+    except KeyError:
+
+        def structure(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return cls.structure(self, *args, **kwargs)
+            finally:
+                record("structure_calls", start)
+
+        def unstructure(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return cls.unstructure(self, *args, **kwargs)
+            finally:
+                record("unstructure_calls", start)
+
+        instrumented = type(
+            "Instrumented" + cls.__name__,
+            (cls,),
+            {"__slots__": (), "structure": structure, "unstructure": unstructure},
+        )
+        _converter_types[cls] = instrumented
+        return instrumented
+
+
+def _patch(owner: Any, name: str, wrapper: Callable):
+    _patches.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, wrapper)
+
+
+def _get_entity_classes() -> list[type]:
+    import draftsman.entity
+    from draftsman.classes.entity import Entity
+
+    # Load every prototype class so that all of their constructors are counted
+    for name in draftsman.entity.__all__:
+        getattr(draftsman.entity, name)
+
+    classes = []
+    pending = [Entity]
+    while pending:
+        cls = pending.pop()
+        if cls not in classes:
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+    return [cls for cls in classes if "__init__" in cls.__dict__]
+
+
+def record(name: str, start: float):
+    """
+    Adds a call to the counter ``name`` which started at the time ``start``
+    (from :py:func:`time.perf_counter`). Used for instrumenting code which
+    cannot simply be wrapped.
+    """
+    seconds = time.perf_counter() - start
+    counter = counters[name]
+    counter.count += 1
+    counter.seconds += seconds
+    counter = _get_thread_counters()[name]
+    counter.count += 1
+    counter.seconds += seconds
+
+
+def _install():
+    global enabled
+    if enabled:
+        return
+
+    from draftsman.classes.collection import Collection, CollectionList
+    from draftsman.classes.collision_set import CollisionSet
+    from draftsman.classes.entity_list import EntityList
+    from draftsman.classes.exportable import Exportable
+    from draftsman.classes.spatial_hashmap import SpatialHashMap
+    from draftsman.classes.tile_list import TileList
+    from draftsman.serialization import draftsman_converters
+
+    for cls in _get_entity_classes():
+        _patch(cls, "__init__", _wrap("entity_constructions", cls.__init__))
+
+    for cls in (Exportable, Collection, CollectionList, EntityList, TileList):
+        _patch(cls, "__deepcopy__", _wrap("deepcopies", cls.__deepcopy__))
+
+    _patch(SpatialHashMap, "add", _wrap("spatial_adds", SpatialHashMap.add))
+    _patch(SpatialHashMap, "remove", _wrap("spatial_removes", SpatialHashMap.remove))
+    for name in ("get_all", "get_in_radius", "get_on_point", "get_in_aabb"):
+        _patch(
+            SpatialHashMap,
+            name,
+            _wrap("spatial_queries", getattr(SpatialHashMap, name)),
+        )
+
+    _patch(CollisionSet, "overlaps", _wrap("overlap_checks", CollisionSet.overlaps))
+
+    for version in draftsman_converters.versions.values():
+        for converter in version.converters.values():
+            original = type(converter)
+            _patches.append((converter, "__class__", original))
+            converter.__class__ = _get_converter_type(original)
+
+    enabled = True
+
+
+def _uninstall():
+    global enabled
+    while _patches:
+        owner, name, original = _patches.pop()
+        setattr(owner, name, original)
+    enabled = False
+
+
+def enable():
+    """
+    Starts counting. Enabling instrumentation imports every entity prototype
+    class, so that each of their constructors can be counted. Does nothing if
+    instrumentation is already enabled.
+    """
+    global _enabled_explicitly
+    with _lock:
+        _enabled_explicitly = True
+        _install()
+
+
+def disable():
+    """
+    Stops counting, restoring every instrumented function to its original.
+    If a :py:func:`snapshot` is active in any thread, instrumentation instead
+    stays enabled until the last of them exits. The counters keep their values
+    until :py:func:`reset` is called.
+    """
+    global _enabled_explicitly
+    with _lock:
+        _enabled_explicitly = False
+        if _active_snapshots == 0:
+            _uninstall()
+
+
+def is_enabled() -> bool:
+    """
+    Returns ``True`` if instrumentation is currently enabled.
+    """
+    return enabled
+
+
+def reset():
+    """
+    Sets every counter back to zero, both the totals and those of the current
+    thread.
+    """
+    for counter in (*counters.values(), *_get_thread_counters().values()):
+        counter.count = 0
+        counter.seconds = 0.0
+
+
+def get_counters() -> dict[str, Counter]:
+    """
+    Returns a copy of the current total of every counter, across all threads.
+    """
+    return {
+        name: Counter(counter.count, counter.seconds)
+        for name, counter in counters.items()
+    }
+
+
+@contextlib.contextmanager
+def snapshot() -> Iterator[dict[str, Counter]]:
+    """
+    Context manager which yields a dictionary that, upon exiting, is filled
+    with how much each counter of the current thread grew within the ``with``
+    block. Instrumentation is enabled for the duration of the block if it isn't
+    already, and nested snapshots each see their own totals.
+    """
+    global _active_snapshots
+    with _lock:
+        _active_snapshots += 1
+        _install()
+
+    thread_counters = _get_thread_counters()
+    before = {
+        name: Counter(counter.count, counter.seconds)
+        for name, counter in thread_counters.items()
+    }
+    stats: dict[str, Counter] = {}
+    try:
+        yield stats
+    finally:
+        for name, counter in thread_counters.items():
+            stats[name] = Counter(
+                counter.count - before[name].count,
+                counter.seconds - before[name].seconds,
+            )
+        with _lock:
+            _active_snapshots -= 1
+            if _active_snapshots == 0 and not _enabled_explicitly:
+                _uninstall()
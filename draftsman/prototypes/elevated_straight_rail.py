@@ -3,9 +3,7 @@
 from draftsman.classes.collision_set import CollisionSet
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import DirectionalMixin
-from draftsman.classes.mixins.directional import _rotated_collision_sets
 from draftsman.constants import Direction, EIGHT_WAY_DIRECTIONS
-from draftsman.prototypes.straight_rail import StraightRail
 from draftsman.utils import AABB, Rectangle
 
 from draftsman.data.entities import elevated_straight_rails
@@ -13,24 +11,6 @@ from draftsman.data.entities import elevated_straight_rails
 import attrs
 
 
-# Manually specified collision sets
-_vertical_collision = CollisionSet([AABB(-0.75, -0.99, 0.75, 0.99)])
-_horizontal_collision = _vertical_collision.rotate(4)
-_diagonal_collision = CollisionSet([Rectangle((-0.5, -0.5), 1.25, 1.40, 45)])
-
-for rail_name in elevated_straight_rails:
-    _rotated_collision_sets[rail_name] = {
-        Direction.NORTH: _vertical_collision,
-        Direction.NORTHEAST: _diagonal_collision.rotate(4),
-        Direction.EAST: _horizontal_collision,
-        Direction.SOUTHEAST: _diagonal_collision.rotate(8),
-        Direction.SOUTH: _vertical_collision,
-        Direction.SOUTHWEST: _diagonal_collision.rotate(-4),
-        Direction.WEST: _horizontal_collision,
-        Direction.NORTHWEST: _diagonal_collision,
-    }
-
-
 @attrs.define
 class ElevatedStraightRail(DirectionalMixin, Entity):
     """
@@ -57,6 +37,20 @@ class ElevatedStraightRail(DirectionalMixin, Entity):
 
     # =========================================================================
 
-    _specify_collision_sets = StraightRail._specify_collision_sets
+    def _specify_collision_sets(self) -> dict:
+        vertical = CollisionSet([AABB(-0.75, -0.99, 0.75, 0.99)])
+        horizontal = vertical.rotate(4)
+        diagonal = CollisionSet([Rectangle((-0.5, -0.5), 1.25, 1.40, 45)])
+
+        return {
+            Direction.NORTH: vertical,
+            Direction.NORTHEAST: diagonal.rotate(4),
+            Direction.EAST: horizontal,
+            Direction.SOUTHEAST: diagonal.rotate(8),
+            Direction.SOUTH: vertical,
+            Direction.SOUTHWEST: diagonal.rotate(-4),
+            Direction.WEST: horizontal,
+            Direction.NORTHWEST: diagonal,
+        }
 
     __hash__ = Entity.__hash__
@@ -7,8 +7,14 @@ from cattrs.fns import identity
 from cattrs.gen._lc import generate_unique_filename
 
 import functools
+import hashlib
 import inspect
-from typing import Any, Callable, Optional, TypeVar
+import marshal
+import os
+import sys
+import tempfile
+import types
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -58,6 +64,11 @@ def omit_none_default_unstructure_factory(
     return unstructure_hook
 
 
+@functools.cache
+def _num_parameters(func: Callable) -> int:
+    return len(inspect.signature(func).parameters)
+
+
 class ConverterVersion:
     def __init__(self):
         self.converters: dict[tuple[bool, bool], cattrs.Converter] = {
@@ -112,7 +123,7 @@ class ConverterVersion:
         res = {}
         for subcls in reversed(cls.mro()):
             if subcls in self.structure_funcs:
-                if len(inspect.signature(self.structure_funcs[subcls]).parameters) == 1:
+                if _num_parameters(self.structure_funcs[subcls]) == 1:
                     call_value = self.structure_funcs[subcls](attrs.fields(subcls))
                 else:
                     call_value = self.structure_funcs[subcls](
@@ -436,8 +447,172 @@ def make_unstructure_function_from_schema(
     )
     # print(script)
 
-    eval(compile(script, fname, "exec"), globs)
+    eval(_compile_schema_function(script, fname), globs)
 
     res = globs[fn_name]
 
     return res
+
+
+# =============================================================================
+# Warm-up
+# =============================================================================
+
+_code_cache: Optional[dict[str, types.CodeType]] = None
+_code_cache_modified = False
+
+
+def _compile_schema_function(script: str, fname: str) -> types.CodeType:
+    """
+    Compiles a generated (un)structure function, reusing a previously compiled
+    code object from the code cache if one is loaded and contains this exact
+    source.
+    """
+    global _code_cache_modified
+    if _code_cache is None:
+        return compile(script, fname, "exec")
+
+    key = hashlib.blake2b(script.encode("utf-8"), digest_size=16).hexdigest()
+    code = _code_cache.get(key, None)
+    if code is None:
+        code = compile(script, fname, "exec")
+        _code_cache[key] = code
+        _code_cache_modified = True
+    return code
+
+
+def _get_code_cache_path(cache_dir: str) -> str:
+    """
+    Gets the path of the code cache file for the current environment. Compiled
+    code is specific to the Python interpreter, and the generated functions
+    depend on both the version of Draftsman and the currently loaded mods, so
+    all of these are part of the filename.
+    """
+    from draftsman import __version__  # FIXME: cursed
+    from draftsman.data import mods
+
+    fingerprint = repr(
+        (__version__, sys.implementation.cache_tag, sorted(mods.versions.items()))
+    )
+    digest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(cache_dir, "converters-{}.marshal".format(digest))
+
+
+def _get_exportable_classes() -> list[type]:
+    """
+    Gets every :py:class:`.Exportable` class which is publicly accessible from
+    the module it was defined in.
+    """
+    # Make sure every class that can be exported is defined
+    import draftsman.blueprintable  # FIXME: cursed
+    import draftsman.entity
+    import draftsman.tile
+    from draftsman.classes.exportable import Exportable
+
+    # Prototype classes are only created when first accessed
+    for name in draftsman.entity.__all__:
+        getattr(draftsman.entity, name)
+
+    result = []
+    seen = set()
+    stack = [Exportable]
+    while stack:
+        cls = stack.pop()
+        for subcls in cls.__subclasses__():
+            if subcls in seen:
+                continue
+            seen.add(subcls)
+            stack.append(subcls)
+            # `attrs.define` replaces classes with new slotted versions, which
+            # leaves the originals behind as subclasses of their bases; only
+            # the class actually exposed by its module is used
+            module = sys.modules.get(subcls.__module__, None)
+            if getattr(module, subcls.__qualname__, None) is subcls:
+                result.append(subcls)
+    return result
+
+
+def warmup(
+    versions: Optional[Iterable[tuple[int, ...]]] = None,
+    classes: Optional[Iterable[type]] = None,
+    cache_dir: Optional[str] = None,
+) -> None:
+    """
+    Builds the structure and unstructure hooks for the given classes ahead of
+    time. Normally these hooks are created lazily the first time each class is
+    imported or exported with a particular version, which makes the first
+    call noticeably slower than any subsequent ones. Calling this function
+    once at startup moves that cost out of the first real request, which is
+    useful for long-running services and short-lived workers alike.
+
+    If ``cache_dir`` is provided, the code generated while building the hooks
+    is compiled once and saved to a file in that directory, which is then
+    reused by later calls to this function (in this or any other process)
+    to skip recompiling it. Only hooks built during this call are added to the
+    cache, so this function should be called before anything is imported or
+    exported. The cache file is specific to the current version of Draftsman,
+    version of Python, and set of loaded mods, so changing any of these simply
+    results in a new cache file.
+
+    :param versions: The Factorio versions to build hooks for. Defaults to
+        every version that Draftsman has a converter for.
+    :param classes: The :py:class:`.Exportable` classes to build hooks for.
+        Defaults to every Exportable class in Draftsman, including all entity
+        and tile classes.
+    :param cache_dir: A directory to store compiled code in. The directory is
+        created if it does not exist. If omitted, no cache file is read or
+        written.
+    """
+    global _code_cache, _code_cache_modified
+
+    if versions is None:
+        version_data = list(draftsman_converters.versions.values())
+    else:
+        version_data = [draftsman_converters.get_version(v) for v in versions]
+    if classes is None:
+        classes = _get_exportable_classes()
+
+    classes = list(classes)
+
+    cache_path = None
+    _code_cache = {}
+    if cache_dir is not None:
+        cache_path = _get_code_cache_path(cache_dir)
+        try:
+            with open(cache_path, "rb") as cache_file:
+                _code_cache = marshal.load(cache_file)
+            _code_cache_modified = False
+        except (OSError, EOFError, ValueError, TypeError):
+            # Missing or unreadable; (re)write it once we're done
+            _code_cache_modified = True
+    else:
+        _code_cache_modified = False
+
+    try:
+        # cattrs discards every cached hook whenever it registers a hook for a
+        # new type (such as `list[Icon]`) while building another, so the first
+        # pass only guarantees that every nested type has been registered;
+        # the second pass (which reuses the code compiled in the first) then
+        # builds hooks which stay cached
+        for _ in range(2):
+            for version in version_data:
+                for converter in version.converters.values():
+                    for cls in classes:
+                        converter.get_structure_hook(cls)
+                        converter.get_unstructure_hook(cls)
+
+        if cache_path is not None and _code_cache_modified:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file and swap it in, so that concurrent
+            # processes never see a partially written cache
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir)
+            try:
+                with os.fdopen(fd, "wb") as temp_file:
+                    marshal.dump(_code_cache, temp_file)
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+    finally:
+        _code_cache = None
+        _code_cache_modified = False
@@ -1312,6 +1312,10 @@ draftsman_converters.add_hook_fns(
 )
 
 
+def _unknown_inventory_size(_: Any) -> None:
+    return None
+
+
 @attrs.define
 class Inventory(Exportable):
     """
@@ -1333,7 +1337,7 @@ class Inventory(Exportable):
     )
 
     _size_func: Callable = attrs.field(
-        default=lambda _: None, init=False, repr=True, eq=False
+        default=_unknown_inventory_size, init=False, repr=True, eq=False
     )
 
     def _set_parent(self, entity: Any, old_inventory: "Inventory", size_func=None):
@@ -6,19 +6,24 @@ internally by Draftsman, but can be useful outside of that scope and are
 provided to the user as-is.
 """
 
+from draftsman._version import __version__
 from draftsman.classes.vector import Vector, PrimitiveVector
-from draftsman.error import MalformedBlueprintStringError
+from draftsman.error import MalformedBlueprintStringError, MalformedSnapshotError
 
 from abc import ABCMeta, abstractmethod
 import base64
 import json
 import math
 from functools import wraps
+import gc
+import pickle
+import struct
 
 import attr
 from thefuzz import process
-from typing import Optional, Union, TYPE_CHECKING
+from typing import IO, Any, Optional, Union, TYPE_CHECKING
 import warnings
+import weakref
 import zlib
 
 if TYPE_CHECKING:  # pragma: no coverage
@@ -399,7 +404,9 @@ def string_to_JSON(string: str) -> dict:
         raise MalformedBlueprintStringError(e)
 
 
-def JSON_to_string(JSON: dict) -> str:
+def JSON_to_string(
+    JSON: dict, compression_level: int = 9, sort_keys: bool = False
+) -> str:
     """
     Encodes a JSON dict to a Factorio-readable blueprint string.
 
@@ -415,14 +422,321 @@ def JSON_to_string(JSON: dict) -> str:
         consider using :py:class:`.Blueprint` instead.
 
     :param JSON: The input JSON ``dict`` object.
+    :param compression_level: The zlib compression level to use, from ``0``
+        (no compression) to ``9`` (smallest output, slowest). See
+        :py:class:`.CompressionLevel` for some common presets.
+    :param sort_keys: Whether or not to write the keys of every dictionary in
+        sorted order.
 
     :returns: A ``str`` which can be imported into Factorio.
     """
     return "0" + base64.b64encode(
-        zlib.compress(json.dumps(JSON, separators=(",", ":")).encode("utf-8"), 9)
+        zlib.compress(
+            json.dumps(JSON, separators=(",", ":"), sort_keys=sort_keys).encode(
+                "utf-8"
+            ),
+            compression_level,
+        )
     ).decode("utf-8")
 
 
+def deflate_chunk(
+    data: bytes, compression_level: int = 9, final: bool = False
+) -> bytes:
+    """
+    Compresses ``data`` into a raw deflate segment which can be concatenated
+    with other segments created by this function. Every segment except the last
+    one is byte-aligned with a sync flush; the last segment must be created
+    with ``final=True`` in order to terminate the deflate stream.
+
+    Because zlib releases the GIL while compressing, this function can be
+    called from multiple threads at once. The resulting segments are assembled
+    into a single blueprint string with :py:func:`deflated_chunks_to_string`.
+
+    :param data: The uncompressed bytes of this segment.
+    :param compression_level: The zlib compression level to use.
+    :param final: Whether or not this is the last segment in the stream.
+
+    :returns: The raw (headerless) deflate data of this segment.
+    """
+    compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(
+        zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+    )
+
+
+def deflated_chunks_to_string(
+    chunks: list[bytes], deflated_chunks: list[bytes], compression_level: int = 9
+) -> str:
+    """
+    Stitches together a sequence of raw deflate segments created with
+    :py:func:`deflate_chunk` into a single, valid zlib stream, and then encodes
+    it into a Factorio-readable blueprint string. The output is importable in
+    exactly the same way as the output of :py:func:`JSON_to_string`.
+
+    :param chunks: The uncompressed data of each segment, in order. Used to
+        compute the checksum of the entire stream.
+    :param deflated_chunks: The compressed data of each segment, in the same
+        order as ``chunks``. The last segment must have been created with
+        ``final=True``.
+    :param compression_level: The zlib compression level the segments were
+        compressed with. Only used to populate the zlib header.
+
+    :returns: A ``str`` which can be imported into Factorio.
+    """
+    # zlib header: 32K window, deflate, and the level hint zlib itself would use
+    if compression_level == -1:
+        compression_level = 6
+    if compression_level < 2:
+        header = b"\x78\x01"
+    elif compression_level < 6:
+        header = b"\x78\x5e"
+    elif compression_level == 6:
+        header = b"\x78\x9c"
+    else:
+        header = b"\x78\xda"
+
+    checksum = 1
+    for chunk in chunks:
+        checksum = zlib.adler32(chunk, checksum)
+
+    return (
+        "0"
+        + base64.b64encode(
+            header + b"".join(deflated_chunks) + checksum.to_bytes(4, "big")
+        ).decode("utf-8")
+    )
+
+
+def _sort_keys(value: Any) -> Any:
+    if type(value) is dict:
+        return {k: _sort_keys(v) for k, v in sorted(value.items())}
+    elif type(value) is list:
+        return [_sort_keys(v) for v in value]
+    else:
+        return value
+
+
+def _entity_sort_key(entity: dict) -> tuple:
+    # Entities with the same name and position (stacked rails, or entities
+    # which only differ in direction or quality) are ordered by the rest of
+    # their contents, so that their order never depends on insertion order
+    rest = {k: v for k, v in entity.items() if k != "entity_number"}
+    return (
+        entity["name"],
+        entity["position"]["y"],
+        entity["position"]["x"],
+        entity.get("direction", 0),
+        entity.get("quality", "normal"),
+        json.dumps(rest, sort_keys=True, default=str),
+    )
+
+
+def _canonicalize_blueprint(blueprint: dict) -> None:
+    entities = blueprint.get("entities", [])
+    for i, entity in enumerate(entities):
+        entity.setdefault("entity_number", i + 1)
+    entities.sort(key=_entity_sort_key)
+    new_numbers = {}
+    for i, entity in enumerate(entities):
+        new_numbers[entity["entity_number"]] = i + 1
+        entity["entity_number"] = i + 1
+
+    if "tiles" in blueprint:
+        blueprint["tiles"].sort(
+            key=lambda t: (t["name"], t["position"]["y"], t["position"]["x"])
+        )
+
+    if "wires" in blueprint:
+        wires = set()
+        for wire in blueprint["wires"]:
+            a = (new_numbers[wire[0]], int(wire[1]))
+            b = (new_numbers[wire[2]], int(wire[3]))
+            if b < a:
+                a, b = b, a
+            wires.add(a + b)
+        blueprint["wires"] = [list(wire) for wire in sorted(wires)]
+
+    for schedule in blueprint.get("schedules", []):
+        if "locomotives" in schedule:
+            schedule["locomotives"] = sorted(
+                new_numbers[number] for number in schedule["locomotives"]
+            )
+
+    if "stock_connections" in blueprint:
+        for connection in blueprint["stock_connections"]:
+            for key in ("stock", "front", "back"):
+                if key in connection:
+                    connection[key] = new_numbers[connection[key]]
+        blueprint["stock_connections"].sort(key=lambda c: c["stock"])
+
+
+def _canonicalize_blueprintable(JSON: dict) -> None:
+    if "blueprint" in JSON:
+        _canonicalize_blueprint(JSON["blueprint"])
+    elif "blueprint_book" in JSON:
+        for child in JSON["blueprint_book"].get("blueprints", []):
+            _canonicalize_blueprintable(child)
+
+
+def canonicalize_JSON(JSON: dict, sort_keys: bool = True) -> dict:
+    """
+    Rearranges a blueprintable JSON dict into a canonical order, such that two
+    blueprintables with the same contents always produce the same output
+    regardless of the order in which their contents were added. Canonical
+    output compresses better and produces much smaller diffs when stored in
+    version control.
+
+    Specifically, entities and tiles are sorted by name and then by position
+    (top to bottom, then left to right), entities at the same position are
+    further sorted by direction, quality, and then the rest of their contents,
+    entity numbers are reassigned to match and any references to them (wires,
+    schedule locomotives, and stock connections) are updated, duplicate wires
+    are removed, and the keys of every dictionary are sorted alphabetically.
+    The blueprints inside of blueprint books are canonicalized recursively, but
+    keep their order.
+
+    The result is functionally identical to the input when imported into
+    Factorio.
+
+    :param JSON: The input JSON ``dict``, such as the output of
+        :py:meth:`.Blueprintable.to_dict`. This dict is modified in the process,
+        and should not be reused.
+    :param sort_keys: Whether or not to sort the keys of every dictionary. If
+        the result is going to be encoded immediately, it is much faster to
+        skip this step and pass ``sort_keys=True`` to
+        :py:func:`JSON_to_string` instead.
+
+    :returns: The canonically ordered ``dict``.
+    """
+    _canonicalize_blueprintable(JSON)
+    if sort_keys:
+        return _sort_keys(JSON)
+    return JSON
+
+
+SNAPSHOT_MAGIC = b"DRFTSNAP"
+"""
+The bytes that every Draftsman snapshot begins with.
+"""
+
+SNAPSHOT_FORMAT_VERSION = 1
+"""
+The current version of the snapshot layout written by :py:func:`dump_snapshot`.
+"""
+
+_snapshot_header = struct.Struct("<8sH")
+
+
+class _Referent:
+    """
+    Object which only exists to be the target of a weak reference.
+    """
+
+
+def _dead_weakref() -> weakref.ref:
+    """
+    Returns a weak reference whose referent no longer exists.
+    """
+    return weakref.ref(_Referent())
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickler which also handles the weak references that Draftsman objects hold
+    to each other, such as :py:class:`.Association`. Because pickle preserves
+    object identity within a single dump, each reference is restored pointing
+    at the loaded copy of the object it originally referred to. References
+    whose object no longer exists (such as the parent of an entity which was
+    copied into a blueprint) are restored as dead references.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, weakref.ref):
+            referent = obj()
+            if referent is None:
+                return (_dead_weakref, ())
+            return (type(obj), (referent,))
+        return NotImplemented
+
+
+def dump_snapshot(obj: Any, fp: IO[bytes]) -> None:
+    """
+    Writes ``obj`` to the binary file ``fp`` in Draftsman's native snapshot
+    format. Unlike blueprint strings, snapshots store the internal state of
+    the object directly, so they can be loaded again with
+    :py:func:`load_snapshot` without any decoding, validation, or structuring.
+    Associations, groups, and spatial data are all preserved.
+
+    Snapshots are tied to the version of Draftsman that wrote them, and should
+    only be used as a fast local cache of in-progress work; use blueprint
+    strings for long-term storage or for sharing.
+
+    .. WARNING::
+
+        Snapshots are pickle data, and loading one can execute arbitrary code.
+        Never load snapshots from untrusted sources.
+
+    :param obj: The object to save.
+    :param fp: A file-like object opened in binary mode to write to.
+    """
+    fp.write(_snapshot_header.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION))
+    _SnapshotPickler(fp, protocol=5).dump((__version__, obj))
+
+
+def load_snapshot(fp: IO[bytes]) -> Any:
+    """
+    Reads an object written by :py:func:`dump_snapshot` from the binary file
+    ``fp``.
+
+    .. WARNING::
+
+        Snapshots are pickle data, and loading one can execute arbitrary code.
+        Never load snapshots from untrusted sources.
+
+    :param fp: A file-like object opened in binary mode to read from.
+
+    :returns: The loaded object.
+
+    :exception MalformedSnapshotError: If the data is not a Draftsman snapshot,
+        is corrupted, or was written by a different snapshot format or version
+        of Draftsman.
+    """
+    header = fp.read(_snapshot_header.size)
+    if len(header) != _snapshot_header.size:
+        raise MalformedSnapshotError("Data is too short to be a Draftsman snapshot")
+    magic, format_version = _snapshot_header.unpack(header)
+    if magic != SNAPSHOT_MAGIC:
+        raise MalformedSnapshotError("Data is not a Draftsman snapshot")
+    if format_version != SNAPSHOT_FORMAT_VERSION:
+        raise MalformedSnapshotError(
+            "Snapshot has format version {}, expected {}".format(
+                format_version, SNAPSHOT_FORMAT_VERSION
+            )
+        )
+
+    # Unpickling creates a large number of container objects at once, which
+    # repeatedly triggers the cyclic garbage collector for no benefit
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        version, obj = pickle.load(fp)
+    except Exception as e:
+        raise MalformedSnapshotError(e)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    if version != __version__:
+        raise MalformedSnapshotError(
+            "Snapshot was written by Draftsman {}, but this is Draftsman {}".format(
+                version, __version__
+            )
+        )
+
+    return obj
+
+
 def encode_version(major: int, minor: int, patch: int = 0, dev_ver: int = 0) -> int:
     """
     Converts version components to version number.
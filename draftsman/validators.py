@@ -1,7 +1,8 @@
 # validators.py
 
+from draftsman import instrumentation
 from draftsman.constants import ValidationMode
-from draftsman.error import DataFormatError
+from draftsman.error import DataFormatError, DataNotLoadedError
 from draftsman.warning import DraftsmanWarning
 
 import attr
@@ -9,6 +10,7 @@ import attrs
 
 import inspect
 import operator
+import time
 from typing import (
     Annotated,
     Any,
@@ -82,7 +84,9 @@ def conditional(severity):
     """
     Only run the validator if `mode` is greater than a given severity.
     If an ``error_list`` or ``warning_list`` is provided, mutate that instead of
-    raising/warning.
+    raising/warning. Validators which need a category of data that this process
+    is not permitted to load (see :py:func:`draftsman.data.configure`) are
+    skipped.
     """
     global _validation_mode
 
@@ -99,14 +103,20 @@ def conditional(severity):
             if mode < severity:
                 return
 
+            start = time.perf_counter() if instrumentation.enabled else None
             try:
                 with warnings.catch_warnings(record=True) as ws:
                     meth(*args)
+            except DataNotLoadedError:
+                return
             except Exception as e:
                 if error_list is None:
                     raise e
                 else:
                     error_list.append(e)
+            finally:
+                if start is not None:
+                    instrumentation.record("validator_calls", start)
 
             if warning_list is None:
                 for w in ws:
@@ -129,14 +139,20 @@ def conditional(severity):
             mode = mode if mode is not None else _validation_mode
             if mode < severity:
                 return
+            start = time.perf_counter() if instrumentation.enabled else None
             try:
                 with warnings.catch_warnings(record=True) as ws:
                     meth(*args)
+            except DataNotLoadedError:
+                return
             except Exception as e:
                 if error_list is None:
                     raise e
                 else:
                     error_list.append(e)
+            finally:
+                if start is not None:
+                    instrumentation.record("validator_calls", start)
 
             if warning_list is None:
                 for w in ws:
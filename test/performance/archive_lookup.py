@@ -0,0 +1,116 @@
+# archive_lookup.py
+
+"""
+Measures how long resolving every ``require()`` of a synthetic modpack of
+zipped mods takes, the way ``draftsman update`` does while running the data
+lifecycle. Every mod requires each of its own files, and a handful of files
+from a shared library mod, through a ``package.path`` where only the last
+pattern matches:
+
+* ``probe``: tries every pattern by reading it from the archive and catching
+  the ``KeyError``, which is how archives used to be searched.
+* ``indexed``: resolves every pattern against the normalized index each mod
+  builds of its archive, with the decoded files of each mod kept in an LRU
+  cache.
+
+Run directly to print the time each method takes.
+"""
+
+from draftsman.environment.mod_list import archive_to_string, register_mod
+from draftsman.environment.update import py_search_archive
+
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+
+
+mod_count = 300
+files_per_mod = 40
+library_files = 10
+
+
+def create_modpack(path: str) -> list:
+    """
+    Writes ``mod_count`` zipped mods (plus a library mod) to ``path``, and
+    returns the registered mods.
+    """
+    mods = []
+    for index in range(mod_count + 1):
+        name = "library" if index == mod_count else "mod-{}".format(index)
+        folder = "{}_1.0.0".format(name)
+        location = os.path.join(path, folder + ".zip")
+        with zipfile.ZipFile(location, "w", zipfile.ZIP_DEFLATED) as archive:
+            info = {
+                "name": name,
+                "version": "1.0.0",
+                "title": name,
+                "author": "Someone",
+                "factorio_version": "2.0",
+            }
+            archive.writestr(folder + "/info.json", json.dumps(info))
+            for file in range(files_per_mod):
+                source = "\n".join(
+                    "local value_{} = {{name = '{}', index = {}}}".format(i, name, i)
+                    for i in range(50)
+                )
+                archive.writestr(
+                    "{}/prototypes/{}/file-{}.lua".format(folder, file % 4, file),
+                    source,
+                )
+        mods.append(register_mod(folder + ".zip", location))
+    return mods
+
+
+modpack_path = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, modpack_path, ignore_errors=True)
+*mods, library = create_modpack(modpack_path)
+
+
+def probe(mod, module_name: str, package_path: str):
+    for filepath in package_path.split(";"):
+        filepath = filepath.replace("?", module_name).replace("\\", "/")
+        filepath = filepath.replace(mod.location, mod.archive_folder)
+        filepath = filepath.replace(f"__{mod.name}__", mod.archive_folder)
+        try:
+            return archive_to_string(mod.archive, filepath), None
+        except KeyError:
+            pass
+    return None, "not found"
+
+
+def main(method: str = "indexed"):
+    search = py_search_archive if method == "indexed" else probe
+    for mod in mods + [library]:
+        mod._archive_files.clear()
+    for mod in mods + [library]:
+        package_path = ";".join(
+            (
+                "/draftsman/compatibility/?.lua",
+                "/factorio/core/lualib/?.lua",
+                "?.lua",
+                "__{}__/?.lua".format(mod.name),
+            )
+        )
+        for file in range(files_per_mod):
+            module_name = "prototypes/{}/file-{}".format(file % 4, file)
+            source, _ = search(mod, module_name, package_path)
+            assert source is not None
+    # Every mod also uses the library
+    package_path = "?.lua;__library__/?.lua"
+    for mod in mods:
+        for file in range(library_files):
+            module_name = "prototypes/{}/file-{}".format(file % 4, file)
+            source, _ = search(library, module_name, package_path)
+            assert source is not None
+
+
+if __name__ == "__main__":
+    import time
+
+    for method in ("probe", "indexed"):
+        start = time.perf_counter()
+        main(method)
+        print("{}: {:.3f}s".format(method, time.perf_counter() - start))
@@ -0,0 +1,47 @@
+# canonicalize.py
+
+"""
+Compares the size and encoding time of a blueprint string with and without
+canonical ordering. Run directly to print a report.
+"""
+
+from draftsman.utils import JSON_to_string, canonicalize_JSON, string_to_JSON
+
+import copy
+import time
+
+with open("test/performance/huge_blueprint_book.txt") as file:
+    book_json = string_to_JSON(file.read())
+
+
+def encode(data: dict, canonical: bool) -> str:
+    if canonical:
+        data = canonicalize_JSON(data, sort_keys=False)
+    return JSON_to_string(data, sort_keys=canonical)
+
+
+def main():
+    return encode(copy.deepcopy(book_json), canonical=True)
+
+
+def report():
+    results = {}
+    for canonical in (False, True):
+        data = copy.deepcopy(book_json)
+        start = time.perf_counter()
+        string = encode(data, canonical)
+        results[canonical] = (len(string), time.perf_counter() - start)
+
+    original_size, original_time = results[False]
+    canonical_size, canonical_time = results[True]
+    print("original:  {} bytes in {:.3f}s".format(original_size, original_time))
+    print("canonical: {} bytes in {:.3f}s".format(canonical_size, canonical_time))
+    print(
+        "size reduction: {:.1%}, time overhead: {:.1%}".format(
+            1 - canonical_size / original_size, canonical_time / original_time - 1
+        )
+    )
+
+
+if __name__ == "__main__":
+    report()
@@ -0,0 +1,78 @@
+# convert_data_raw.py
+
+"""
+Compares the two ways ``draftsman update`` can bring ``data.raw`` from Lua
+into Python, on a synthetic ``data.raw`` shaped like the game's prototypes:
+
+* ``per_category``: calling ``convert_table_to_dict()`` on each prototype
+  category, which crosses the Lua/Python boundary for every key and value. This
+  converts each category only once, whereas the extraction functions used to
+  convert some categories (such as items and entities) several times over.
+* ``bulk``: serializing all of ``data.raw`` to one string in Lua and parsing it
+  in one pass with ``convert_table_bulk()``, which is what the extraction
+  functions now share.
+
+Run directly to print the time each method takes.
+"""
+
+from draftsman.environment.update import convert_table_bulk, convert_table_to_dict
+
+import lupa.lua52 as lupa
+
+
+lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+lua.execute(
+    """
+    data = {raw = {}}
+    for c = 1, 50 do
+        local category = {}
+        for p = 1, 200 do
+            local name = "prototype-" .. c .. "-" .. p
+            category[name] = {
+                type = "category-" .. c,
+                name = name,
+                order = string.format("a[%d]-b[%d]", c, p),
+                flags = {"placeable-neutral", "player-creation"},
+                minable = {mining_time = 0.1, result = name},
+                max_health = 150,
+                collision_box = {{-0.35, -0.35}, {0.35, 0.35}},
+                selection_box = {{-0.5, -0.5}, {0.5, 0.5}},
+                icons = {{icon = "__base__/graphics/icons/" .. name .. ".png"}},
+                fluid_boxes = {
+                    {
+                        volume = 100,
+                        pipe_connections = {
+                            {flow_direction = "input", direction = 0, position = {0, -1}},
+                            {flow_direction = "output", direction = 8, position = {0, 1}},
+                        },
+                    },
+                },
+                picture = {
+                    layers = {
+                        {filename = name .. ".png", width = 64, height = 64, scale = 0.5},
+                        {filename = name .. "-shadow.png", width = 96, height = 64, shift = {0.25, 0}},
+                    },
+                },
+            }
+        end
+        data.raw["category-" .. c] = category
+    end
+    """
+)
+
+
+def main(method: str = "bulk"):
+    if method == "bulk":
+        return convert_table_bulk(lua, lua.globals().data.raw)
+    else:
+        raw = lua.globals().data.raw
+        return {name: convert_table_to_dict(category) for name, category in raw.items()}
+
+
+if __name__ == "__main__":
+    import time
+
+    for method in ("per_category", "bulk"):
+        start = time.perf_counter()
+        main(method)
+        print("{}: {:.3f}s".format(method, time.perf_counter() - start))
@@ -0,0 +1,72 @@
+# data_footprint.py
+
+"""
+Measures the peak resident memory of a fresh worker process which decodes and
+re-encodes a blueprint string with the default validation mode. The "minimal"
+profile only permits the entity data to load with ``DRAFTSMAN_DATA_LOAD``, which
+skips any validation that needs other categories (like recipes and tiles); the
+"full" profile loads every data category up front, which is what every process
+did before data was loaded lazily.
+
+Run directly to print the peak RSS of both profiles.
+"""
+
+import os
+import subprocess
+import sys
+
+
+worker = """
+from draftsman import data
+from draftsman.blueprintable import Blueprint, get_blueprintable_from_string
+
+import importlib
+import resource
+import warnings
+
+if {full}:
+    for category in data.categories:
+        importlib.import_module("draftsman.data." + category)._lazy.load()
+
+warnings.simplefilter("ignore")
+names = ("transport-belt", "inserter", "wooden-chest", "assembling-machine-1")
+blueprint = Blueprint()
+for i in range(2000):
+    blueprint.entities.append(
+        names[i % len(names)], tile_position=(4 * (i % 50), 4 * (i // 50))
+    )
+blueprint.entities[3].recipe = "iron-gear-wheel"
+blueprint.tiles.append("refined-concrete")
+string = blueprint.to_string()
+get_blueprintable_from_string(string).to_string()
+
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+profiles = {
+    "minimal": "entities",
+    "full": "",
+}
+
+
+def main(profile: str = "minimal") -> int:
+    """
+    Runs a worker with the given profile and returns its peak RSS in KiB.
+    """
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    env["DRAFTSMAN_DATA_LOAD"] = profiles[profile]
+    result = subprocess.run(
+        [sys.executable, "-c", worker.format(full=profile == "full")],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return int(result.stdout.split()[-1])
+
+
+if __name__ == "__main__":
+    for profile in profiles:
+        print("{}: {:.1f} MiB".format(profile, main(profile) / 1024))
@@ -0,0 +1,178 @@
+# environment_builds.py
+
+"""
+Measures how long running the data lifecycle for three different mod
+configurations back to back takes, all sharing the same synthetic ``core`` and
+``base`` (which, like the real ones, are mostly large table constructors):
+
+* ``fresh``: compiles every Lua file again for each configuration.
+* ``cached``: shares a new ``ChunkCache`` between the three builds, so each file
+  is only compiled by the first build to load it.
+* ``warm``: shares a ``ChunkCache`` which was already used to build every
+  configuration, so no build compiles anything.
+
+Run directly to print the time each method takes.
+"""
+
+from draftsman.environment.chunk_cache import ChunkCache
+from draftsman.environment.update import run_data_lifecycle
+
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+
+
+prototype_files = 40
+prototypes_per_file = 50
+configurations = (("mod-a",), ("mod-a", "mod-b"), ("mod-b", "mod-c"))
+
+
+def generate_prototypes(mod_name: str, file: int) -> str:
+    """
+    Returns the source of a prototype file which extends ``data`` with
+    ``prototypes_per_file`` entities.
+    """
+    prototypes = []
+    for index in range(prototypes_per_file):
+        name = "{}-entity-{}-{}".format(mod_name, file, index)
+        prototypes.append(
+            """
+    {{
+        type = "container",
+        name = "{name}",
+        icon = "__{mod}__/graphics/icons/{name}.png",
+        flags = {{"placeable-neutral", "player-creation"}},
+        minable = {{mining_time = 0.1, result = "{name}"}},
+        max_health = {health},
+        corpse = "small-remnants",
+        collision_box = {{{{-0.35, -0.35}}, {{0.35, 0.35}}}},
+        selection_box = {{{{-0.5, -0.5}}, {{0.5, 0.5}}}},
+        resistances = {{
+            {{type = "fire", percent = 90}},
+            {{type = "impact", percent = 60, decrease = 5}},
+        }},
+        inventory_size = {index},
+        picture = {{
+            layers = {{
+                {{
+                    filename = "__{mod}__/graphics/{name}.png",
+                    width = 64, height = 80, scale = 0.5,
+                }},
+                {{
+                    filename = "__{mod}__/graphics/{name}-shadow.png",
+                    width = 112, height = 46, scale = 0.5, draw_as_shadow = true,
+                }},
+            }},
+        }},
+        circuit_wire_max_distance = util.by_pixel(7.5, 7.5)[1],
+    }},""".format(
+                name=name, mod=mod_name, health=100 + index, index=index
+            )
+        )
+    return "data:extend({{{}\n}})\n".format("".join(prototypes))
+
+
+def create_environment(path: str) -> tuple[str, list[str]]:
+    """
+    Writes a game folder with ``core`` and ``base`` and a mods folder for each
+    configuration to ``path``, and returns the path of each.
+    """
+    game_path = os.path.join(path, "game")
+    lualib_path = os.path.join(game_path, "core", "lualib")
+    os.makedirs(lualib_path)
+    with open(os.path.join(lualib_path, "util.lua"), "w") as util_file:
+        util_file.write(
+            "util = {}\n"
+            "function util.by_pixel(x, y) return {x / 32, y / 32} end\n"
+            "return util\n"
+        )
+    with open(os.path.join(lualib_path, "dataloader.lua"), "w") as dataloader_file:
+        dataloader_file.write(
+            "data = {raw = {}}\n"
+            "function data:extend(prototypes)\n"
+            "    for _, prototype in ipairs(prototypes) do\n"
+            "        self.raw[prototype.type] = self.raw[prototype.type] or {}\n"
+            "        self.raw[prototype.type][prototype.name] = prototype\n"
+            "    end\n"
+            "end\n"
+        )
+
+    base_path = os.path.join(game_path, "base")
+    os.makedirs(os.path.join(base_path, "prototypes"))
+    requires = []
+    for file in range(prototype_files):
+        filename = os.path.join(base_path, "prototypes", "file-{}.lua".format(file))
+        with open(filename, "w") as prototype_file:
+            prototype_file.write(generate_prototypes("base", file))
+        requires.append('require("prototypes.file-{}")\n'.format(file))
+    with open(os.path.join(base_path, "data.lua"), "w") as data_file:
+        data_file.write("".join(requires))
+
+    for name in ("core", "base"):
+        with open(os.path.join(game_path, name, "info.json"), "w") as info_file:
+            info = {"name": name, "version": "2.0.0", "title": name, "author": "Wube"}
+            json.dump(info, info_file)
+
+    mods_paths = []
+    for index, mod_names in enumerate(configurations):
+        mods_path = os.path.join(path, "mods-{}".format(index))
+        os.makedirs(mods_path)
+        for mod_name in mod_names:
+            folder = "{}_1.0.0".format(mod_name)
+            location = os.path.join(mods_path, folder + ".zip")
+            with zipfile.ZipFile(location, "w") as archive:
+                info = {
+                    "name": mod_name,
+                    "version": "1.0.0",
+                    "title": mod_name,
+                    "author": "Someone",
+                    "factorio_version": "2.0",
+                    "dependencies": ["base"],
+                }
+                archive.writestr(folder + "/info.json", json.dumps(info))
+                archive.writestr(
+                    folder + "/data.lua",
+                    'require("prototypes.file-0")\nrequire("prototypes.file-1")\n',
+                )
+                for file in range(2):
+                    archive.writestr(
+                        "{}/prototypes/file-{}.lua".format(folder, file),
+                        generate_prototypes(mod_name, file),
+                    )
+        mods_paths.append(mods_path)
+
+    return game_path, mods_paths
+
+
+environment_path = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, environment_path, ignore_errors=True)
+game_path, mods_paths = create_environment(environment_path)
+warm_cache = ChunkCache()
+for mods_path in mods_paths:
+    run_data_lifecycle(game_path, mods_path, chunk_cache=warm_cache)
+
+
+def main(method: str = "cached"):
+    if method == "fresh":
+        chunk_cache = None
+    elif method == "cached":
+        chunk_cache = ChunkCache()
+    else:
+        chunk_cache = warm_cache
+
+    for mods_path in mods_paths:
+        lua = run_data_lifecycle(game_path, mods_path, chunk_cache=chunk_cache)
+        count = lua.eval('table_size(data.raw["container"])')
+        assert count > prototype_files * prototypes_per_file
+
+
+if __name__ == "__main__":
+    import time
+
+    for method in ("fresh", "cached", "warm"):
+        start = time.perf_counter()
+        main(method)
+        print("{}: {:.3f}s".format(method, time.perf_counter() - start))
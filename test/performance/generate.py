@@ -0,0 +1,247 @@
+# generate.py
+
+"""
+Deterministic generators for large synthetic blueprints, used by the scaling
+benchmarks. Each generator takes a target ``size`` (the approximate number of
+entities, or of tiles for :py:func:`tile_floor`), a ``wire_density`` between 0
+and 1 which is the probability that each circuit connectable entity is wired to
+the one placed before it, and a ``seed``; the same arguments always produce the
+same blueprint.
+
+Run directly to print the number of entities, tiles and wires each generator
+creates for a given size.
+"""
+
+from draftsman.blueprintable import Blueprint
+from draftsman.classes.collection import Collection
+from draftsman.classes.group import Group
+from draftsman.constants import Direction
+from draftsman.utils import flatten_entities
+
+import math
+import random
+from typing import Callable
+
+
+def _wire(collection: Collection, entities: list, wire_density: float, rng):
+    """
+    Connects each entity in ``entities`` to the previous one with a red or green
+    wire with a probability of ``wire_density``.
+    """
+    for previous, current in zip(entities, entities[1:]):
+        if rng.random() < wire_density:
+            collection.add_circuit_connection(
+                rng.choice(("red", "green")), previous, current
+            )
+
+
+def belt_grid(size: int, wire_density: float = 0.0, seed: int = 0) -> Blueprint:
+    """
+    A square grid of transport belts, where each row runs in the opposite
+    direction to the one above it.
+    """
+    rng = random.Random(seed)
+    blueprint = Blueprint()
+    side = math.ceil(math.sqrt(size))
+    belts = []
+    for i in range(size):
+        y, x = divmod(i, side)
+        belts.append(
+            blueprint.entities.append(
+                "transport-belt",
+                tile_position=(x, y),
+                direction=Direction.EAST if y % 2 == 0 else Direction.WEST,
+            )
+        )
+    _wire(blueprint, belts, wire_density, rng)
+    return blueprint
+
+
+def beacon_array(size: int, wire_density: float = 0.0, seed: int = 0) -> Blueprint:
+    """
+    A checkerboard of assembling machines and beacons, with a medium electric
+    pole in the corner of every cell. Only the assembling machines are wired.
+    """
+    rng = random.Random(seed)
+    blueprint = Blueprint()
+    # Each 4x4 cell holds a 3x3 machine and a pole
+    side = math.ceil(math.sqrt(size / 2))
+    machines = []
+    for i in range(math.ceil(size / 2)):
+        y, x = divmod(i, side)
+        if (x + y) % 2 == 0:
+            machines.append(
+                blueprint.entities.append(
+                    "assembling-machine-2", tile_position=(4 * x, 4 * y)
+                )
+            )
+        else:
+            blueprint.entities.append("beacon", tile_position=(4 * x, 4 * y))
+        blueprint.entities.append(
+            "medium-electric-pole", tile_position=(4 * x + 3, 4 * y + 3)
+        )
+    _wire(blueprint, machines, wire_density, rng)
+    return blueprint
+
+
+def combinator_rom(
+    size: int, wire_density: float = 1.0, seed: int = 0, signals: int = 20
+) -> Blueprint:
+    """
+    Columns of constant combinators, each holding ``signals`` random virtual
+    signal values, like the read-only memory of a circuit network computer.
+    Unlike the other generators every combinator is wired by default.
+    """
+    rng = random.Random(seed)
+    blueprint = Blueprint()
+    side = math.ceil(math.sqrt(size))
+    names = ["signal-{}".format(c) for c in "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+    combinators = []
+    for i in range(size):
+        y, x = divmod(i, side)
+        combinator = blueprint.entities.append(
+            "constant-combinator", tile_position=(x, 2 * y)
+        )
+        section = combinator.add_section()
+        for index in range(signals):
+            section.set_signal(
+                index,
+                names[index % len(names)],
+                rng.randint(-(2**31), 2**31 - 1),
+                type="virtual",
+            )
+        combinators.append(combinator)
+    _wire(blueprint, combinators, wire_density, rng)
+    return blueprint
+
+
+def rail_network(size: int, wire_density: float = 0.0, seed: int = 0) -> Blueprint:
+    """
+    Parallel east-west lines of straight rail spaced 8 tiles apart, with a rail
+    signal beside every 8th rail. The rail signals are wired.
+    """
+    rng = random.Random(seed)
+    blueprint = Blueprint()
+    # Every 8 rails has 1 signal
+    length = math.ceil(math.sqrt(size * 8 / 9))
+    signals = []
+    count = 0
+    y = 0
+    while count < size:
+        for x in range(length):
+            blueprint.entities.append(
+                "straight-rail", tile_position=(2 * x, y), direction=Direction.EAST
+            )
+            count += 1
+            if x % 8 == 0:
+                signals.append(
+                    blueprint.entities.append(
+                        "rail-signal",
+                        tile_position=(2 * x, y + 2),
+                        direction=Direction.EAST,
+                    )
+                )
+                count += 1
+            if count >= size:
+                break
+        y += 8
+    _wire(blueprint, signals, wire_density, rng)
+    return blueprint
+
+
+def tile_floor(size: int, wire_density: float = 0.0, seed: int = 0) -> Blueprint:
+    """
+    A square floor of ``size`` tiles in a random mix of concrete types, lit by
+    a lamp every 8 tiles in each direction. The lamps are wired.
+    """
+    rng = random.Random(seed)
+    blueprint = Blueprint()
+    names = ("concrete", "refined-concrete", "hazard-concrete-left")
+    side = math.ceil(math.sqrt(size))
+    lamps = []
+    for i in range(size):
+        y, x = divmod(i, side)
+        blueprint.tiles.append(rng.choice(names), position=(x, y))
+        if x % 8 == 0 and y % 8 == 0:
+            lamps.append(blueprint.entities.append("small-lamp", tile_position=(x, y)))
+    _wire(blueprint, lamps, wire_density, rng)
+    return blueprint
+
+
+def nested_groups(
+    size: int, wire_density: float = 0.0, seed: int = 0, depth: int = 4
+) -> Blueprint:
+    """
+    A tree of groups ``depth`` levels deep where every group has 4 children,
+    with the inserters spread evenly between the groups at the bottom. Wires
+    are added to the group which holds both inserters.
+    """
+    rng = random.Random(seed)
+    blueprint = Blueprint()
+    leaves = 4 ** (depth - 1)
+    per_leaf = math.ceil(size / leaves)
+    side = math.ceil(math.sqrt(per_leaf))
+    count = 0
+
+    def populate(collection: Collection, level: int, index: int):
+        nonlocal count
+        if level == depth - 1:
+            inserters = []
+            for i in range(min(per_leaf, size - count)):
+                y, x = divmod(i, side)
+                inserters.append(
+                    collection.entities.append("inserter", tile_position=(x, y))
+                )
+            count += len(inserters)
+            _wire(collection, inserters, wire_density, rng)
+            return
+        for child in range(4):
+            child_index = 4 * index + child
+            # Lay children out in a 2x2 square, so that no two leaves overlap
+            span = side * 2 ** (depth - level - 2)
+            group = Group(
+                id="group_{}_{}".format(level, child_index),
+                position=(span * (child % 2), span * (child // 2)),
+            )
+            # Fill the group before adding it, so that its contents are added
+            # to the spatial map of the blueprint
+            populate(group, level + 1, child_index)
+            collection.groups.append(group, copy=False)
+
+    populate(blueprint, 0, 0)
+    return blueprint
+
+
+generators: dict[str, Callable[..., Blueprint]] = {
+    "belt_grid": belt_grid,
+    "beacon_array": beacon_array,
+    "combinator_rom": combinator_rom,
+    "rail_network": rail_network,
+    "tile_floor": tile_floor,
+    "nested_groups": nested_groups,
+}
+
+
+if __name__ == "__main__":
+    import argparse
+    import warnings
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("size", type=int)
+    parser.add_argument("--wire-density", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    for name, generator in generators.items():
+        blueprint = generator(args.size, args.wire_density, args.seed)
+        # Wires inside of groups are only gathered when flattened
+        wires = blueprint.to_dict()["blueprint"].get("wires", [])
+        print(
+            "{}: {} entities, {} tiles, {} wires".format(
+                name,
+                len(flatten_entities(blueprint)),
+                len(blueprint.tiles),
+                len(wires),
+            )
+        )
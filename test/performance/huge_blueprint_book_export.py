@@ -0,0 +1,27 @@
+# huge_blueprint_book_export.py
+
+"""
+Exports the huge blueprint book fixture back to a blueprint string.
+"""
+
+from draftsman.blueprintable import get_blueprintable_from_string
+from draftsman.warning import OverlappingObjectsWarning, UnknownElementWarning
+
+import os
+import warnings
+
+
+with open(os.path.join(os.path.dirname(__file__), "huge_blueprint_book.txt")) as file:
+    with warnings.catch_warnings():
+        # This book includes things that a vanilla environment won't recognize
+        warnings.filterwarnings("ignore", category=OverlappingObjectsWarning)
+        warnings.filterwarnings("ignore", category=UnknownElementWarning)
+        book = get_blueprintable_from_string(file.read())
+
+
+def main():
+    return book.to_string()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# import_time.py
+
+"""
+Times how long it takes to import a Draftsman module (by default
+``draftsman.blueprintable``) in a fresh interpreter. A "cold" import uses an
+empty bytecode cache, so every module has to be compiled from source; a "warm"
+import reuses the existing ``__pycache__`` directories, which is what most
+programs will see.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+
+# Every public top-level module
+modules = (
+    "draftsman",
+    "draftsman.blueprintable",
+    "draftsman.constants",
+    "draftsman.data",
+    "draftsman.entity",
+    "draftsman.error",
+    "draftsman.extras",
+    "draftsman.rail",
+    "draftsman.serialization",
+    "draftsman.signatures",
+    "draftsman.tile",
+    "draftsman.types",
+    "draftsman.utils",
+    "draftsman.validators",
+    "draftsman.warning",
+)
+
+
+def main(cold: bool = False, module: str = "draftsman.blueprintable"):
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        args = [sys.executable]
+        if cold:
+            args += ["-X", "pycache_prefix={}".format(cache_dir)]
+        args += ["-c", "import {}".format(module)]
+        subprocess.run(args, env=env, check=True)
+
+
+if __name__ == "__main__":
+    main(cold="--cold" in sys.argv)
@@ -0,0 +1,22 @@
+# load_snapshot.py
+
+from draftsman.blueprintable import Blueprint
+
+import io
+
+
+blueprint = Blueprint()
+for y in range(100):
+    for x in range(100):
+        blueprint.entities.append("wooden-chest", tile_position=(x, y))
+snapshot = io.BytesIO()
+blueprint.dump(snapshot)
+
+
+def main():
+    snapshot.seek(0)
+    Blueprint.load(snapshot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+# load_string.py
+
+from draftsman.blueprintable import Blueprint
+
+
+blueprint = Blueprint()
+for y in range(100):
+    for x in range(100):
+        blueprint.entities.append("wooden-chest", tile_position=(x, y))
+blueprint_string = blueprint.to_string()
+
+
+def main():
+    Blueprint.from_string(blueprint_string)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# mod_discovery.py
+
+"""
+Measures how long ``discover_mods()`` takes to find a synthetic modpack of
+zipped mods, which ``draftsman list``, ``enable``, ``disable`` and ``update``
+all do before anything else:
+
+* ``uncached``: opens every archive and parses its ``info.json`` in turn.
+* ``parallel``: the same, but with each archive read in a thread pool.
+* ``cached``: reuses the metadata of every archive from a mod cache written by
+  a previous call, so no archive is opened at all.
+
+Run directly to print the time each method takes.
+"""
+
+from draftsman.environment.mod_list import discover_mods
+
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+
+
+mod_count = 300
+files_per_mod = 40
+
+
+def create_environment(path: str) -> tuple[str, str]:
+    """
+    Writes a minimal game folder and ``mod_count`` zipped mods to ``path``, and
+    returns the path of each.
+    """
+    game_path = os.path.join(path, "game")
+    for name in ("core", "base"):
+        os.makedirs(os.path.join(game_path, name))
+        with open(os.path.join(game_path, name, "info.json"), "w") as info_file:
+            info = {"name": name, "version": "2.0.0", "title": name, "author": "Wube"}
+            json.dump(info, info_file)
+    mods_path = os.path.join(path, "mods")
+    os.makedirs(mods_path)
+    for index in range(mod_count):
+        name = "mod-{}".format(index)
+        folder = "{}_1.0.0".format(name)
+        location = os.path.join(mods_path, folder + ".zip")
+        with zipfile.ZipFile(location, "w", zipfile.ZIP_DEFLATED) as archive:
+            info = {
+                "name": name,
+                "version": "1.0.0",
+                "title": name,
+                "author": "Someone",
+                "factorio_version": "2.0",
+                "dependencies": ["base"],
+            }
+            archive.writestr(folder + "/info.json", json.dumps(info))
+            archive.writestr(folder + "/data.lua", "require('prototypes.file-0')")
+            for file in range(files_per_mod):
+                archive.writestr(
+                    "{}/prototypes/file-{}.lua".format(folder, file),
+                    "local value = {}".format(file),
+                )
+    return game_path, mods_path
+
+
+environment_path = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, environment_path, ignore_errors=True)
+game_path, mods_path = create_environment(environment_path)
+cache_path = os.path.join(environment_path, "mod-cache.json")
+discover_mods(game_path, mods_path, cache_path=cache_path)
+
+
+def main(method: str = "cached"):
+    if method == "cached":
+        mods = discover_mods(game_path, mods_path, cache_path=cache_path)
+    else:
+        mods = discover_mods(game_path, mods_path, parallel=method == "parallel")
+    assert len(mods) == mod_count + 2
+
+
+if __name__ == "__main__":
+    import time
+
+    for method in ("uncached", "parallel", "cached"):
+        start = time.perf_counter()
+        main(method)
+        print("{}: {:.3f}s".format(method, time.perf_counter() - start))
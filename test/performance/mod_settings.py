@@ -0,0 +1,120 @@
+# mod_settings.py
+
+"""
+Measures how long decoding and encoding a large generated ``mod-settings.dat``
+takes, the way ``draftsman update`` reads it when applying user settings:
+
+* ``stream``: reads each field with its own ``read()`` call and
+  ``struct.unpack()``, which is how ``decode_mod_settings()`` used to work.
+* ``decode``: ``decode_mod_settings()``, which unpacks each field at its offset
+  in a single buffer.
+* ``encode``: ``encode_mod_settings()``, which builds the file in a single
+  ``bytearray``.
+
+Run directly to print the time each method takes.
+"""
+
+from draftsman.environment.mod_settings import (
+    PropertyTreeType,
+    decode_mod_settings,
+    encode_mod_settings,
+)
+
+import io
+import struct
+
+
+mod_count = 500
+settings_per_mod = 20
+
+
+def generate_mod_settings() -> dict:
+    """
+    Returns the settings of ``mod_count`` mods with ``settings_per_mod``
+    settings each, spread across every setting type and using every kind of
+    value that mods can have.
+    """
+    mod_settings = {"startup": {}, "runtime-global": {}, "runtime-per-user": {}}
+    setting_types = list(mod_settings)
+    for mod in range(mod_count):
+        for setting in range(settings_per_mod):
+            name = "mod-{}-setting-{}".format(mod, setting)
+            kind = setting % 5
+            if kind == 0:
+                value = setting % 2 == 0
+            elif kind == 1:
+                value = setting * 0.25
+            elif kind == 2:
+                value = setting * 1000
+            elif kind == 3:
+                value = "some-value-{}".format(setting)
+            else:
+                value = {"r": 1.0, "g": 0.5, "b": 0.25, "a": 1.0}
+            setting_type = setting_types[(mod + setting) % 3]
+            mod_settings[setting_type][name] = {"value": value}
+    return mod_settings
+
+
+destination = io.BytesIO()
+encode_mod_settings(destination, generate_mod_settings(), (2, 0, 60))
+mod_settings_dat = destination.getvalue()
+
+
+def decode_stream(stream: io.BytesIO):
+    stream.read(9)  # Version and header flag
+
+    def read_string():
+        if struct.unpack("<?", stream.read(1))[0]:
+            return ""
+        length = struct.unpack("<B", stream.read(1))[0]
+        if length == 255:
+            length = struct.unpack("<I", stream.read(4))[0]
+        return stream.read(length).decode()
+
+    def read_node():
+        data_type = struct.unpack("<B", stream.read(1))[0]
+        stream.read(1)
+        if data_type == PropertyTreeType.NONE:
+            return None
+        elif data_type == PropertyTreeType.BOOL:
+            return bool(struct.unpack("<?", stream.read(1))[0])
+        elif data_type == PropertyTreeType.NUMBER:
+            return struct.unpack("<d", stream.read(8))[0]
+        elif data_type == PropertyTreeType.STRING:
+            return read_string()
+        elif data_type == PropertyTreeType.LIST:
+            length = struct.unpack("<I", stream.read(4))[0]
+            return [(read_string(), read_node())[1] for _ in range(length)]
+        elif data_type == PropertyTreeType.DICTIONARY:
+            length = struct.unpack("<I", stream.read(4))[0]
+            out = {}
+            for _ in range(length):
+                name = read_string()
+                out[name] = read_node()
+            return out
+        elif data_type == PropertyTreeType.SIGNED_INTEGER:
+            return struct.unpack("<q", stream.read(8))[0]
+        elif data_type == PropertyTreeType.UNSIGNED_INTEGER:
+            return struct.unpack("<Q", stream.read(8))[0]
+
+    return read_node()
+
+
+def main(method: str = "decode"):
+    if method == "stream":
+        return decode_stream(io.BytesIO(mod_settings_dat))
+    elif method == "decode":
+        return decode_mod_settings(io.BytesIO(mod_settings_dat))
+    else:
+        mod_settings = decode_mod_settings(mod_settings_dat)
+        encode_mod_settings(io.BytesIO(), mod_settings, (2, 0, 60))
+
+
+if __name__ == "__main__":
+    import time
+
+    assert main("stream") == main("decode")
+    for method in ("stream", "decode", "encode"):
+        start = time.perf_counter()
+        main(method)
+        print("{}: {:.3f}s".format(method, time.perf_counter() - start))
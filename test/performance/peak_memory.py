@@ -0,0 +1,36 @@
+# peak_memory.py
+
+"""
+Measures the peak memory allocated with ``tracemalloc`` while loading and
+re-exporting a blueprint string with 2,500 entities.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+import tracemalloc
+
+
+names = ("wooden-chest", "inserter", "transport-belt", "small-electric-pole")
+
+blueprint = Blueprint()
+for y in range(50):
+    for x in range(50):
+        blueprint.entities.append(names[(x + y) % len(names)], tile_position=(x, y))
+blueprint_string = blueprint.to_string()
+
+
+def main() -> int:
+    """
+    Returns the peak number of bytes allocated.
+    """
+    tracemalloc.start()
+    try:
+        Blueprint.from_string(blueprint_string).to_string()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    print("{:.1f} MiB".format(main() / 1024 / 1024))
@@ -0,0 +1,43 @@
+# prototype_properties.py
+
+"""
+Reads the prototype-derived properties of a large number of entities, which all
+share a handful of entity names.
+"""
+
+from draftsman import validators
+from draftsman.constants import ValidationMode
+from draftsman.entity import new_entity
+
+import copy
+
+
+names = (
+    "wooden-chest",
+    "assembling-machine-2",
+    "inserter",
+    "transport-belt",
+    "small-electric-pole",
+    "pipe",
+    "stone-furnace",
+    "pump",
+)
+
+with validators.set_mode(ValidationMode.DISABLED):
+    templates = [new_entity(name) for name in names]
+# Copying is much faster than constructing each entity from scratch
+entities = [copy.copy(templates[i % len(names)]) for i in range(100_000)]
+
+
+def main():
+    for entity in entities:
+        entity.type
+        entity.flags
+        entity.collision_mask
+        entity.tile_width
+        entity.tile_height
+        entity.surface_conditions
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# scaling.py
+
+"""
+Measures how the time and peak memory of each stage of working with a
+blueprint grow with the size of the blueprint, using the synthetic blueprints
+from :py:mod:`test.performance.generate`. The stages are:
+
+* ``construct``: building the blueprint with the generator
+* ``validate``: validating the blueprint strictly
+* ``query``: searching the blueprint by area, radius and name
+* ``transform``: rotating the blueprint a full turn
+* ``export``: encoding the blueprint as a blueprint string
+
+Transformations only apply to the top level of a blueprint, so that stage has
+nothing to do for the ``nested_groups`` blueprints.
+
+Run directly to sweep sizes from 1,000 up to 1,000,000 entities and print a
+CSV table of the results; a stage stops growing once it errors or exceeds
+``--max-seconds``, so the table shows where each blueprint kind falls over.
+Pass ``--json`` to save the results, and ``--plot`` to graph them (which
+requires ``matplotlib``).
+"""
+
+from draftsman.blueprintable import Blueprint
+from draftsman.constants import ValidationMode
+
+from test.performance.generate import generators
+
+import functools
+import time
+import tracemalloc
+from typing import Optional
+
+
+stages = ("construct", "validate", "query", "transform", "export")
+
+
+@functools.lru_cache(maxsize=1)
+def get_blueprint(kind: str, size: int, wire_density: float = 0.0) -> Blueprint:
+    """
+    Returns a generated blueprint, reusing the last one if the arguments are
+    the same so that each stage doesn't have to construct its own.
+    """
+    return generators[kind](size, wire_density)
+
+
+def run_stage(blueprint: Blueprint, stage: str):
+    if stage == "validate":
+        blueprint.validate(mode=ValidationMode.STRICT)
+    elif stage == "query":
+        box = blueprint.get_world_bounding_box()
+        if box is None:
+            return
+        width = box.bot_right[0] - box.top_left[0]
+        height = box.bot_right[1] - box.top_left[1]
+        for i in range(100):
+            x = box.top_left[0] + width * ((i * 7) % 100) / 100
+            y = box.top_left[1] + height * ((i * 13) % 100) / 100
+            blueprint.find_entities((x, y, x + 10, y + 10))
+            blueprint.find_entities_filtered(position=(x, y), radius=5)
+        blueprint.find_entities_filtered(type="inserter")
+    elif stage == "transform":
+        # A full turn returns the blueprint to its original state
+        for _ in range(4):
+            blueprint.rotate(4)
+    elif stage == "export":
+        blueprint.to_string()
+
+
+def main(
+    kind: str = "belt_grid",
+    size: int = 1000,
+    stage: str = "construct",
+    wire_density: float = 0.0,
+):
+    if stage == "construct":
+        return generators[kind](size, wire_density)
+    run_stage(get_blueprint(kind, size, wire_density), stage)
+
+
+def measure(
+    kind: str, size: int, stage: str, wire_density: float = 0.0, memory: bool = True
+) -> dict:
+    """
+    Runs a stage once to time it, and then again under ``tracemalloc`` to find
+    its peak memory (which is ``None`` if ``memory`` is false).
+    """
+    if stage != "construct":
+        get_blueprint(kind, size, wire_density)
+
+    start = time.perf_counter()
+    main(kind, size, stage, wire_density)
+    seconds = time.perf_counter() - start
+
+    peak: Optional[int] = None
+    if memory:
+        tracemalloc.start()
+        try:
+            main(kind, size, stage, wire_density)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "kind": kind,
+        "size": size,
+        "stage": stage,
+        "seconds": seconds,
+        "peak_bytes": peak,
+    }
+
+
+def plot(results: list[dict], filename: str):
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(2, len(stages), figsize=(4 * len(stages), 7))
+    for column, stage in enumerate(stages):
+        for kind in generators:
+            rows = [
+                row
+                for row in results
+                if row["kind"] == kind and row["stage"] == stage and "error" not in row
+            ]
+            sizes = [row["size"] for row in rows]
+            axes[0][column].plot(sizes, [row["seconds"] for row in rows], label=kind)
+            axes[1][column].plot(
+                sizes, [(row["peak_bytes"] or 0) / 2**20 for row in rows], label=kind
+            )
+        axes[0][column].set_title(stage)
+        for row in axes:
+            row[column].set_xscale("log")
+            row[column].set_yscale("log")
+            row[column].set_xlabel("size")
+    axes[0][0].set_ylabel("time (s)")
+    axes[1][0].set_ylabel("peak memory (MiB)")
+    axes[0][-1].legend()
+    fig.tight_layout()
+    fig.savefig(filename)
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import warnings
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--kinds", nargs="+", default=list(generators))
+    parser.add_argument("--stages", nargs="+", default=list(stages))
+    parser.add_argument("--wire-density", type=float, default=0.0)
+    parser.add_argument("--max-seconds", type=float, default=300.0)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--json", metavar="FILE")
+    parser.add_argument("--plot", metavar="FILE")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    results = []
+    print("kind,size,stage,seconds,peak_bytes")
+    for kind in args.kinds:
+        stopped = set()
+        for size in sorted(args.sizes):
+            for stage in args.stages:
+                if stage in stopped:
+                    continue
+                try:
+                    row = measure(
+                        kind, size, stage, args.wire_density, not args.no_memory
+                    )
+                except Exception as e:  # Including MemoryError
+                    row = {"kind": kind, "size": size, "stage": stage}
+                    row["error"] = "{}: {}".format(type(e).__name__, e)
+                    stopped.add(stage)
+                    print("{},{},{},error,{}".format(kind, size, stage, row["error"]))
+                else:
+                    if row["seconds"] > args.max_seconds:
+                        stopped.add(stage)
+                    print(
+                        "{kind},{size},{stage},{seconds:.4f},{peak_bytes}".format(**row)
+                    )
+                results.append(row)
+        get_blueprint.cache_clear()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4)
+    if args.plot:
+        plot(results, args.plot)
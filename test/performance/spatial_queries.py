@@ -0,0 +1,30 @@
+# spatial_queries.py
+
+"""
+Queries the spatial map of a blueprint with 10,000 entities by area, point and
+radius.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+
+names = ("wooden-chest", "inserter", "transport-belt", "small-electric-pole")
+
+blueprint = Blueprint()
+for y in range(100):
+    for x in range(100):
+        blueprint.entities.append(names[(x + y) % len(names)], tile_position=(x, y))
+
+
+def main():
+    for i in range(200):
+        x, y = (i * 7) % 90, (i * 13) % 90
+        blueprint.find_entities((x, y, x + 10, y + 10))
+        blueprint.find_entity_at_position((x + 0.5, y + 0.5))
+        blueprint.find_entities_filtered(
+            position=(x, y), radius=5, name="transport-belt"
+        )
+
+
+if __name__ == "__main__":
+    main()
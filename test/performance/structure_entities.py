@@ -0,0 +1,45 @@
+# structure_entities.py
+
+"""
+Structures a large list of entity dicts directly with the converter, without
+creating a parent blueprint. This isolates the per-entity structure hooks from
+the rest of the blueprint import process (spatial hashing, wire resolution,
+etc.)
+"""
+
+from draftsman.blueprintable import Blueprint
+from draftsman.entity import get_entity_class
+from draftsman.serialization import draftsman_converters
+
+import json
+
+
+names = (
+    "wooden-chest",
+    "assembling-machine-2",
+    "inserter",
+    "transport-belt",
+    "small-electric-pole",
+)
+
+blueprint = Blueprint()
+for i in range(10_000):
+    name = names[i % len(names)]
+    kwargs = {"recipe": "iron-gear-wheel"} if name == "assembling-machine-2" else {}
+    blueprint.entities.append(
+        name, tile_position=(4 * (i % 100), 4 * (i // 100)), **kwargs
+    )
+entities_json = json.dumps(blueprint.to_dict()["blueprint"]["entities"])
+entity_classes = [get_entity_class(name) for name in names]
+
+
+def main():
+    converter = draftsman_converters.get_version((2, 0)).get_converter()
+    # Structure hooks consume their input, so we need fresh dicts every run
+    entities = json.loads(entities_json)
+    for i, entity in enumerate(entities):
+        converter.structure(entity, entity_classes[i % len(names)])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,50 @@
 # test_performance.py
 
+"""
+Benchmarks for Draftsman, run with ``just benchmark`` (or ``pytest
+test/performance``). Each benchmark is implemented in its own module in this
+folder with a ``main()`` function, so that it can also be run (and profiled) on
+its own. Results can be written to JSON with ``--benchmark-json`` and compared
+between commits with ``--benchmark-compare``; see ``just benchmark-compare``.
+"""
+
 from draftsman import validators
 from draftsman.constants import ValidationMode
+from draftsman.warning import OverlappingObjectsWarning, UnknownElementWarning
 
 import pytest
+import warnings
+
+from test.performance.generate import generators
+from test.performance.import_time import modules
+from test.performance.scaling import stages
 
 validation_levels = (ValidationMode.DISABLED, ValidationMode.STRICT)
 
-# @pytest.mark.benchmark()
-# @pytest.mark.parametrize("validation_level", validation_levels)
-# def test_import_huge_blueprint(benchmark, validation_level):
-#     from test.performance.huge_blueprint_book import main
 
-#     # This blueprint book includes things that a vanilla environment won't recognize;
-#     # we intentionally ignore the warnings that they generate, as they're not
-#     # really pertinent
-#     # Ideally they would probably just be removed
-#     warnings.filterwarnings("ignore", category=OverlappingObjectsWarning)
-#     warnings.filterwarnings("ignore", category=UnknownElementWarning)
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("validation_level", list(ValidationMode))
+def test_import_huge_blueprint(benchmark, validation_level):
+    from test.performance.huge_blueprint_book import main
 
-#     with validators.set_mode(validation_level):
-#         book: BlueprintBook = benchmark(main)
+    # This blueprint book includes things that a vanilla environment won't recognize;
+    # we intentionally ignore the warnings that they generate, as they're not
+    # really pertinent
+    # Ideally they would probably just be removed
+    warnings.filterwarnings("ignore", category=OverlappingObjectsWarning)
+    warnings.filterwarnings("ignore", category=UnknownElementWarning)
+
+    with validators.set_mode(validation_level):
+        benchmark(main)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("validation_level", list(ValidationMode))
+def test_export_huge_blueprint(benchmark, validation_level):
+    from test.performance.huge_blueprint_book_export import main
+
+    with validators.set_mode(validation_level):
+        benchmark(main)
 
 
 @pytest.mark.benchmark()
@@ -57,3 +81,162 @@ def test_add_tiles(benchmark, validation_level):
 
     with validators.set_mode(validation_level):
         benchmark(main)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("validation_level", validation_levels)
+def test_load_string(benchmark, validation_level):
+    from test.performance.load_string import main
+
+    with validators.set_mode(validation_level):
+        benchmark(main)
+
+
+@pytest.mark.benchmark()
+def test_load_snapshot(benchmark):
+    from test.performance.load_snapshot import main
+
+    benchmark(main)
+
+
+@pytest.mark.benchmark()
+def test_canonicalize(benchmark):
+    from test.performance.canonicalize import main
+
+    benchmark(main)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("validation_level", validation_levels)
+def test_structure_entities(benchmark, validation_level):
+    from test.performance.structure_entities import main
+
+    with validators.set_mode(validation_level):
+        benchmark(main)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("cold", (True, False), ids=("cold", "warm"))
+def test_import_time(benchmark, cold):
+    from test.performance.import_time import main
+
+    benchmark(main, cold)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("module", modules)
+def test_cold_import(benchmark, module):
+    from test.performance.import_time import main
+
+    benchmark(main, True, module)
+
+
+@pytest.mark.benchmark()
+def test_prototype_properties(benchmark):
+    from test.performance.prototype_properties import main
+
+    benchmark(main)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("profile", ("minimal", "full"))
+def test_data_footprint(benchmark, profile):
+    from test.performance.data_footprint import main
+
+    benchmark.extra_info["max_rss_kib"] = benchmark(main, profile)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("validation_level", validation_levels)
+def test_to_string(benchmark, validation_level):
+    from test.performance.to_string import main
+
+    with validators.set_mode(validation_level):
+        benchmark(main)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("validation_level", validation_levels)
+def test_transform(benchmark, validation_level):
+    from test.performance.transform import main
+
+    with validators.set_mode(validation_level):
+        benchmark(main)
+
+
+@pytest.mark.benchmark()
+def test_spatial_queries(benchmark):
+    from test.performance.spatial_queries import main
+
+    benchmark(main)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("validation_level", validation_levels)
+def test_wire_export(benchmark, validation_level):
+    from test.performance.wire_export import main
+
+    with validators.set_mode(validation_level):
+        benchmark(main)
+
+
+@pytest.mark.benchmark()
+def test_peak_memory(benchmark):
+    from test.performance.peak_memory import main
+
+    # Tracing allocations is slow, and the peak doesn't vary between runs
+    peak = benchmark.pedantic(main, rounds=1, iterations=1)
+    benchmark.extra_info["peak_bytes"] = peak
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("stage", stages)
+@pytest.mark.parametrize("kind", list(generators))
+def test_scaling(benchmark, kind, stage):
+    from test.performance.scaling import get_blueprint, main
+
+    size = 1000
+    if stage != "construct":
+        get_blueprint(kind, size)
+    benchmark.extra_info["size"] = size
+    benchmark(main, kind, size, stage)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("method", ("per_category", "bulk"))
+def test_convert_data_raw(benchmark, method):
+    from test.performance.convert_data_raw import main
+
+    benchmark(main, method)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("method", ("probe", "indexed"))
+def test_archive_lookup(benchmark, method):
+    from test.performance.archive_lookup import main
+
+    benchmark(main, method)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("method", ("uncached", "parallel", "cached"))
+def test_mod_discovery(benchmark, method):
+    from test.performance.mod_discovery import main
+
+    benchmark(main, method)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("method", ("stream", "decode", "encode"))
+def test_mod_settings(benchmark, method):
+    from test.performance.mod_settings import main
+
+    benchmark(main, method)
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("method", ("fresh", "cached", "warm"))
+def test_environment_builds(benchmark, method):
+    from test.performance.environment_builds import main
+
+    benchmark(main, method)
@@ -0,0 +1,23 @@
+# to_string.py
+
+"""
+Exports a blueprint with 10,000 assorted entities to a blueprint string.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+
+names = ("wooden-chest", "inserter", "transport-belt", "small-electric-pole")
+
+blueprint = Blueprint()
+for y in range(100):
+    for x in range(100):
+        blueprint.entities.append(names[(x + y) % len(names)], tile_position=(x, y))
+
+
+def main():
+    return blueprint.to_string()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# transform.py
+
+"""
+Rotates and flips a blueprint with 2,500 entities, which has to move and
+re-hash every entity in the blueprint's spatial map for each transformation.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+
+names = ("wooden-chest", "inserter", "transport-belt", "small-electric-pole")
+
+blueprint = Blueprint()
+for y in range(50):
+    for x in range(50):
+        blueprint.entities.append(names[(x + y) % len(names)], tile_position=(x, y))
+
+
+def main():
+    # Each pair of transformations returns the blueprint to its original state
+    for _ in range(4):
+        blueprint.rotate(4)
+    blueprint.flip("horizontal")
+    blueprint.flip("horizontal")
+    blueprint.flip("vertical")
+    blueprint.flip("vertical")
+
+
+if __name__ == "__main__":
+    main()
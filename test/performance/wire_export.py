@@ -0,0 +1,44 @@
+# wire_export.py
+
+"""
+Exports a blueprint of 2,500 constant combinators, each connected to its
+neighbours with red and green wires, alongside 625 power poles which are
+connected to their neighbours with copper wire.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+
+blueprint = Blueprint()
+for y in range(50):
+    for x in range(50):
+        blueprint.entities.append(
+            "constant-combinator", id="c{}_{}".format(x, y), tile_position=(x, 2 * y)
+        )
+        if x > 0:
+            blueprint.add_circuit_connection(
+                "red", "c{}_{}".format(x - 1, y), "c{}_{}".format(x, y)
+            )
+        if y > 0:
+            blueprint.add_circuit_connection(
+                "green", "c{}_{}".format(x, y - 1), "c{}_{}".format(x, y)
+            )
+for y in range(25):
+    for x in range(25):
+        blueprint.entities.append(
+            "small-electric-pole",
+            id="p{}_{}".format(x, y),
+            tile_position=(60 + 2 * x, 4 * y),
+        )
+        if x > 0:
+            blueprint.add_power_connection(
+                "p{}_{}".format(x - 1, y), "p{}_{}".format(x, y)
+            )
+
+
+def main():
+    return blueprint.to_dict()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,11 @@ from draftsman.classes.collection import CollectionList
 from draftsman.classes.collision_set import CollisionSet
 from draftsman.classes.entity_like import EntityLike
 from draftsman.classes.entity_list import EntityList
-from draftsman.classes.exportable import ValidationResult
+from draftsman.classes.exportable import (
+    ValidationResult,
+    get_export_caching,
+    set_export_caching,
+)
 from draftsman.classes.group import Group
 from draftsman.classes.schedule import Schedule, WaitCondition
 from draftsman.classes.schedule_list import ScheduleList
@@ -36,6 +40,7 @@ from draftsman.error import (
     InvalidAssociationError,
     IncompleteSignalError,
     DuplicateIDError,
+    MalformedSnapshotError,
 )
 from draftsman.signatures import Color, Icon, StockConnection
 from draftsman.utils import AABB, encode_version, version_tuple_to_string
@@ -49,6 +54,8 @@ from draftsman.warning import (
     OverlappingObjectsWarning,
 )
 
+import gc
+import io
 import pytest
 
 
@@ -1239,6 +1246,207 @@ class TestBlueprint:
     #     blueprint["label"] = "testing"
     #     assert ("label" in blueprint["blueprint"]) == True
 
+    def test_to_dict_export_cache(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest", bar=10)
+        blueprint.entities.append("wooden-chest", tile_position=(1, 0))
+        group = Group(id="group")
+        group.entities.append("wooden-chest", tile_position=(0, 1))
+        blueprint.groups.append(group)
+
+        expected = blueprint.to_dict()
+        container_setattr = Container.__setattr__
+        with set_export_caching(True):
+            assert get_export_caching() is True
+            assert blueprint.to_dict() == expected
+            # Unchanged objects return the cached value
+            assert blueprint.to_dict() == expected
+            # Modifying the output does not modify the cache
+            result = blueprint.to_dict()
+            result["blueprint"]["entities"][0]["position"]["x"] = 100
+            assert blueprint.to_dict() == expected
+
+            # Setting an attribute invalidates the cache
+            blueprint.entities[0].bar = 5
+            assert blueprint.to_dict()["blueprint"]["entities"][0]["bar"] == 5
+            # Even if it bypasses the class's `__setattr__`
+            object.__setattr__(blueprint.entities[0], "bar", 6)
+            assert blueprint.to_dict()["blueprint"]["entities"][0]["bar"] == 6
+            # Which caching leaves untouched
+            assert Container.__setattr__ is container_setattr
+
+            # Changing parent position invalidates the cache
+            blueprint.groups["group"].position = (10, 10)
+            assert blueprint.to_dict()["blueprint"]["entities"][2]["position"] == {
+                "x": 10.5,
+                "y": 11.5,
+            }
+
+            # In-place modifications invalidate the cache
+            blueprint.entities[1].tags["key"] = "value"
+            assert blueprint.to_dict()["blueprint"]["entities"][1]["tags"] == {
+                "key": "value"
+            }
+
+            # Cache can be discarded manually
+            assert "_export_cache" in blueprint.entities[1].__dict__
+            blueprint.entities[1].mark_dirty()
+            assert "_export_cache" not in blueprint.entities[1].__dict__
+
+        assert get_export_caching() is False
+
+    def test_to_dict_export_cache_mutators(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("constant-combinator", id="combinator")
+        blueprint.entities.append("fast-inserter", tile_position=(2, 0), id="inserter")
+        blueprint.entities.append("wooden-chest", tile_position=(4, 0), id="chest")
+
+        def check_export():
+            with set_export_caching(False):
+                expected = blueprint.to_dict()
+            assert blueprint.to_dict() == expected
+
+        with set_export_caching(True):
+            check_export()
+
+            # Sections
+            combinator = blueprint.entities["combinator"]
+            combinator.add_section().set_signal(0, "signal-A", 5)
+            check_export()
+            combinator.sections[0].set_signal(1, "signal-B", 6)
+            check_export()
+            combinator.sections[0].filters[0].count = 10
+            check_export()
+            combinator.sections[0].active = False
+            check_export()
+
+            # Filters and conditions
+            inserter = blueprint.entities["inserter"]
+            inserter.set_item_filter(0, "iron-plate")
+            check_export()
+            inserter.set_circuit_condition(
+                {"name": "signal-A", "type": "virtual"}, ">", 5
+            )
+            check_export()
+            inserter.circuit_condition.constant = 10
+            check_export()
+
+            # Item requests
+            blueprint.entities["chest"].set_item_request("iron-plate", 10)
+            check_export()
+            blueprint.entities["chest"].set_item_request("iron-plate", 20)
+            check_export()
+
+            # Wires and entities
+            blueprint.add_circuit_connection("red", "combinator", "inserter")
+            check_export()
+            blueprint.entities.append("wooden-chest", tile_position=(6, 0))
+            check_export()
+
+    def test_to_dict_canonical(self):
+        def build(order):
+            blueprint = Blueprint()
+            for name, tile_position in order:
+                blueprint.entities.append(
+                    name, id=str(tile_position), tile_position=tile_position
+                )
+            blueprint.add_power_connection("(0, 0)", "(4, 0)")
+            blueprint.add_circuit_connection("red", "(2, 2)", "(0, 0)")
+            blueprint.entities["(2, 2)"].tags = {"b": 1, "a": 2}
+            return blueprint
+
+        order = [
+            ("small-electric-pole", (0, 0)),
+            ("wooden-chest", (2, 2)),
+            ("small-electric-pole", (4, 0)),
+        ]
+        blueprint_a = build(order)
+        blueprint_b = build(reversed(order))
+        assert blueprint_a.to_dict() != blueprint_b.to_dict()
+
+        result = blueprint_a.to_dict(canonical=True)
+        assert result == blueprint_b.to_dict(canonical=True)
+        assert [e["name"] for e in result["blueprint"]["entities"]] == [
+            "small-electric-pole",
+            "small-electric-pole",
+            "wooden-chest",
+        ]
+        assert result["blueprint"]["wires"] == [[1, 1, 3, 1], [1, 5, 2, 5]]
+        assert list(result["blueprint"]["entities"][2]["tags"]) == ["a", "b"]
+
+        assert blueprint_a.to_string(canonical=True) == blueprint_b.to_string(
+            canonical=True
+        )
+
+    def test_dump_load(self):
+        blueprint = Blueprint(label="snapshot")
+        blueprint.entities.append("wooden-chest", id="test container", bar=10)
+        blueprint.tiles.append("refined-concrete", position=(5, 5))
+
+        group = Group("powerlines")
+        group.entities.append("small-electric-pole")
+        group.entities.append("small-electric-pole", tile_position=(5, 0))
+        group.add_power_connection(0, 1)
+        group.position = (0, 1)
+        blueprint.groups.append(group)
+        blueprint.add_circuit_connection("green", "test container", ("powerlines", 0))
+
+        blueprint.entities.append("locomotive", position=(10, 10), id="loco")
+        schedule = Schedule()
+        schedule.add_locomotive(blueprint.entities["loco"])
+        blueprint.schedules.append(schedule)
+
+        fp = io.BytesIO()
+        blueprint.dump(fp)
+        fp.seek(0)
+        loaded = Blueprint.load(fp)
+
+        assert loaded is not blueprint
+        assert loaded.to_dict() == blueprint.to_dict()
+
+        # Parents are preserved
+        assert loaded.entities["test container"].parent is loaded
+        assert loaded.groups["powerlines"].parent is loaded
+        assert loaded.groups["powerlines"].entities[0].parent is loaded.groups[0]
+        assert loaded.groups["powerlines"].entities[0].global_position == Vector(
+            0.5, 1.5
+        )
+
+        # Associations point to the loaded entities
+        assert loaded.wires[0][0]() is loaded.entities["test container"]
+        assert loaded.wires[0][2]() is loaded.groups["powerlines"].entities[0]
+        assert loaded.groups["powerlines"].wires[0][0]() is (
+            loaded.groups["powerlines"].entities[0]
+        )
+        assert loaded.schedules[0].locomotives[0]() is loaded.entities["loco"]
+
+        # Spatial data is preserved
+        assert loaded.find_entities_filtered(position=(0.5, 0.5)) == [
+            loaded.entities["test container"]
+        ]
+        assert loaded.find_tiles_filtered(position=(5, 5)) == [loaded.tiles[0]]
+
+        # Type of the snapshot must match
+        fp.seek(0)
+        with pytest.raises(MalformedSnapshotError):
+            Group.load(fp)
+
+    def test_dump_load_dead_references(self):
+        blueprint = Blueprint()
+        # The furnace is copied into the blueprint, and the position of the copy
+        # keeps a weak reference to the original, which is dead once collected
+        blueprint.entities.append(new_entity("stone-furnace"))
+        gc.collect()
+
+        fp = io.BytesIO()
+        blueprint.dump(fp)
+        gc.collect()
+        fp.seek(0)
+        loaded = Blueprint.load(fp)
+
+        assert loaded.to_dict() == blueprint.to_dict()
+        assert loaded.entities[0].parent is loaded
+
     def test_deepcopy(self):
         blueprint = Blueprint()
 
@@ -3125,6 +3333,11 @@ class TestBlueprint:
         with pytest.raises(RotationError):
             blueprint.rotate(1)
 
+        # Directions wrap around after a full rotation
+        blueprint.rotate(12)
+        blueprint.rotate(4)
+        assert blueprint.entities[2].direction == Direction.EAST
+
     # =========================================================================
 
     def test_flip(self):
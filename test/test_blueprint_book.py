@@ -579,6 +579,41 @@ class TestBlueprintBook:
         # assert blueprint_book.blueprints is blueprint_book._root["blueprint_book"]["blueprints"]
         # assert blueprint_book.blueprints is blueprint_book["blueprint_book"]["blueprints"]
 
+    def test_to_string_parallel(self):
+        blueprint_book = BlueprintBook(label="parallel")
+        for i in range(8):
+            blueprint = Blueprint(label=str(i))
+            for x in range(10):
+                blueprint.entities.append("wooden-chest", tile_position=(x, i))
+            blueprint_book.blueprints.append(blueprint)
+        blueprint_book.blueprints.append(DeconstructionPlanner())
+        blueprint_book.blueprints.append(BlueprintBook())
+        blueprint_book.extra_keys = {"blueprint_book": {"custom": "data"}}
+
+        for level in (0, 1, 6, 9):
+            serial = string_to_JSON(blueprint_book.to_string(compression_level=level))
+            parallel = string_to_JSON(
+                blueprint_book.to_string(
+                    compression_level=level, parallel=True, max_workers=4
+                )
+            )
+            assert parallel == serial
+            assert list(parallel["blueprint_book"]) == list(serial["blueprint_book"])
+
+        # Empty book
+        empty_book = BlueprintBook()
+        assert string_to_JSON(empty_book.to_string(parallel=True)) == string_to_JSON(
+            empty_book.to_string()
+        )
+
+        # Canonical
+        serial = blueprint_book.to_string(canonical=True)
+        parallel = blueprint_book.to_string(canonical=True, parallel=True)
+        assert string_to_JSON(parallel) == string_to_JSON(serial)
+        assert list(string_to_JSON(parallel)["blueprint_book"]) == sorted(
+            string_to_JSON(serial)["blueprint_book"]
+        )
+
     def test_import_from_string(self):
         test_string = """0eNqVj+0KgjAYhe/l/T1hqaTuViJE3YuM1jvZhwRj996KNOhH1N/Dec5HhFEHXKwi34/GXEDEt+JAnCJInAw5b8PklaF+0QMR2ofRofeK5myjoDUD5fEK4gMoNoDBitZlBUTZHuqmK5v22PGK1ymjJPEGgicWISyzHST+0PRy/lVRpfPO70+L53cGQ568Yr+t+ZKX7knXakI="""
         blueprint_book = BlueprintBook.from_string(test_string)
@@ -1,11 +1,15 @@
 # test_blueprintable.py
 
 from draftsman.blueprintable import *
+from draftsman.blueprintable import StringCacheInfo
+from draftsman.constants import ValidationMode
 from draftsman.error import (
     MalformedBlueprintStringError,
     IncorrectBlueprintTypeError,
 )
 from draftsman.utils import JSON_to_string
+from draftsman import data, validators
+from draftsman.warning import UnknownKeywordWarning
 
 import pytest
 
@@ -268,3 +272,104 @@ class TestBlueprintUtils:
         example = {"incorrect": {}}
         with pytest.raises(IncorrectBlueprintTypeError):
             get_blueprintable_from_JSON(example)
+
+
+class TestStringCache:
+    def test_constructor(self):
+        cache = StringCache(maxsize=4)
+        assert cache.maxsize == 4
+        assert len(cache) == 0
+
+        with pytest.raises(ValueError):
+            StringCache(maxsize=0)
+
+    def test_load(self, monkeypatch):
+        cache = StringCache(maxsize=2)
+        string_a = Blueprint(label="A").to_string()
+        string_b = Blueprint(label="B").to_string()
+        string_c = Blueprint(label="C").to_string()
+
+        result = cache.load(string_a)
+        assert isinstance(result, Blueprint)
+        assert result.label == "A"
+        assert cache.info() == (0, 1, 0, 2, 1)
+
+        # Hits return a separate copy
+        result.label = "modified"
+        assert cache.load(string_a).label == "A"
+        assert cache.info() == (1, 1, 0, 2, 1)
+
+        # Least recently used entry is evicted
+        cache.load(string_b)
+        cache.load(string_a)
+        cache.load(string_c)
+        assert cache.info() == StringCacheInfo(
+            hits=2, misses=3, evictions=1, maxsize=2, currsize=2
+        )
+        cache.load(string_a)
+        assert cache.info().hits == 3
+        cache.load(string_b)
+        assert cache.info().misses == 4
+
+        # Requested type is part of the key
+        cache.clear()
+        cache.load(string_a)
+        assert isinstance(cache.load(string_a, Blueprint), Blueprint)
+        assert cache.info() == (0, 2, 0, 2, 2)
+        with pytest.raises(IncorrectBlueprintTypeError):
+            cache.load(string_a, BlueprintBook)
+
+        # Validation mode is part of the key
+        cache.clear()
+        with validators.set_mode(ValidationMode.STRICT):
+            cache.load(string_a)
+        with validators.set_mode(ValidationMode.DISABLED):
+            cache.load(string_a)
+        assert cache.info() == (0, 2, 0, 2, 2)
+
+        # Data profile is part of the key
+        cache.clear()
+        cache.load(string_a)
+        with monkeypatch.context() as context:
+            context.setattr(data, "get_profile", lambda: "some-profile")
+            cache.load(string_a)
+        assert cache.info() == (0, 2, 0, 2, 2)
+
+        # Failures are not cached
+        cache.clear()
+        with pytest.raises(MalformedBlueprintStringError):
+            cache.load("0lmaothisiswrong")
+        assert len(cache) == 0
+
+    def test_load_warnings(self):
+        cache = StringCache()
+        string = JSON_to_string(
+            {"blueprint": {"item": "blueprint", "unknown": "keyword"}}
+        )
+
+        with validators.set_mode(ValidationMode.STRICT):
+            with pytest.warns(UnknownKeywordWarning):
+                cache.load(string)
+            # Warnings are re-issued on hits
+            with pytest.warns(UnknownKeywordWarning):
+                cache.load(string)
+        assert cache.info().hits == 1
+
+    def test_enable_string_cache(self):
+        assert get_string_cache() is None
+        cache = enable_string_cache(maxsize=8)
+        try:
+            assert get_string_cache() is cache
+            string = Blueprint(label="cached").to_string()
+
+            first = get_blueprintable_from_string(string)
+            second = get_blueprintable_from_string(string)
+            third = Blueprint.from_string(string)
+            fourth = Blueprint.from_string(string)
+            assert first is not second
+            assert third is not fourth
+            assert first == second == third == fourth
+            assert cache.info() == (2, 2, 0, 8, 2)
+        finally:
+            disable_string_cache()
+        assert get_string_cache() is None
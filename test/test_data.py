@@ -1,10 +1,30 @@
 # test_data.py
 
-from draftsman.entity import Container, StorageTank
+from draftsman.blueprintable import Blueprint
+from draftsman.classes.mixins import DirectionalMixin
+from draftsman.constants import Direction
+from draftsman.entity import Container, Pump, StorageTank, new_entity
 from draftsman.tile import Tile
-from draftsman.data import entities, tiles
+from draftsman import data
+from draftsman.data import (
+    IndexedStore,
+    LazyData,
+    configure,
+    entities,
+    mods,
+    tiles,
+    write_indexed_store,
+)
+from draftsman.error import DataNotLoadedError
+from draftsman.environment.update import write_data_file
 
+import copy
+import os
+import pickle
 import pytest
+import subprocess
+import sys
+import types
 
 
 class TestEntitiesData:
@@ -63,6 +83,28 @@ class TestEntitiesData:
         del entities.raw["new-entity-2"]
         del entities.storage_tanks[-1]
 
+    def test_rotated_collision_sets(self):
+        # Precomputed collision sets match the ones the entity would compute
+        for name in ("inserter", "pump", "steam-engine"):
+            entity = new_entity(name)
+            assert entities.rotated_collision_sets[name] == (
+                DirectionalMixin._specify_collision_sets(entity)
+            )
+
+        # Entities added at runtime compute them instead
+        entities.add_entity(
+            name="new-entity-3",
+            type="pump",
+            collision_box=[[-0.4, -0.9], [0.4, 0.9]],
+        )
+        assert "new-entity-3" not in entities.rotated_collision_sets
+        pump = Pump("new-entity-3", direction=Direction.EAST)
+        assert pump.tile_width == 2
+        assert pump.tile_height == 1
+
+        del entities.raw["new-entity-3"]
+        del entities.pumps[-1]
+
 
 class TestModulesData:
     def test_add_modules(self):
@@ -74,3 +116,213 @@ class TestTilesData:
         tiles.add_tile("new-tile")
         # Test
         Tile("new-tile")
+
+
+class TestLazyData:
+    def test_load(self):
+        module = types.ModuleType("lazy_test_module")
+        sys.modules[module.__name__] = module
+        try:
+            lazy = LazyData(module.__name__, "tiles.pkl", default={})
+            module.raw = lazy.proxy()
+            module.names = lazy.proxy(derive=lambda raw: sorted(raw))
+            proxy = module.raw
+            assert not lazy.loaded
+
+            # Using the proxy loads the file and replaces the module attributes
+            assert "stone-path" in proxy
+            assert lazy.loaded
+            assert type(module.raw) is dict
+            assert type(module.names) is list
+            assert module.names == sorted(module.raw)
+
+            # The old proxy forwards everything to the loaded object
+            assert isinstance(proxy, dict)
+            assert len(proxy) == len(module.raw)
+            assert proxy == module.raw
+            assert proxy["stone-path"] is module.raw["stone-path"]
+            assert proxy.get("unknown") is None
+            assert copy.copy(proxy) == module.raw
+            assert pickle.loads(pickle.dumps(proxy)) == module.raw
+            proxy["new-tile"] = {"name": "new-tile"}
+            assert "new-tile" in module.raw
+        finally:
+            del sys.modules[module.__name__]
+
+    def test_missing_file(self):
+        lazy = LazyData("lazy_test_module", "missing.pkl", default=({"a": 1},))
+        raw = lazy.proxy(0)
+        assert raw == {"a": 1}
+        assert lazy.loaded
+
+    def test_missing_key(self):
+        lazy = LazyData("lazy_test_module", "missing.pkl", default={"a": 1})
+        new = lazy.proxy("b", missing=dict)
+        assert new == {}
+        with pytest.raises(KeyError):
+            len(lazy.proxy("c"))
+
+
+class TestConfigure:
+    def test_configure(self):
+        try:
+            configure(load={"tiles"})
+            lazy = LazyData("draftsman.data.entities", "entities.pkl", default={})
+            raw = lazy.proxy("raw")
+            with pytest.raises(DataNotLoadedError, match="'entities'"):
+                len(raw)
+            assert not lazy.loaded
+
+            lazy = LazyData("draftsman.data.tiles", "tiles.pkl", default={})
+            assert "stone-path" in lazy.proxy()
+
+            configure()
+            assert "wooden-chest" in raw
+        finally:
+            configure()
+
+    def test_unknown_category(self):
+        with pytest.raises(ValueError):
+            configure(load={"entities", "incorrect"})
+
+    def test_default_validation(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("assembling-machine-1", recipe="iron-gear-wheel")
+        blueprint.entities.append("fast-inserter", tile_position=(3, 0))
+        blueprint.entities[1].set_item_filter(0, "iron-plate")
+        blueprint.tiles.append("refined-concrete", position=(5, 5))
+        string = blueprint.to_string()
+
+        # Run in a new process, where no data has been loaded yet
+        worker = (
+            "from draftsman.blueprintable import get_blueprintable_from_string\n"
+            "from draftsman.error import DataNotLoadedError\n"
+            "try:\n"
+            "    print(get_blueprintable_from_string({!r}).to_string())\n"
+            "except DataNotLoadedError as e:\n"
+            "    print(type(e).__name__)\n"
+        ).format(string)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        def run(load):
+            env = dict(os.environ, DRAFTSMAN_DATA_LOAD=load, PYTHONPATH=root)
+            result = subprocess.run(
+                [sys.executable, "-c", worker],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            return result.stdout.strip()
+
+        # Checks which need recipes, items, or tiles are skipped
+        assert run("entities,signals") == string
+        # Entities are needed to decode entities
+        assert run("tiles") == "DataNotLoadedError"
+
+
+class TestProfiles:
+    @pytest.fixture
+    def profiles_path(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(data, "get_profiles_path", lambda: tmp_path)
+        # A profile with a single modded entity
+        entities_data = {
+            "raw": {"modded-chest": {"name": "modded-chest", "type": "container"}},
+            "of_type": {"container": ["modded-chest"]},
+            "flippable": {"modded-chest": True},
+            "collision_sets": {},
+        }
+        (tmp_path / "modded" / "data").mkdir(parents=True)
+        with open(tmp_path / "modded" / "data" / "entities.pkl", "wb") as out:
+            pickle.dump(entities_data, out)
+        with open(tmp_path / "modded" / "data" / "mods.pkl", "wb") as out:
+            pickle.dump({"base": (2, 0, 0, 0), "modded": (1, 0, 0)}, out)
+        (tmp_path / "not-a-profile").mkdir()
+        yield tmp_path
+        data.set_profile(None)
+
+    def test_list_profiles(self, profiles_path):
+        assert data.list_profiles() == ["modded"]
+        assert data.get_profile() is None
+
+    def test_set_profile(self, profiles_path):
+        original_raw = entities.raw
+        assert "wooden-chest" in entities.raw
+
+        data.set_profile("modded")
+        assert data.get_profile() == "modded"
+        assert list(entities.raw) == ["modded-chest"]
+        assert entities.containers == ["modded-chest"]
+        assert "modded" in mods.versions
+        modded_raw = entities.raw
+
+        # Previously loaded data is reused
+        data.set_profile(None)
+        assert entities.raw is original_raw
+        data.set_profile("modded")
+        assert entities.raw is modded_raw
+
+        with pytest.raises(ValueError, match="not-a-profile"):
+            data.set_profile("not-a-profile")
+
+    def test_use_profile(self, profiles_path):
+        with data.use_profile("modded"):
+            chest = Container("modded-chest")
+            assert chest.type == "container"
+        assert data.get_profile() is None
+        assert "modded-chest" not in entities.raw
+        assert Container("wooden-chest").type == "container"
+
+
+class TestIndexedStore:
+    def test_store(self, tmp_path):
+        path = str(tmp_path / "test.idx")
+        write_indexed_store(path, {"b": {"value": 1}, "a": [1, 2, 3], "c": None})
+
+        store = IndexedStore(path)
+        assert len(store) == 3
+        assert list(store) == ["b", "a", "c"]
+        assert "a" in store and "d" not in store
+        assert store["b"] == {"value": 1}
+        # Decoded values are cached, so in-place modification persists
+        assert store["b"] is store["b"]
+        assert store.get("d", "default") == "default"
+        with pytest.raises(KeyError):
+            store["d"]
+
+        # Modifications only exist in memory
+        store["d"] = 4
+        store["b"] = 5
+        del store["a"]
+        assert list(store) == ["b", "c", "d"]
+        assert store == {"b": 5, "c": None, "d": 4}
+        with pytest.raises(KeyError):
+            del store["a"]
+        assert IndexedStore(path) == {"b": {"value": 1}, "a": [1, 2, 3], "c": None}
+
+        # Copies are plain dicts
+        assert copy.deepcopy(store) == {"b": 5, "c": None, "d": 4}
+        assert type(pickle.loads(pickle.dumps(store))) is dict
+
+    def test_malformed(self, tmp_path):
+        path = tmp_path / "test.idx"
+        path.write_bytes(b"not an index")
+        with pytest.raises(ValueError):
+            IndexedStore(str(path))
+
+    def test_write_data_file(self, tmp_path):
+        (tmp_path / "data").mkdir()
+        data = {"raw": {"a": 1, "b": 2}, "other": [1]}
+
+        write_data_file(str(tmp_path), "test.pkl", data, ("raw",), indexed=True)
+        with open(tmp_path / "data" / "test.pkl", "rb") as inp:
+            assert pickle.load(inp) == {"raw": None, "other": [1]}
+        assert IndexedStore(str(tmp_path / "data" / "test.idx")) == {"a": 1, "b": 2}
+        # The original data is not modified
+        assert data["raw"] == {"a": 1, "b": 2}
+
+        # Stale index files are removed when writing regular data
+        write_data_file(str(tmp_path), "test.pkl", data, ("raw",), indexed=False)
+        with open(tmp_path / "data" / "test.pkl", "rb") as inp:
+            assert pickle.load(inp) == data
+        assert not (tmp_path / "data" / "test.idx").exists()
@@ -2,9 +2,10 @@
 
 from draftsman import DEFAULT_FACTORIO_VERSION
 from draftsman.blueprintable import *
+from draftsman.classes.entity import clear_prototype_info, get_prototype_info
 from draftsman.classes.vector import Vector
 from draftsman.constants import *
-from draftsman.data import mods
+from draftsman.data import entities, mods
 from draftsman.entity import *
 from draftsman.error import *
 from draftsman.warning import *
@@ -499,6 +500,44 @@ class TestEntityBase:
         belt = TransportBelt()
         assert belt.flippable == True
 
+    def test_prototype_info(self):
+        # Shared between all instances of the same name
+        info = get_prototype_info("wooden-chest")
+        assert get_prototype_info("wooden-chest") is info
+        assert info.prototype is entities.raw["wooden-chest"]
+        assert info.type == "container"
+        assert info.static_tile_width == 1
+        assert info.static_tile_height == 1
+        assert Container("wooden-chest").surface_conditions == (
+            entities.raw["wooden-chest"]["surface_conditions"]
+        )
+
+        # Unknown entities
+        unknown = get_prototype_info("unknown-entity")
+        assert unknown.prototype == {}
+        assert unknown.type is None
+        assert unknown.surface_conditions is None
+
+        # Recomputed when the entity is (re)added
+        entities.add_entity(
+            name="unknown-entity",
+            type="container",
+            collision_box=[[-0.9, -0.4], [0.9, 0.4]],
+        )
+        info = get_prototype_info("unknown-entity")
+        assert info is not unknown
+        assert info.type == "container"
+        assert info.static_tile_width == 2
+        assert info.static_tile_height == 1
+        assert Container("unknown-entity").tile_width == 2
+
+        del entities.raw["unknown-entity"]
+        del entities.containers[-1]
+        assert get_prototype_info("unknown-entity").type is None
+
+        clear_prototype_info()
+        assert get_prototype_info("wooden-chest") is not info
+
 
 # =============================================================================
 # Factory function new_entity()
@@ -747,6 +786,18 @@ class TestEntityFactory:
         assert e.position.x == 0.5 and e.position.y == 0.5
         assert e.extra_keys["bar"] == 5
 
+    def test_lazy_prototypes(self):
+        import draftsman.entity
+        import draftsman.prototypes.container
+
+        # Prototype classes are resolved from their modules on first access
+        assert draftsman.entity.Container is draftsman.prototypes.container.Container
+        assert get_entity_class("wooden-chest") is Container
+        assert get_entity_class("who knows") is Entity
+        assert "Container" in dir(draftsman.entity)
+        with pytest.raises(AttributeError):
+            draftsman.entity.NotAnEntity
+
     def test_unknown(self):
         # Try and treat as a generic entity
         with pytest.warns(UnknownEntityWarning):
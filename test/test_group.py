@@ -663,6 +663,16 @@ class TestGroup:
         assert bounding_box is None
         assert group.collision_set == CollisionSet([])
 
+        # Subgroup case
+        subgroup = Group("sub", position=(2, 2))
+        subgroup.entities.append("transport-belt", tile_position=(1, 1))
+        group.groups.append(subgroup, copy=False)
+        bounding_box = group.get_world_bounding_box()
+        assert round(abs(bounding_box.top_left[0] - 6.1), 7) == 0
+        assert round(abs(bounding_box.top_left[1] - 6.1), 7) == 0
+        assert round(abs(bounding_box.bot_right[0] - 6.9), 7) == 0
+        assert round(abs(bounding_box.bot_right[1] - 6.9), 7) == 0
+
     def test_get_dimensions(self):
         group = Group("test")
         assert group.get_dimensions() == (0, 0)
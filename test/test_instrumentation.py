@@ -0,0 +1,158 @@
+# test_instrumentation.py
+
+from draftsman import instrumentation, validators
+from draftsman.blueprintable import Blueprint
+from draftsman.classes.spatial_hashmap import SpatialHashMap
+from draftsman.constants import ValidationMode
+from draftsman.entity import Container
+from draftsman.instrumentation import Counter
+from draftsman.warning import OverlappingObjectsWarning
+
+import cattrs
+import copy
+import pytest
+import threading
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    with validators.set_mode(ValidationMode.STRICT):
+        yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_enable_disable(self):
+        original = SpatialHashMap.__dict__["add"]
+        assert not instrumentation.is_enabled()
+
+        instrumentation.enable()
+        assert instrumentation.is_enabled()
+        assert SpatialHashMap.__dict__["add"] is not original
+        # Enabling twice does nothing
+        instrumentation.enable()
+
+        instrumentation.disable()
+        assert not instrumentation.is_enabled()
+        assert SpatialHashMap.__dict__["add"] is original
+
+    def test_disabled(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        assert all(
+            counter == Counter() for counter in instrumentation.counters.values()
+        )
+
+    def test_counters(self):
+        instrumentation.enable()
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        blueprint.entities.append("wooden-chest", tile_position=(1, 0))
+        blueprint.find_entities((0, 0, 2, 1))
+        blueprint_string = blueprint.to_string()
+        Blueprint.from_string(blueprint_string)
+        copy.deepcopy(blueprint)
+        blueprint.entities.pop()
+
+        counters = instrumentation.get_counters()
+        assert counters["entity_constructions"].count == 4
+        assert counters["entity_constructions"].seconds > 0.0
+        assert counters["spatial_adds"].count >= 4
+        assert counters["spatial_removes"].count == 1
+        assert counters["spatial_queries"].count >= 2
+        assert counters["deepcopies"].count > 0
+        assert counters["validator_calls"].count > 0
+        assert counters["structure_calls"].count >= 1
+        assert counters["unstructure_calls"].count >= 1
+
+        # get_counters() returns a copy
+        counters["spatial_adds"].count = 0
+        assert instrumentation.counters["spatial_adds"].count >= 4
+
+        instrumentation.reset()
+        assert all(
+            counter == Counter() for counter in instrumentation.counters.values()
+        )
+
+    def test_overlap_checks(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        with instrumentation.snapshot() as stats:
+            with pytest.warns(OverlappingObjectsWarning):
+                blueprint.entities.append("iron-chest")
+        assert stats["overlap_checks"].count == 1
+
+    def test_snapshot(self):
+        with instrumentation.snapshot() as outer:
+            assert instrumentation.is_enabled()
+            Container("wooden-chest")
+            with instrumentation.snapshot() as inner:
+                Container("wooden-chest")
+            assert instrumentation.is_enabled()
+        assert not instrumentation.is_enabled()
+
+        assert inner["entity_constructions"].count == 1
+        assert outer["entity_constructions"].count == 2
+        assert set(outer) == set(instrumentation.names)
+
+        # Snapshots leave instrumentation enabled if it already was
+        instrumentation.enable()
+        with instrumentation.snapshot():
+            pass
+        assert instrumentation.is_enabled()
+
+    def test_snapshot_threads(self):
+        entered = threading.Event()
+        exited = threading.Event()
+        results = {}
+
+        def worker():
+            with instrumentation.snapshot() as stats:
+                Container("wooden-chest")
+                entered.set()
+                exited.wait()
+            results["worker"] = stats
+
+        thread = threading.Thread(target=worker)
+        with instrumentation.snapshot() as stats:
+            thread.start()
+            entered.wait()
+            exited.set()
+            thread.join()
+            # The other thread's snapshot exiting leaves this one's enabled
+            assert instrumentation.is_enabled()
+            Container("wooden-chest")
+            Container("wooden-chest")
+        assert not instrumentation.is_enabled()
+
+        # Each snapshot only counts the work of its own thread
+        assert results["worker"]["entity_constructions"].count == 1
+        assert stats["entity_constructions"].count == 2
+        assert instrumentation.counters["entity_constructions"].count == 3
+
+        # Disabling doesn't end an active snapshot
+        with instrumentation.snapshot():
+            instrumentation.enable()
+            instrumentation.disable()
+            assert instrumentation.is_enabled()
+        assert not instrumentation.is_enabled()
+
+    def test_converters(self):
+        base = next(c for c in cattrs.Converter.__mro__ if "structure" in c.__dict__)
+        original = base.__dict__["structure"]
+        other_converter = cattrs.Converter()
+
+        with instrumentation.snapshot() as stats:
+            # Only Draftsman's own converters are instrumented, not cattrs
+            assert base.__dict__["structure"] is original
+            assert type(other_converter) is cattrs.Converter
+            other_converter.structure({}, dict)
+            other_converter.unstructure({})
+        assert stats["structure_calls"].count == 0
+        assert stats["unstructure_calls"].count == 0
+
+        with instrumentation.snapshot() as stats:
+            Blueprint.from_string(Blueprint().to_string())
+        assert stats["structure_calls"].count >= 1
+        assert stats["unstructure_calls"].count >= 1
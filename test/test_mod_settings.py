@@ -0,0 +1,133 @@
+# test_mod_settings.py
+
+from draftsman.environment.mod_settings import (
+    PropertyTreeType,
+    decode_mod_settings,
+    decode_property_tree,
+    encode_mod_settings,
+    encode_property_tree,
+    read_mod_settings,
+    write_mod_settings,
+)
+
+import io
+import math
+import os
+import pytest
+import struct
+
+
+def encode(node) -> bytes:
+    out = bytearray()
+    encode_property_tree(node, out)
+    return bytes(out)
+
+
+class TestPropertyTree:
+    def test_encode_every_type(self):
+        assert encode(None) == b"\x00\x00"
+        assert encode(True) == b"\x01\x00\x01"
+        assert encode(False) == b"\x01\x00\x00"
+        assert encode(1.5) == b"\x02\x00" + struct.pack("<d", 1.5)
+        assert encode("abc") == b"\x03\x00\x00\x03abc"
+        assert encode("") == b"\x03\x00\x00\x00"
+        assert encode([True, None]) == (
+            b"\x04\x00\x02\x00\x00\x00" + b"\x00\x00\x01\x00\x01" + b"\x00\x00\x00\x00"
+        )
+        assert encode({"a": 1.0}) == (
+            b"\x05\x00\x01\x00\x00\x00\x00\x01a\x02\x00" + struct.pack("<d", 1.0)
+        )
+        assert encode(-2) == b"\x06\x00" + struct.pack("<q", -2)
+        assert encode(2**64 - 1) == b"\x07\x00" + struct.pack("<Q", 2**64 - 1)
+
+    def test_round_trip(self):
+        tree = {
+            "none": None,
+            "bool": True,
+            "number": -0.1,
+            "infinity": math.inf,
+            "string": "café 😀",
+            "empty string": "",
+            "long string": "x" * 1000,
+            "list": [1, "two", [3.0], {"four": False}, []],
+            "dictionary": {"nested": {"deeper": {}}},
+            "signed": -(2**63),
+            "unsigned": 2**63,
+        }
+        data = encode(tree)
+        value, offset = decode_property_tree(data)
+        assert value == tree
+        assert offset == len(data)
+        assert type(value["number"]) is float
+        assert type(value["signed"]) is int
+        assert encode(value) == data
+
+        # Nodes can be decoded from anywhere in a buffer
+        value, offset = decode_property_tree(b"junk" + data + b"junk", 4)
+        assert value == tree
+        assert offset == len(data) + 4
+
+    def test_decode_malformed(self):
+        with pytest.raises(ValueError, match="Unknown PropertyTreeType ID '8'"):
+            decode_property_tree(b"\x08\x00")
+        # Truncated
+        data = encode({"a": "some string"})
+        for end in range(len(data)):
+            with pytest.raises(ValueError):
+                decode_property_tree(data[:end])
+
+    def test_encode_unsupported(self):
+        with pytest.raises(TypeError, match="'tuple'"):
+            encode((1, 2))
+        with pytest.raises(ValueError, match="too large"):
+            encode(2**64)
+        with pytest.raises(ValueError, match="too large"):
+            encode(-(2**63) - 1)
+
+
+class TestModSettings:
+    def test_round_trip(self, tmp_path):
+        mod_settings = {
+            "startup": {"some-setting": {"value": 10}},
+            "runtime-global": {"some-color": {"value": {"r": 1.0, "g": 0.5}}},
+            "runtime-per-user": {"some-string": {"value": ""}},
+        }
+        write_mod_settings(str(tmp_path), mod_settings)
+        assert read_mod_settings(str(tmp_path)) == mod_settings
+
+        destination = io.BytesIO()
+        encode_mod_settings(destination, mod_settings, factorio_version=(2, 0, 60))
+        data = destination.getvalue()
+        # Version, followed by a 0 byte
+        assert data[:9] == struct.pack("<4H", 2, 0, 60, 0) + b"\x00"
+        assert data[9] == PropertyTreeType.DICTIONARY
+        assert decode_mod_settings(data) == mod_settings
+        assert decode_mod_settings(io.BytesIO(data)) == mod_settings
+
+    def test_factorio_file(self):
+        # Written by Factorio 2.0.60
+        path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            ".github",
+            "workflows",
+            "environments",
+            "issue_182",
+            "mod-settings.dat",
+        )
+        with open(path, "rb") as mod_settings_dat:
+            data = mod_settings_dat.read()
+        mod_settings = decode_mod_settings(data)
+        assert mod_settings["startup"]["loc-eqpm-grid-w"] == {"value": 2}
+        assert mod_settings["startup"]["sqt-blacklist-types"] == {"value": ""}
+        assert mod_settings["runtime-per-user"]["YARM-color-to"]["value"]["a"] == 1.0
+
+        destination = io.BytesIO()
+        encode_mod_settings(destination, mod_settings, factorio_version=(2, 0, 60))
+        assert destination.getvalue() == data
+
+    def test_malformed_header(self):
+        with pytest.raises(ValueError, match="too short"):
+            decode_mod_settings(b"\x02\x00")
+        with pytest.raises(ValueError, match="did not end with 0 byte"):
+            decode_mod_settings(struct.pack("<4H", 2, 0, 0, 0) + b"\x01\x00\x00")
@@ -2,6 +2,7 @@
 
 from draftsman.entity import Container
 
+import attrs
 import pytest
 
 import re
@@ -21,3 +22,65 @@ def test_get_version_DNE():
         ValueError, match=re.escape("No converter exists for version (0, 0)")
     ):
         Container().to_dict(version=(0, 0))
+
+
+def test_warmup(tmp_path):
+    from draftsman import serialization
+    from draftsman.classes.exportable import Exportable
+    from draftsman.blueprintable import Blueprint
+
+    classes = serialization._get_exportable_classes()
+    assert Container in classes
+    assert Blueprint in classes
+    assert all(issubclass(cls, Exportable) for cls in classes)
+    assert len(set(cls.__qualname__ for cls in classes)) == len(classes)
+
+    # Every class, one version at a time
+    serialization.warmup(versions=[(1, 0)], classes=classes)
+    serialization.warmup(versions=[(2, 0)])
+    assert Container("wooden-chest").to_dict() == {
+        "name": "wooden-chest",
+        "position": {"x": 0.5, "y": 0.5},
+    }
+
+    # Generated code is written to the cache directory
+    @attrs.define
+    class Example(Exportable):
+        value: int = 0
+
+    serialization.draftsman_converters.add_hook_fns(
+        Example, lambda fields: {"value": fields.value.name}
+    )
+
+    cache_dir = tmp_path / "cache"
+    serialization.warmup(versions=[(2, 0)], classes=[Example], cache_dir=cache_dir)
+    (cache_file,) = cache_dir.iterdir()
+    assert cache_file.name.startswith("converters-")
+    assert Example(value=10).to_dict() == {"value": 10}
+    assert serialization._code_cache is None
+
+    # Corrupted cache files are ignored and replaced
+    cache_file.write_bytes(b"garbage")
+    serialization.warmup(versions=[(2, 0)], classes=[Example], cache_dir=cache_dir)
+    assert cache_file.read_bytes() != b"garbage"
+    assert Example.from_dict({"value": 10}) == Example(value=10)
+
+
+def test_warmup_every_class():
+    from draftsman import serialization
+    from draftsman.entity import AssemblingMachine
+
+    # Builds the hooks of every class for every version
+    serialization.warmup()
+
+    # `RecipeMixin` maps `recipe_quality` differently between versions
+    machine = AssemblingMachine.from_dict(
+        {"name": "assembling-machine-1", "recipe": "iron-gear-wheel"},
+        version=(1, 0),
+    )
+    assert machine.recipe == "iron-gear-wheel"
+    assert machine.to_dict(version=(1, 0)) == {
+        "name": "assembling-machine-1",
+        "position": {"x": 1.5, "y": 1.5},
+        "recipe": "iron-gear-wheel",
+    }
@@ -1,6 +1,7 @@
 # test_spatial_hash_map.py
 
 from draftsman.classes.blueprint import Blueprint
+from draftsman.classes.group import Group
 from draftsman.classes.spatial_hashmap import SpatialHashMap
 from draftsman.entity import Container
 from draftsman.tile import Tile
@@ -190,3 +191,24 @@ class TestSpatialHashMap:
         assert results == [tile_to_add]
 
         assert blueprint.tiles.spatial_map.get_in_aabb(None) == []
+
+    def test_get_equal_entities_in_aabb(self):
+        # Entities in different groups with the same relative position compare
+        # equal, but are still distinct entities
+        blueprint = Blueprint()
+        outer = Group(id="outer")
+        for i in range(2):
+            inner = Group(id=str(i), position=(10 * i, 0))
+            inner.entities.append("wooden-chest")
+            outer.groups.append(inner, copy=False)
+        blueprint.groups.append(outer, copy=False)
+        first, second = (group.entities[0] for group in outer.groups)
+        assert first == second
+
+        results = blueprint.entities.spatial_map.get_in_aabb(
+            utils.AABB(-100, -100, 100, 100)
+        )
+        assert len(results) == 2
+        assert results[0] is first and results[1] is second
+        results = blueprint.entities.spatial_map.get_in_radius(100, (0, 0))
+        assert len(results) == 2
@@ -0,0 +1,755 @@
+# test_update.py
+
+from draftsman.environment import mod_list, update
+from draftsman.environment.chunk_cache import ChunkCache
+from draftsman.environment.mod_list import (
+    discover_mods,
+    read_mod_cache,
+    register_mod,
+)
+from draftsman.environment.profiling import LifecycleProfile
+from draftsman.environment.update import (
+    convert_table_bulk,
+    convert_table_to_dict,
+    execute_chunk,
+    get_data_raw,
+    get_update_fingerprint,
+    py_get_source_lines,
+    py_search_archive,
+)
+
+import copy
+import json
+import lupa.lua52 as lupa
+import math
+import os
+import pickle
+import pytest
+import types
+import zipfile
+
+
+@pytest.fixture
+def game_and_mods(tmp_path):
+    game_path = tmp_path / "game"
+    for name, version in (("core", "2.0.0"), ("base", "2.0.0")):
+        (game_path / name).mkdir(parents=True)
+        (game_path / name / "info.json").write_text(
+            json.dumps(
+                {"name": name, "version": version, "title": name, "author": "Wube"}
+            )
+        )
+    mods_path = tmp_path / "mods"
+    mods_path.mkdir()
+    with zipfile.ZipFile(mods_path / "some-mod_1.0.0.zip", "w") as archive:
+        archive.writestr(
+            "some-mod_1.0.0/info.json",
+            json.dumps(
+                {
+                    "name": "some-mod",
+                    "version": "1.0.0",
+                    "title": "Some Mod",
+                    "author": "Someone",
+                    "factorio_version": "2.0",
+                }
+            ),
+        )
+    return str(game_path), str(mods_path)
+
+
+class TestUpdateFingerprint:
+    def test_get_update_fingerprint(self, game_and_mods):
+        game_path, mods_path = game_and_mods
+        fingerprint = get_update_fingerprint(game_path, mods_path)
+        assert fingerprint["inputs"]["game_version"] == "2.0.0"
+        assert set(fingerprint["inputs"]["mods"]) == {"core", "base", "some-mod"}
+        assert fingerprint["inputs"]["mod_settings"] is None
+        # Deterministic
+        assert get_update_fingerprint(game_path, mods_path) == fingerprint
+
+        # Every input changes the fingerprint
+        def changed(**kwargs) -> bool:
+            new = get_update_fingerprint(game_path, mods_path, **kwargs)
+            return new["fingerprint"] != fingerprint["fingerprint"]
+
+        assert changed(owned_dlc=[])
+        assert changed(no_mods=True)
+        assert changed(indexed=True)
+
+        with open(os.path.join(mods_path, "mod-settings.dat"), "wb") as f:
+            f.write(b"settings")
+        assert changed()
+        os.remove(os.path.join(mods_path, "mod-settings.dat"))
+
+        archive_path = os.path.join(mods_path, "some-mod_1.0.0.zip")
+        with zipfile.ZipFile(archive_path, "a") as archive:
+            archive.writestr("some-mod_1.0.0/data.lua", "")
+        assert changed()
+
+    def test_skip_update(self, game_and_mods, tmp_path, monkeypatch):
+        game_path, mods_path = game_and_mods
+        monkeypatch.setattr(update, "get_profiles_path", lambda: str(tmp_path))
+
+        def run_data_lifecycle(**kwargs):
+            raise RuntimeError("lifecycle ran")
+
+        monkeypatch.setattr(update, "run_data_lifecycle", run_data_lifecycle)
+
+        # No fingerprint yet
+        assert update.read_update_fingerprint(str(tmp_path / "test")) is None
+        with pytest.raises(RuntimeError, match="lifecycle ran"):
+            update.update_draftsman_data(game_path, mods_path, data_profile="test")
+
+        # Matching fingerprint
+        fingerprint = get_update_fingerprint(game_path, mods_path)
+        os.makedirs(tmp_path / "test" / "data")
+        with open(tmp_path / "test" / "data" / "fingerprint.json", "w") as f:
+            json.dump(fingerprint, f)
+        assert (
+            update.update_draftsman_data(game_path, mods_path, data_profile="test")
+            is False
+        )
+
+        # Forced
+        with pytest.raises(RuntimeError, match="lifecycle ran"):
+            update.update_draftsman_data(
+                game_path, mods_path, data_profile="test", force=True
+            )
+
+        # Different inputs
+        with pytest.raises(RuntimeError, match="lifecycle ran"):
+            update.update_draftsman_data(
+                game_path, mods_path, owned_dlc=[], data_profile="test"
+            )
+
+
+class TestConvertTableBulk:
+    def test_matches_convert_table_to_dict(self):
+        lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+        table = lua.eval(
+            r"""{
+                list = {"a", "b", {1, 2, {}}},
+                sparse = {[1] = "a", [3] = "c"},
+                mixed = {1, 2, x = "y", [1.5] = "z", [true] = false},
+                numbers = {
+                    integer = -3, whole = 2.0, float = 0.1, big = 2^53,
+                    huge = 1e300, overflow = 2^63, tiny = 5e-324,
+                },
+                strings = {
+                    quote = '"quoted"', slash = "a\\b", newline = "a\nb",
+                    control = "\0\1\127", unicode = "café 😀",
+                },
+                empty = {},
+                ["key with spaces"] = true,
+                nested = {a = {b = {c = {d = "deep"}}}},
+            }"""
+        )
+        expected = convert_table_to_dict(table)
+        assert convert_table_bulk(lua, table) == expected
+        assert expected["mixed"] == {1: 1, 2: 2, "x": "y", 1.5: "z", True: False}
+        assert isinstance(expected["numbers"]["whole"], int)
+
+        # Non-finite numbers
+        result = convert_table_bulk(lua, lua.eval("{1/0, -1/0, 0/0}"))
+        assert result[:2] == [math.inf, -math.inf]
+        assert math.isnan(result[2])
+
+        # Functions are converted to None
+        assert convert_table_bulk(lua, lua.eval("{f = print}")) == {"f": None}
+
+    def test_shared_data_raw_is_not_modified(self, tmp_path):
+        data_raw = {
+            "item-group": {"group": {"name": "group", "order": "a"}},
+            "item-subgroup": {
+                "other": {"name": "other", "group": "group", "order": "a"}
+            },
+            "item": {"iron-plate": {"name": "iron-plate", "type": "item"}},
+            "tile": {
+                "stone-path": {
+                    "name": "stone-path",
+                    "collision_mask": {"layers": ["ground-tile"]},
+                }
+            },
+        }
+        # Item categories with no items
+        for category in (
+            "item-with-entity-data",
+            "tool",
+            "ammo",
+            "module",
+            "armor",
+            "gun",
+            "capsule",
+            "blueprint",
+            "blueprint-book",
+            "upgrade-item",
+            "deconstruction-item",
+            "spidertron-remote",
+            "repair-tool",
+            "rail-planner",
+            "copy-paste-tool",
+            "space-platform-starter-pack",
+        ):
+            data_raw[category] = []
+        original = copy.deepcopy(data_raw)
+
+        items, subgroups, groups = update.get_items(None, (2, 0), data_raw)
+        assert items["iron-plate"]["order"] == ""
+        assert list(groups["group"]["subgroups"]) == ["other"]
+
+        (tmp_path / "data").mkdir()
+        update.extract_tiles(None, str(tmp_path), data_raw=data_raw)
+        with open(tmp_path / "data" / "tiles.pkl", "rb") as f:
+            tiles = pickle.load(f)
+        assert tiles["stone-path"]["collision_mask"]["layers"] == {"ground-tile"}
+
+        assert data_raw == original
+
+
+class TestArchiveLookup:
+    @pytest.fixture
+    def archive_mod(self, tmp_path):
+        location = tmp_path / "some-mod_1.0.0.zip"
+        with zipfile.ZipFile(location, "w") as archive:
+            archive.writestr(
+                "some-mod_1.0.0/info.json",
+                json.dumps(
+                    {
+                        "name": "some-mod",
+                        "version": "1.0.0",
+                        "title": "Some Mod",
+                        "author": "Someone",
+                        "factorio_version": "2.0",
+                    }
+                ),
+            )
+            archive.writestr("some-mod_1.0.0/data.lua", "require('prototypes.entity')")
+            archive.writestr(
+                "some-mod_1.0.0/prototypes/entity.lua",
+                "\n".join("-- line {}".format(i) for i in range(1, 21)),
+            )
+            # Archives made on Windows sometimes use backslashes
+            archive.writestr("some-mod_1.0.0\\legacy\\util.lua", "return {}")
+        return register_mod("some-mod_1.0.0.zip", str(location))
+
+    def test_read_archive_file(self, archive_mod, monkeypatch):
+        assert archive_mod.get_file("data.lua") == "require('prototypes.entity')"
+        assert (
+            archive_mod.read_archive_file("some-mod_1.0.0/./prototypes//entity.lua")
+            == archive_mod.get_file("prototypes/entity.lua")
+        )
+        assert archive_mod.get_file("legacy/util.lua") == "return {}"
+        with pytest.raises(KeyError):
+            archive_mod.get_file("missing.lua")
+
+        # Each mod keeps its most recently decoded files
+        reads = []
+
+        def archive_to_string(archive, name):
+            reads.append(name)
+            return "contents"
+
+        monkeypatch.setattr(mod_list, "archive_to_string", archive_to_string)
+        monkeypatch.setattr(archive_mod, "archive_cache_size", 2)
+        archive_mod._archive_files.clear()
+        archive_mod.get_file("info.json")
+        archive_mod.get_file("prototypes/entity.lua")
+        archive_mod.get_file("info.json")
+        assert reads == [
+            "some-mod_1.0.0/info.json",
+            "some-mod_1.0.0/prototypes/entity.lua",
+        ]
+        # Least recently read file is evicted
+        archive_mod.get_file("legacy/util.lua")
+        archive_mod.get_file("info.json")
+        archive_mod.get_file("prototypes/entity.lua")
+        assert reads[2:] == [
+            "some-mod_1.0.0\\legacy\\util.lua",
+            "some-mod_1.0.0/prototypes/entity.lua",
+        ]
+
+    def test_py_search_archive(self, archive_mod):
+        package_path = "?.lua;__some-mod__/?.lua"
+        source, err = py_search_archive(archive_mod, "prototypes/entity", package_path)
+        assert source.startswith("-- line 1")
+        assert err is None
+
+        package_path = "?.lua;{}/?.lua".format(archive_mod.location)
+        source, err = py_search_archive(archive_mod, "legacy/util", package_path)
+        assert source == "return {}"
+
+        source, err = py_search_archive(archive_mod, "missing", package_path)
+        assert source is None
+        assert "no module 'missing' found in 'some-mod' archive" in err
+
+    def test_py_get_source_lines(self, archive_mod):
+        get_source_lines = py_get_source_lines({"some-mod": archive_mod})
+        source, err = get_source_lines("__some-mod__/prototypes/entity.lua", 10)
+        assert err is None
+        assert ">>>\t10: -- line 10" in source
+        assert " 5: -- line 5" in source
+        assert "-- line 4" not in source
+
+        filename = "{}/prototypes/entity.lua".format(archive_mod.location)
+        assert get_source_lines(filename, 10) == (source, None)
+
+        filename = "{}/missing.lua".format(archive_mod.location)
+        assert get_source_lines(filename, 1) == (None, "no file found in archive")
+
+
+class TestModCache:
+    def test_cache_hit(self, game_and_mods, tmp_path, monkeypatch):
+        game_path, mods_path = game_and_mods
+        cache_path = str(tmp_path / "cache" / "mod-cache.json")
+        mods = discover_mods(game_path, mods_path, cache_path=cache_path)
+        archive_path = os.path.abspath(os.path.join(mods_path, "some-mod_1.0.0.zip"))
+        entries = read_mod_cache(cache_path)
+        # Only archives are cached
+        assert list(entries) == [archive_path]
+        assert entries[archive_path]["folder"] == "some-mod_1.0.0"
+        assert entries[archive_path]["info"]["version"] == "1.0.0"
+
+        def read_archive_metadata(*args):
+            raise AssertionError("archive was read")
+
+        monkeypatch.setattr(mod_list, "read_archive_metadata", read_archive_metadata)
+        cached_mods = discover_mods(game_path, mods_path, cache_path=cache_path)
+        assert cached_mods.keys() == mods.keys()
+        cached_mod = cached_mods["some-mod"][0]
+        assert cached_mod.version == "1.0.0"
+        assert cached_mod.is_archive
+        assert cached_mod.archive_folder == "some-mod_1.0.0"
+        # The archive is opened when it is first needed
+        assert json.loads(cached_mod.get_file("info.json"))["name"] == "some-mod"
+
+    def test_invalidation(self, game_and_mods, tmp_path):
+        game_path, mods_path = game_and_mods
+        cache_path = str(tmp_path / "mod-cache.json")
+        discover_mods(game_path, mods_path, cache_path=cache_path)
+
+        archive_path = os.path.join(mods_path, "some-mod_1.0.0.zip")
+        with zipfile.ZipFile(archive_path, "a") as archive:
+            archive.writestr("some-mod_1.0.0/data.lua", "")
+        mods = discover_mods(game_path, mods_path, cache_path=cache_path)
+        assert mods["some-mod"][0].stages == {"data.lua"}
+        assert read_mod_cache(cache_path)[os.path.abspath(archive_path)]["stages"] == [
+            "data.lua"
+        ]
+
+        # Removed archives are removed from the cache
+        os.remove(archive_path)
+        mods = discover_mods(game_path, mods_path, cache_path=cache_path)
+        assert "some-mod" not in mods
+        assert read_mod_cache(cache_path) == {}
+
+    def test_replaced_by_non_zip(self, game_and_mods, tmp_path):
+        game_path, mods_path = game_and_mods
+        cache_path = str(tmp_path / "mod-cache.json")
+        discover_mods(game_path, mods_path, cache_path=cache_path)
+
+        # A cached archive which is overwritten by something else (like a
+        # partial download) is skipped, the same as without a cache
+        with open(os.path.join(mods_path, "some-mod_1.0.0.zip"), "wb") as file:
+            file.write(b"not a zip")
+        uncached = discover_mods(game_path, mods_path)
+        mods = discover_mods(game_path, mods_path, cache_path=cache_path)
+        assert mods.keys() == uncached.keys() == {"core", "base"}
+        assert read_mod_cache(cache_path) == {}
+
+    def test_unreadable_cache(self, game_and_mods, tmp_path):
+        game_path, mods_path = game_and_mods
+        cache_path = str(tmp_path / "mod-cache.json")
+        with open(cache_path, "w") as cache_file:
+            cache_file.write("not json")
+        assert read_mod_cache(cache_path) == {}
+        mods = discover_mods(game_path, mods_path, cache_path=cache_path)
+        assert mods["some-mod"][0].version == "1.0.0"
+        assert len(read_mod_cache(cache_path)) == 1
+
+        # Caches from other versions are discarded
+        with open(cache_path, "w") as cache_file:
+            json.dump({"version": 0, "mods": {}}, cache_file)
+        assert read_mod_cache(cache_path) == {}
+
+    def test_parallel(self, game_and_mods):
+        game_path, mods_path = game_and_mods
+        for i in range(10):
+            folder = "other-mod-{}_1.0.{}".format(i % 3, i)
+            with zipfile.ZipFile(
+                os.path.join(mods_path, folder + ".zip"), "w"
+            ) as archive:
+                archive.writestr(
+                    folder + "/info.json",
+                    json.dumps(
+                        {
+                            "name": "other-mod-{}".format(i % 3),
+                            "version": "1.0.{}".format(i),
+                            "title": "Other Mod",
+                            "author": "Someone",
+                            "factorio_version": "2.0",
+                        }
+                    ),
+                )
+
+        def versions(mods) -> dict:
+            return {name: [mod.version for mod in mods[name]] for name in mods}
+
+        sequential = versions(discover_mods(game_path, mods_path))
+        parallel = versions(
+            discover_mods(game_path, mods_path, parallel=True, max_workers=4)
+        )
+        assert parallel == sequential
+        assert parallel["other-mod-0"] == ["1.0.9", "1.0.6", "1.0.3", "1.0.0"]
+
+
+@pytest.fixture
+def loaded_lua():
+    """
+    A Lua instance with a minimal ``data.raw``, as if the data lifecycle had
+    just been run.
+    """
+    lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+    lua.execute(
+        """
+        mods = {base = "2.0.0"}
+        data = {raw = {}}
+        for _, category in ipairs({
+            "item-with-entity-data", "tool", "ammo", "module", "armor", "gun",
+            "capsule", "blueprint", "blueprint-book", "upgrade-item",
+            "deconstruction-item", "spidertron-remote", "repair-tool",
+            "rail-planner", "copy-paste-tool", "space-platform-starter-pack",
+            "equipment-grid", "fluid", "fuel-category",
+            "module-category", "recipe-category", "recipe",
+        }) do
+            data.raw[category] = {}
+        end
+        data.raw["item-group"] = {logistics = {name = "logistics", order = "a"}}
+        data.raw["item-subgroup"] = {
+            other = {name = "other", group = "logistics", order = "a"},
+            storage = {name = "storage", group = "logistics", order = "b"},
+        }
+        data.raw["item"] = {
+            ["wooden-chest"] = {
+                type = "item", name = "wooden-chest", subgroup = "storage",
+            },
+        }
+        data.raw["container"] = {
+            ["wooden-chest"] = {
+                type = "container", name = "wooden-chest",
+                collision_box = {{-0.35, -0.35}, {0.35, 0.35}},
+                minable = {result = "wooden-chest"},
+            },
+        }
+        data.raw["assembling-machine"] = {
+            ["assembling-machine-1"] = {
+                type = "assembling-machine", name = "assembling-machine-1",
+                collision_box = {{-1.2, -1.2}, {1.2, 1.2}},
+                crafting_categories = {},
+            },
+        }
+        data.raw["programmable-speaker"] = {
+            ["programmable-speaker"] = {
+                type = "programmable-speaker", name = "programmable-speaker",
+                instruments = {{name = "alarms", notes = {{name = "siren"}}}},
+            },
+        }
+        data.raw["logistic-container"] = {
+            ["passive-provider-chest"] = {
+                type = "logistic-container", name = "passive-provider-chest",
+                collision_box = {{-0.35, -0.35}, {0.35, 0.35}},
+                logistic_mode = "passive-provider",
+            },
+        }
+        data.raw["tile"] = {
+            concrete = {
+                type = "tile", name = "concrete",
+                collision_mask = {layers = {ground_tile = true}},
+            },
+        }
+        """
+    )
+    return lua
+
+
+class TestExtractData:
+    def test_parallel_matches_sequential(self, loaded_lua, tmp_path, capsys):
+        sequential_path = tmp_path / "sequential"
+        parallel_path = tmp_path / "parallel"
+        update.extract_data(loaded_lua, str(sequential_path), (2, 0), processes=1)
+        update.extract_data(
+            loaded_lua, str(parallel_path), (2, 0), verbose=True, processes=2
+        )
+
+        filenames = sorted(os.listdir(sequential_path / "data"))
+        assert "entities.pkl" in filenames
+        assert filenames == sorted(os.listdir(parallel_path / "data"))
+        for filename in filenames:
+            with open(sequential_path / "data" / filename, "rb") as f:
+                sequential = pickle.load(f)
+            with open(parallel_path / "data" / filename, "rb") as f:
+                parallel = pickle.load(f)
+            assert repr(sequential) == repr(parallel)
+
+        # No temporary files are left behind
+        assert os.listdir(parallel_path) == ["data"]
+
+        output = capsys.readouterr().out
+        assert "Extraction timings:" in output
+        for name in update.extractors:
+            assert "    {}:".format(name) in output
+
+    def test_failed_extraction(self, loaded_lua, tmp_path, monkeypatch):
+        update.extract_data(loaded_lua, str(tmp_path), (2, 0), processes=1)
+        with open(tmp_path / "data" / "entities.pkl", "rb") as f:
+            original = f.read()
+
+        def extract_tiles(*args, **kwargs):
+            raise RuntimeError("extraction failed")
+
+        monkeypatch.setattr(update, "extract_tiles", extract_tiles)
+        loaded_lua.execute('data.raw["container"]["wooden-chest"].max_health = 1')
+        with pytest.raises(RuntimeError, match="extraction failed"):
+            update.extract_data(loaded_lua, str(tmp_path), (2, 0), processes=1)
+
+        # Nothing was replaced, even though entities were extracted first
+        with open(tmp_path / "data" / "entities.pkl", "rb") as f:
+            assert f.read() == original
+        assert os.listdir(tmp_path) == ["data"]
+
+    def test_stale_index_files_are_removed(self, loaded_lua, tmp_path):
+        update.extract_data(
+            loaded_lua, str(tmp_path), (2, 0), indexed=True, processes=1
+        )
+        assert os.path.exists(tmp_path / "data" / "entities.idx")
+
+        update.extract_data(loaded_lua, str(tmp_path), (2, 0), processes=1)
+        assert not os.path.exists(tmp_path / "data" / "entities.idx")
+        with open(tmp_path / "data" / "entities.pkl", "rb") as f:
+            assert "wooden-chest" in pickle.load(f)["raw"]
+
+    def test_interrupted_move_removes_fingerprint(
+        self, loaded_lua, tmp_path, monkeypatch
+    ):
+        os.makedirs(tmp_path / "data")
+        with open(tmp_path / "data" / "fingerprint.json", "w") as f:
+            json.dump({"fingerprint": "previous"}, f)
+
+        replace = os.replace
+        moved = []
+
+        def interrupted_replace(source, destination):
+            # Interrupt the move into `data` after the first file
+            if os.path.dirname(destination) == str(tmp_path / "data"):
+                if moved:
+                    raise KeyboardInterrupt
+                moved.append(destination)
+            replace(source, destination)
+
+        monkeypatch.setattr(update.os, "replace", interrupted_replace)
+        with pytest.raises(KeyboardInterrupt):
+            update.extract_data(loaded_lua, str(tmp_path), (2, 0), processes=1)
+        monkeypatch.undo()
+
+        assert len(moved) == 1
+        assert update.read_update_fingerprint(str(tmp_path)) is None
+
+
+class TestLifecycleProfile:
+    def test_run_data_stage(self, monkeypatch):
+        lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+        lua.execute(
+            """
+            function lua_set_path() end
+            function lua_unload_cache() end
+            function lua_stage_reset() end
+            """
+        )
+
+        def run_mod_phase(lua, mod, stage, chunk_cache=None):
+            # `big-mod` allocates a large table in its data stage
+            if mod.name == "big-mod" and stage == "data.lua":
+                lua.execute("big = {} for i = 1, 100000 do big[i] = {i} end")
+
+        monkeypatch.setattr(update, "run_mod_phase", run_mod_phase)
+        load_order = [
+            types.SimpleNamespace(name="small-mod", stages={"data.lua"}),
+            types.SimpleNamespace(
+                name="big-mod", stages={"data.lua", "data-final-fixes.lua"}
+            ),
+        ]
+        profile = LifecycleProfile()
+        update.run_data_stage(lua, load_order, "", profile=profile)
+
+        assert [(stage.mod, stage.stage) for stage in profile.stages] == [
+            ("small-mod", "data.lua"),
+            ("big-mod", "data.lua"),
+            ("big-mod", "data-final-fixes.lua"),
+        ]
+        big_stage = profile.stages[1]
+        assert big_stage.seconds > 0.0
+        assert big_stage.memory_change > 1000
+        assert big_stage.memory > profile.stages[0].memory + 1000
+        assert list(profile.get_mod_totals()) == ["big-mod", "small-mod"]
+
+        # Nothing is recorded without a profile
+        update.run_data_stage(lua, load_order, "")
+        assert len(profile.stages) == 3
+
+    def test_extract_data(self, loaded_lua, tmp_path):
+        profile = LifecycleProfile()
+        update.extract_data(
+            loaded_lua, str(tmp_path), (2, 0), processes=1, profile=profile
+        )
+        assert set(update.extractors) < set(profile.extraction)
+        assert "data.raw" in profile.extraction
+
+    def test_report(self):
+        profile = LifecycleProfile()
+        lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+        stages = (("a", "data.lua"), ("b", "data.lua"), ("a", "data-updates.lua"))
+        for name, stage in stages:
+            with profile.measure(lua, name, stage):
+                pass
+        profile.stages[1].seconds = 2.0
+        profile.extraction = {"entities": 1.0, "items": 3.0}
+
+        report = profile.report()
+        lines = report.splitlines()
+        assert lines[0] == "Slowest mod stages:"
+        # Slowest first
+        assert "b  data.lua" in lines[2]
+        assert lines.index("Slowest mods:") == 5
+        assert lines[6].endswith("s  b")
+        assert lines[9] == "       3.000s  items"
+        assert lines[-1].startswith("Total: 2.")
+        # Limited
+        assert len(profile.report(limit=1).splitlines()) == len(lines) - 3
+
+        data = json.loads(json.dumps(profile.to_dict()))
+        assert [stage["mod"] for stage in data["stages"]] == ["a", "b", "a"]
+        assert set(data["stages"][0]) == {
+            "mod",
+            "stage",
+            "seconds",
+            "memory",
+            "memory_change",
+        }
+        assert list(data["mods"]) == ["b", "a"]
+        assert data["extraction"] == {"entities": 1.0, "items": 3.0}
+
+
+@pytest.fixture
+def lifecycle_environment(game_and_mods):
+    """
+    A minimal ``core`` and ``base`` which can actually be loaded, alongside the
+    zipped mod from ``game_and_mods`` which now adds a setting and a prototype.
+    """
+    game_path, mods_path = game_and_mods
+    lualib_path = os.path.join(game_path, "core", "lualib")
+    os.makedirs(lualib_path)
+    with open(os.path.join(lualib_path, "util.lua"), "w") as util_file:
+        util_file.write("util = {}")
+    with open(os.path.join(lualib_path, "dataloader.lua"), "w") as dataloader_file:
+        dataloader_file.write(
+            """
+            data = {raw = {}}
+            function data:extend(prototypes)
+                for _, prototype in ipairs(prototypes) do
+                    self.raw[prototype.type] = self.raw[prototype.type] or {}
+                    self.raw[prototype.type][prototype.name] = prototype
+                end
+            end
+            """
+        )
+    os.makedirs(os.path.join(game_path, "base", "prototypes"))
+    with open(os.path.join(game_path, "base", "data.lua"), "w") as data_file:
+        data_file.write('require("prototypes.chest")')
+    with open(
+        os.path.join(game_path, "base", "prototypes", "chest.lua"), "w"
+    ) as chest_file:
+        chest_file.write(
+            """
+            data:extend({{
+                type = "container",
+                name = "wooden-chest",
+                source = debug.getinfo(1, "S").source,
+            }})
+            """
+        )
+    with zipfile.ZipFile(os.path.join(mods_path, "some-mod_1.0.0.zip"), "a") as archive:
+        archive.writestr(
+            "some-mod_1.0.0/settings.lua",
+            'data:extend({{type = "int-setting", name = "size", setting_type = '
+            '"startup", default_value = 16}})',
+        )
+        archive.writestr("some-mod_1.0.0/data.lua", 'require("prototypes.chest")')
+        archive.writestr(
+            "some-mod_1.0.0/prototypes/chest.lua",
+            """
+            data:extend({{
+                type = "container",
+                name = "big-chest",
+                inventory_size = settings.startup["size"].value,
+                source = debug.getinfo(1, "S").source,
+            }})
+            """,
+        )
+    return game_path, mods_path
+
+
+class TestChunkCache:
+    def test_compile(self):
+        cache = ChunkCache()
+        bytecode = cache.compile("return ...", "some-chunk")
+        assert isinstance(bytecode, bytes)
+        assert cache.compile("return ...", "some-chunk") is bytecode
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+        # Either a different name or different source is a different chunk
+        assert cache.compile("return ...", "other-chunk") is not bytecode
+        assert cache.compile("return 1", "some-chunk") is not bytecode
+        assert (cache.hits, cache.misses, len(cache)) == (1, 3, 3)
+
+        # Syntax errors are left for Lua to report
+        assert cache.compile("return return", "broken") is None
+        assert len(cache) == 3
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_execute_chunk(self):
+        cache = ChunkCache()
+        lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+        source = 'return debug.getinfo(1, "S").source'
+        assert execute_chunk(lua, source, "some-chunk") == "some-chunk"
+        assert execute_chunk(lua, source, "some-chunk", chunk_cache=cache) == (
+            "some-chunk"
+        )
+        # Bytecode is shared between runtimes
+        other_lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+        assert execute_chunk(other_lua, source, "some-chunk", cache) == "some-chunk"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # Errors are the same as if the chunk was never cached
+        for chunk_cache in (None, cache):
+            with pytest.raises(lupa.LuaError, match='some-chunk"]:1: nope'):
+                execute_chunk(lua, 'error("nope")', "some-chunk", chunk_cache)
+            with pytest.raises(lupa.LuaSyntaxError, match="some-chunk"):
+                execute_chunk(lua, "return return", "some-chunk", chunk_cache)
+
+    def test_run_data_lifecycle(self, lifecycle_environment):
+        game_path, mods_path = lifecycle_environment
+        expected = get_data_raw(update.run_data_lifecycle(game_path, mods_path))
+        assert expected["container"]["big-chest"]["inventory_size"] == 16
+
+        cache = ChunkCache()
+        lua = update.run_data_lifecycle(game_path, mods_path, chunk_cache=cache)
+        assert get_data_raw(lua) == expected
+        misses = cache.misses
+        assert misses > 0
+
+        # Every file is loaded from the cache by a later run
+        lua = update.run_data_lifecycle(game_path, mods_path, chunk_cache=cache)
+        assert get_data_raw(lua) == expected
+        assert cache.misses == misses
+        assert cache.hits >= misses
@@ -4,9 +4,11 @@ from collections import OrderedDict
 from draftsman import utils
 from draftsman.classes.vector import Vector
 from draftsman.constants import Direction, Orientation, Ticks, ValidationMode
-from draftsman.error import InvalidSignalError
+from draftsman.error import InvalidSignalError, MalformedSnapshotError
 from draftsman.data import signals
 
+import io
+import json
 import pytest
 import warnings
 
@@ -236,6 +238,188 @@ class TestUtils:
             == "0eNplyEEKgCAURdG9vLFE2sytRMiPzCQx+Fog0t6ThjW6h1tBPPvMxMUslMlIaCm+U0Grrv/tAXpEyuyjKxCvnLPceOTNcsIksPpIIRToit224KJwWtz3AzZ8Kjs="
         )
 
+    def test_JSON_to_string_compression_level(self):
+        test_dict = {"blueprint": {"item": "blueprint", "label": "a" * 100}}
+        fast = utils.JSON_to_string(test_dict, compression_level=1)
+        best = utils.JSON_to_string(test_dict, compression_level=9)
+        none = utils.JSON_to_string(test_dict, compression_level=0)
+        assert utils.string_to_JSON(fast) == test_dict
+        assert utils.string_to_JSON(best) == test_dict
+        assert utils.string_to_JSON(none) == test_dict
+        assert len(none) > len(best)
+
+    def test_deflated_chunks_to_string(self):
+        test_dict = {"arbitrary_data": list(range(100)), "finally": {"key": "value"}}
+        data = json.dumps(test_dict, separators=(",", ":")).encode("utf-8")
+        chunks = [data[:10], data[10:150], data[150:]]
+
+        for level in (0, 1, 6, 9):
+            deflated_chunks = [
+                utils.deflate_chunk(chunks[0], level),
+                utils.deflate_chunk(chunks[1], level),
+                utils.deflate_chunk(chunks[2], level, final=True),
+            ]
+            string = utils.deflated_chunks_to_string(chunks, deflated_chunks, level)
+            assert utils.string_to_JSON(string) == test_dict
+
+    def test_canonicalize_JSON(self):
+        test_dict = {
+            "blueprint": {
+                "item": "blueprint",
+                "entities": [
+                    {
+                        "entity_number": 1,
+                        "name": "wooden-chest",
+                        "position": {"x": 0.5, "y": 0.5},
+                    },
+                    {
+                        "position": {"y": 1.0, "x": 1.0},
+                        "name": "locomotive",
+                        "entity_number": 2,
+                    },
+                    {
+                        "entity_number": 3,
+                        "name": "small-electric-pole",
+                        "position": {"x": 5.5, "y": 0.5},
+                    },
+                    {
+                        "entity_number": 4,
+                        "name": "small-electric-pole",
+                        "position": {"x": 2.5, "y": 0.5},
+                    },
+                ],
+                "tiles": [
+                    {"name": "stone-path", "position": {"x": 1, "y": 0}},
+                    {"name": "stone-path", "position": {"x": 0, "y": 0}},
+                    {"name": "concrete", "position": {"x": 5, "y": 5}},
+                ],
+                "wires": [[3, 5, 4, 5], [4, 5, 3, 5], [1, 1, 3, 1]],
+                "schedules": [{"locomotives": [2], "schedule": {}}],
+                "stock_connections": [{"stock": 2}],
+            }
+        }
+        assert utils.canonicalize_JSON(test_dict) == {
+            "blueprint": {
+                "entities": [
+                    {
+                        "entity_number": 1,
+                        "name": "locomotive",
+                        "position": {"x": 1.0, "y": 1.0},
+                    },
+                    {
+                        "entity_number": 2,
+                        "name": "small-electric-pole",
+                        "position": {"x": 2.5, "y": 0.5},
+                    },
+                    {
+                        "entity_number": 3,
+                        "name": "small-electric-pole",
+                        "position": {"x": 5.5, "y": 0.5},
+                    },
+                    {
+                        "entity_number": 4,
+                        "name": "wooden-chest",
+                        "position": {"x": 0.5, "y": 0.5},
+                    },
+                ],
+                "item": "blueprint",
+                "schedules": [{"locomotives": [1], "schedule": {}}],
+                "stock_connections": [{"stock": 1}],
+                "tiles": [
+                    {"name": "concrete", "position": {"x": 5, "y": 5}},
+                    {"name": "stone-path", "position": {"x": 0, "y": 0}},
+                    {"name": "stone-path", "position": {"x": 1, "y": 0}},
+                ],
+                "wires": [[2, 5, 3, 5], [3, 1, 4, 1]],
+            }
+        }
+
+        # Co-located entities are ordered the same regardless of the order
+        # they were inserted in, and references to them follow the new order
+        entities = {
+            "rail": {"name": "straight-rail", "direction": 4},
+            "other_rail": {"name": "straight-rail"},
+            "rare_chest": {"name": "wooden-chest", "quality": "rare"},
+            "chest_b": {"name": "wooden-chest", "tags": {"b": 1}},
+            "chest_a": {"name": "wooden-chest", "tags": {"a": 1}},
+        }
+        results = []
+        for order in (list(entities), list(reversed(entities))):
+            numbers = {key: i + 1 for i, key in enumerate(order)}
+            blueprint = {
+                "entities": [
+                    {
+                        "entity_number": numbers[key],
+                        "position": {"x": 1, "y": 1},
+                        **entities[key],
+                    }
+                    for key in order
+                ],
+                "wires": [
+                    [numbers["rail"], 1, numbers["chest_a"], 1],
+                    [numbers["rare_chest"], 2, numbers["other_rail"], 2],
+                ],
+                "stock_connections": [{"stock": numbers["rail"]}],
+            }
+            results.append(utils.canonicalize_JSON({"blueprint": blueprint}))
+        assert results[0] == results[1]
+        blueprint = results[0]["blueprint"]
+        assert [
+            (e["entity_number"], e.get("direction"), e.get("quality"), e.get("tags"))
+            for e in blueprint["entities"]
+        ] == [
+            (1, None, None, None),
+            (2, 4, None, None),
+            (3, None, None, {"a": 1}),
+            (4, None, None, {"b": 1}),
+            (5, None, "rare", None),
+        ]
+        assert blueprint["wires"] == [[1, 2, 5, 2], [2, 1, 3, 1]]
+        assert blueprint["stock_connections"] == [{"stock": 2}]
+
+        # Keys are sorted recursively
+        result = utils.canonicalize_JSON(
+            {"upgrade_planner": {"settings": {"b": 1, "a": 2}, "item": "x"}}
+        )
+        assert list(result["upgrade_planner"]) == ["item", "settings"]
+        assert list(result["upgrade_planner"]["settings"]) == ["a", "b"]
+
+        # Blueprints inside of books keep their order
+        book = {
+            "blueprint_book": {
+                "blueprints": [
+                    {"index": 1, "blueprint": {"label": "second"}},
+                    {"index": 0, "blueprint": {"label": "first"}},
+                ]
+            }
+        }
+        result = utils.canonicalize_JSON(book, sort_keys=False)
+        assert result is book
+        assert result["blueprint_book"]["blueprints"][0]["index"] == 1
+
+    def test_snapshot(self):
+        fp = io.BytesIO()
+        utils.dump_snapshot({"some": ["data"]}, fp)
+        assert fp.getvalue().startswith(utils.SNAPSHOT_MAGIC)
+        fp.seek(0)
+        assert utils.load_snapshot(fp) == {"some": ["data"]}
+
+        # Not a snapshot
+        with pytest.raises(MalformedSnapshotError):
+            utils.load_snapshot(io.BytesIO(b"short"))
+        with pytest.raises(MalformedSnapshotError):
+            utils.load_snapshot(io.BytesIO(b"not a snapshot at all"))
+
+        # Truncated data
+        with pytest.raises(MalformedSnapshotError):
+            utils.load_snapshot(io.BytesIO(fp.getvalue()[:-4]))
+
+        # Wrong format version
+        data = bytearray(fp.getvalue())
+        data[len(utils.SNAPSHOT_MAGIC)] += 1
+        with pytest.raises(MalformedSnapshotError):
+            utils.load_snapshot(io.BytesIO(bytes(data)))
+
     def test_encode_version(self):
         assert utils.encode_version(1, 1, 50, 1) == 281479274954753
 